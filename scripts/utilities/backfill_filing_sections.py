@@ -11,6 +11,7 @@ Then inserts the extracted sections into filing_sections table.
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -124,9 +125,9 @@ def extract_and_store_sections(
     logger.info(f"Processing {ticker} ({acc})")
     logger.info(f"  Current sections: {filing['current_sections']}/23")
     
-    # Get full markdown
+    # Get full markdown and any section offsets stored by an earlier run
     result = db.connection.execute(
-        "SELECT full_markdown FROM filings WHERE accession_number = ?",
+        "SELECT full_markdown, section_offsets FROM filings WHERE accession_number = ?",
         [acc]
     ).fetchone()
     
@@ -135,6 +136,10 @@ def extract_and_store_sections(
         return {'error': 'no_markdown'}
     
     full_markdown = result[0]
+    stored_offsets = result[1]
+    if isinstance(stored_offsets, str):
+        stored_offsets = json.loads(stored_offsets)
+    section_offsets = dict(stored_offsets or {})
     
     # Get existing sections
     existing = get_existing_sections(db, acc)
@@ -149,6 +154,10 @@ def extract_and_store_sections(
     }
     
     sections_to_insert = []
+    # Regex hits are kept as (start, end) offsets; DuckDB slices them out of
+    # full_markdown on insert, so section text is not sent back to the database
+    regex_ranges = []
+    regex_missing = []
     
     for item in ALL_ITEMS:
         if item in existing:
@@ -156,32 +165,72 @@ def extract_and_store_sections(
             continue
         
         # Try regex first
-        section_text = regex_extractor.extract_section(full_markdown, item)
+        section_range = regex_extractor.extract_section_range(full_markdown, item)
         
-        if section_text:
+        if section_range:
+            start, end = section_range
             stats['regex_success'] += 1
-            sections_to_insert.append((item, section_text, 'regex'))
-            logger.debug(f"  ✓ {item}: {len(section_text)} chars (regex)")
+            regex_ranges.append((item, start, end))
+            logger.debug(f"  ✓ {item}: {end - start} chars (regex)")
             continue
         
-        # Try LLM if available
-        if llm_finder:
-            try:
-                section_text = llm_finder.find_section(full_markdown, item)
-                if section_text:
-                    stats['llm_success'] += 1
-                    sections_to_insert.append((item, section_text, 'llm'))
-                    logger.info(f"  ✓ {item}: {len(section_text)} chars (LLM)")
-                    continue
-            except Exception as e:
-                logger.warning(f"  LLM failed for {item}: {e}")
+        regex_missing.append(item)
+    
+    # Try LLM if available (one call covers every item regex missed)
+    llm_found = {}
+    if llm_finder and regex_missing:
+        try:
+            llm_found = llm_finder.find_sections(full_markdown, regex_missing)
+        except Exception as e:
+            logger.warning(f"  LLM failed for {', '.join(regex_missing)}: {e}")
+    
+    for item in regex_missing:
+        section_text = llm_found.get(item)
+        if section_text:
+            stats['llm_success'] += 1
+            sections_to_insert.append((item, section_text, 'llm'))
+            logger.info(f"  ✓ {item}: {len(section_text)} chars (LLM)")
+            continue
         
         stats['failed'] += 1
         logger.debug(f"  ✗ {item}: Not found")
     
+    # Regex outcomes per item, read back by SectionRetriever's Tier 2 so it
+    # can slice full_markdown instead of rescanning (None = regex missed)
+    section_offsets.update({item: [start, end] for item, start, end in regex_ranges})
+    section_offsets.update({item: None for item in regex_missing})
+    if not dry_run and (regex_ranges or regex_missing):
+        db.connection.execute(
+            "UPDATE filings SET section_offsets = ? WHERE accession_number = ?",
+            [json.dumps(section_offsets), acc]
+        )
+    
     # Insert into database
-    if not dry_run and sections_to_insert:
-        logger.info(f"  Inserting {len(sections_to_insert)} sections into database...")
+    total_new = len(regex_ranges) + len(sections_to_insert)
+    if not dry_run and total_new:
+        logger.info(f"  Inserting {total_new} sections into database...")
+        
+        for item, start, end in regex_ranges:
+            # Get next ID from sequence
+            next_id = db.connection.execute(
+                "SELECT nextval('filing_sections_id_seq')"
+            ).fetchone()[0]
+            
+            # Counted like the LLM path below: DuckDB's \s splits differ
+            # from str.split() on edge and Unicode whitespace
+            word_count = len(full_markdown[start:end].split())
+            
+            # substr is 1-based and counts characters, like Python slicing
+            db.connection.execute(
+                """
+                INSERT INTO filing_sections 
+                (id, accession_number, item, item_title, markdown, word_count)
+                SELECT ?, accession_number, ?, '', substr(full_markdown, ?, ?), ?
+                FROM filings
+                WHERE accession_number = ?
+                """,
+                [next_id, item, start + 1, end - start, word_count, acc]
+            )
         
         for item, markdown, source in sections_to_insert:
             # Get next ID from sequence
@@ -200,7 +249,7 @@ def extract_and_store_sections(
                 [next_id, acc, item, '', markdown, word_count]
             )
         
-        logger.info(f"  ✓ Inserted {len(sections_to_insert)} sections")
+        logger.info(f"  ✓ Inserted {total_new} sections")
     
     logger.info(f"  Results: {stats['regex_success']} regex, {stats['llm_success']} LLM, "
                 f"{stats['failed']} failed, {stats['skipped']} skipped")
@@ -13,12 +13,12 @@ class FinLoomError(Exception):
     def __init__(self, message: str, context: Optional[dict] = None):
         self.message = message
         self.context = context or {}
+        # Format once; errors on retry paths get stringified repeatedly
+        self._formatted = f"{message} | Context: {self.context}" if self.context else message
         super().__init__(message)
 
     def __str__(self) -> str:
-        if self.context:
-            return f"{self.message} | Context: {self.context}"
-        return self.message
+        return self._formatted
 
 
 # Ingestion Errors
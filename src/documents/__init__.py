@@ -4,9 +4,19 @@ Data processing and transformation layer.
 This module provides:
 - UnstructuredDataPipeline: Orchestrates HTML-to-Markdown extraction for SEC filings
 - ProcessingResult: Result container for pipeline operations
+
+Exports are resolved lazily (PEP 562) so duckdb and sec2md are only
+imported when the pipeline is actually used.
 """
 
-from .document_processor import ProcessingResult, UnstructuredDataPipeline
+from src.infrastructure.lazy_imports import make_lazy_getattr
+
+_LAZY_IMPORTS = {
+    "UnstructuredDataPipeline": "src.documents.document_processor",
+    "ProcessingResult": "src.documents.document_processor",
+}
+
+__getattr__ = make_lazy_getattr(_LAZY_IMPORTS, globals())
 
 __all__ = [
     "UnstructuredDataPipeline",
@@ -323,9 +323,10 @@ class UnstructuredDataPipeline:
                     error_message="Already processed (use force=True to reprocess)"
                 )
             
-            # Reset processing flag
+            # Reset processing flag; section offsets point into the old markdown
             conn.execute(
-                "UPDATE filings SET sections_processed = FALSE, full_markdown = NULL WHERE accession_number = ?",
+                "UPDATE filings SET sections_processed = FALSE, full_markdown = NULL, "
+                "section_offsets = NULL WHERE accession_number = ?",
                 [accession_number]
             )
             conn.close()
@@ -382,6 +383,7 @@ class UnstructuredDataPipeline:
                 SET sections_processed = TRUE,
                     full_markdown = ?,
                     markdown_word_count = ?,
+                    section_offsets = NULL,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE accession_number = ?
             """, [full_markdown, markdown_word_count, accession_number])
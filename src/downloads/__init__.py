@@ -1,6 +1,13 @@
 """SEC data ingestion module."""
 
-from .sec_api import SECApi
-from .downloader import SECDownloader
+from src.infrastructure.lazy_imports import make_lazy_getattr
+
+# Resolved lazily (PEP 562) so requests/urllib3 load only when used
+_LAZY_IMPORTS = {
+    "SECApi": "src.downloads.sec_api",
+    "SECDownloader": "src.downloads.downloader",
+}
+
+__getattr__ = make_lazy_getattr(_LAZY_IMPORTS, globals())
 
 __all__ = ["SECApi", "SECDownloader"]
@@ -6,7 +6,7 @@ Provides Neo4j integration with:
 - Client wrapper for database operations
 - Graph construction and XBRL import
 - Community detection (Leiden) and summarization
-- Type-safe models using Pydantic
+- Typed node and relationship models (slotted dataclasses)
 """
 
 from src.graph.graph_connector import Neo4jClient
@@ -7,16 +7,24 @@ Usage:
     python -m src.graph --pilot            # Pilot mode (20 files)
     python -m src.graph --limit 50         # Custom limit
     python -m src.graph --workers 1        # Sequential mode
+    python -m src.graph --batch-size 20    # Files per worker task
+    python -m src.graph --csv-out DIR      # Write neo4j-admin import CSVs
 """
 
 from __future__ import annotations
 
 import argparse
+import multiprocessing as mp
+import os
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
 from pathlib import Path
 
-from src.graph.graph_builder import GraphBuilder
+from src.graph.csv_builder import CSVGraphBuilder
+from src.graph.graph_builder import GraphBuilder, bootstrap_indexes
 from src.graph.graph_connector import Neo4jClient
 from src.graph.xbrl_importer import XBRLImporter
 from src.storage.database import Database
@@ -26,6 +34,25 @@ from src.infrastructure.logger import get_logger, setup_logging
 setup_logging()
 logger = get_logger("finloom.graph.cli")
 
+# Neo4j client and builder options shared by every batch a worker process runs
+_worker_client: Neo4jClient | None = None
+_worker_person_embeddings = False
+
+
+def _init_worker(pool_size: int, person_embeddings: bool = False) -> None:
+    """
+    Open the worker's Neo4j client once, when the pool starts the process.
+
+    Args:
+        pool_size: Driver connection pool size for this worker
+        person_embeddings: Enable embedding-based Person dedup
+    """
+    global _worker_client, _worker_person_embeddings
+    _worker_client = Neo4jClient(max_connection_pool_size=pool_size)
+    _worker_person_embeddings = person_embeddings
+    # Pool workers leave through multiprocessing's exit hooks, not atexit
+    Finalize(_worker_client, Neo4jClient.shutdown_all, exitpriority=10)
+
 
 def process_file_batch(batch: list[Path], batch_id: int) -> dict:
     """
@@ -36,19 +63,40 @@ def process_file_batch(batch: list[Path], batch_id: int) -> dict:
         batch_id: Worker ID for logging
 
     Returns:
-        Statistics dictionary
+        Statistics dictionary (empty if the worker failed)
     """
-    # Each worker gets its own Neo4j client
-    neo4j = Neo4jClient()
-    builder = GraphBuilder(neo4j, batch_size=1000)
+    try:
+        # Each worker reuses the client opened by _init_worker
+        builder = GraphBuilder(_worker_client, person_embeddings=_worker_person_embeddings)
 
-    logger.info(f"Worker {batch_id}: Processing {len(batch)} files")
+        logger.info(f"Worker {batch_id}: Processing {len(batch)} files")
 
-    stats = builder.build_from_filings(batch)
+        start = time.perf_counter()
+        stats = builder.build_from_filings(batch)
+        elapsed = time.perf_counter() - start
 
-    neo4j.close()
+        logger.info(
+            f"Worker {batch_id}: {len(batch)} files in {elapsed:.1f}s "
+            f"({len(batch) / elapsed if elapsed else 0:.2f} files/s)"
+        )
+        return stats
+    except Exception as e:
+        # Caught here so one failed batch does not abort executor.map
+        logger.error(f"Worker {batch_id} failed: {e}")
+        return {}
 
-    return stats
+
+def _pool_context() -> mp.context.BaseContext:
+    """
+    Pick the start method for build workers.
+
+    forkserver starts workers from a clean server process, so they do not
+    inherit the parent's open Neo4j driver sockets; platforms without it
+    use their default.
+    """
+    if "forkserver" in mp.get_all_start_methods():
+        return mp.get_context("forkserver")
+    return mp.get_context()
 
 
 def verify_graph(client: Neo4jClient) -> dict:
@@ -60,6 +108,38 @@ def verify_graph(client: Neo4jClient) -> dict:
     """
     logger.info("Verifying graph statistics...")
 
+    try:
+        # Store counters: constant time, no graph scan
+        meta = client.execute_query(
+            "CALL apoc.meta.stats() "
+            "YIELD labels, relTypesCount, nodeCount, relCount RETURN *"
+        )[0]
+    except Exception as e:
+        logger.info(f"apoc.meta.stats unavailable ({e}), counting by scan")
+        return _scan_graph_stats(client)
+
+    return {
+        "total_nodes": meta["nodeCount"],
+        "total_relationships": meta["relCount"],
+        "by_label": _by_count(meta["labels"]),
+        "by_relationship": _by_count(meta["relTypesCount"]),
+    }
+
+
+def _by_count(counts: dict[str, int]) -> dict[str, int]:
+    """Order a name -> count mapping by descending count."""
+    return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+
+def _scan_graph_stats(client: Neo4jClient) -> dict:
+    """
+    Count nodes and relationships with full graph scans.
+
+    Fallback for verify_graph when APOC is not installed.
+
+    Returns:
+        Dictionary with graph stats
+    """
     try:
         stats = {}
 
@@ -74,16 +154,16 @@ def verify_graph(client: Neo4jClient) -> dict:
         RETURN labels(n)[0] as label, count(n) as count
         ORDER BY count DESC
         """
-        label_counts = client.execute_query(labels_query)
-        stats["by_label"] = {r["label"]: r["count"] for r in label_counts}
+        with client.iter_query(labels_query) as label_counts:
+            stats["by_label"] = {r["label"]: r["count"] for r in label_counts}
 
         rel_query = """
         MATCH ()-[r]->()
         RETURN type(r) as rel_type, count(r) as count
         ORDER BY count DESC
         """
-        rel_counts = client.execute_query(rel_query)
-        stats["by_relationship"] = {r["rel_type"]: r["count"] for r in rel_counts}
+        with client.iter_query(rel_query) as rel_counts:
+            stats["by_relationship"] = {r["rel_type"]: r["count"] for r in rel_counts}
 
         return stats
 
@@ -120,8 +200,31 @@ def main() -> int:
     parser.add_argument(
         "--workers",
         type=int,
-        default=4,
-        help="Number of parallel workers (default: 4)",
+        default=min(4, os.cpu_count() or 1),
+        help="Number of parallel workers (default: min(4, CPU count))",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Files per worker task (default: about 4 tasks per worker, at least 10)",
+    )
+    parser.add_argument(
+        "--person-embeddings",
+        action="store_true",
+        help="Deduplicate people by name embedding against a Neo4j vector "
+        "index (requires: pip install .[person-dedup])",
+    )
+    parser.add_argument(
+        "--xbrl-import-dir",
+        type=Path,
+        help="Local path of Neo4j's import directory; large XBRL imports "
+        "are written there as CSV and loaded with LOAD CSV",
+    )
+    parser.add_argument(
+        "--csv-out",
+        type=Path,
+        help="Write neo4j-admin import CSVs to this directory instead of "
+        "building online (load with: make graph-import)",
     )
 
     args = parser.parse_args()
@@ -130,25 +233,14 @@ def main() -> int:
     logger.info("KNOWLEDGE GRAPH CONSTRUCTION")
     logger.info("=" * 70)
 
-    # Initialize clients
-    logger.info("Connecting to Neo4j...")
-    neo4j = Neo4jClient()
-
-    if not neo4j.verify_connection():
-        logger.error("Cannot connect to Neo4j")
-        logger.error("Ensure Neo4j is running: make neo4j-up")
-        return 1
-
-    logger.info("Neo4j connection verified")
-
-    logger.info("Connecting to DuckDB...")
-    db_path = root / "data" / "database" / "finloom.dev.duckdb"
-    duckdb = Database(db_path=str(db_path), read_only=True)
-    logger.info("DuckDB connection verified")
-
     # Get entity files
     entity_dir = root / "data" / "extracted_entities"
-    all_files = sorted(entity_dir.glob("*.json"))
+    with os.scandir(entity_dir) as entries:
+        all_files = [
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda entry: entry.name)
+            if entry.name.endswith(".json")
+        ]
 
     # Determine file limit
     if args.pilot:
@@ -167,44 +259,74 @@ def main() -> int:
     logger.info(f"Processing {len(entity_files)} files")
     logger.info("")
 
+    if args.csv_out:
+        # Offline build: no Neo4j connection, single process so one entity
+        # cache deduplicates across every filing
+        logger.info(f"Writing import CSVs to {args.csv_out}...")
+        stats = CSVGraphBuilder(args.csv_out).build_from_filings(entity_files)
+        logger.info(f"CSV export complete: {stats}")
+        logger.info("Load into an empty database with: make graph-import")
+        return 0
+
+    # Initialize clients
+    logger.info("Connecting to Neo4j...")
+    neo4j = Neo4jClient()
+
+    if not neo4j.verify_connection():
+        logger.error("Cannot connect to Neo4j")
+        logger.error("Ensure Neo4j is running: make neo4j-up")
+        return 1
+
+    logger.info("Neo4j connection verified")
+
+    # Constraints first, so no builder MERGE or MATCH falls back to a scan
+    logger.info("Creating constraints and indexes...")
+    bootstrap_indexes(neo4j)
+
+    logger.info("Connecting to DuckDB...")
+    db_path = root / "data" / "database" / "finloom.dev.duckdb"
+    duckdb = Database(db_path=str(db_path), read_only=True)
+    logger.info("DuckDB connection verified")
+
     # Build graph from entities
     if args.workers > 1:
         logger.info(f"Building graph with {args.workers} parallel workers...")
 
-        batch_size = len(entity_files) // args.workers
-        if batch_size == 0:
-            batch_size = 1
-
-        batches = []
-        for i in range(0, len(entity_files), batch_size):
-            batch = entity_files[i : i + batch_size]
-            batches.append((batch, len(batches)))
-
-        combined_stats = {
-            "files_processed": 0,
-            "nodes_created": 0,
-            "relationships_created": 0,
-            "duplicates_merged": 0,
-        }
-
-        with ProcessPoolExecutor(max_workers=args.workers) as executor:
-            futures = [
-                executor.submit(process_file_batch, batch, batch_id)
-                for batch, batch_id in batches
-            ]
-
-            for future in as_completed(futures):
-                try:
-                    stats = future.result()
-                    for key in combined_stats:
-                        combined_stats[key] += stats.get(key, 0)
-                except Exception as e:
-                    logger.error(f"Worker failed: {e}")
+        # Several small batches per worker balance the pool and keep each
+        # batch's entity cache (and its fuzzy dedup cost) small
+        batch_size = args.batch_size or max(10, len(entity_files) // (args.workers * 4))
+
+        batches = [
+            entity_files[i : i + batch_size]
+            for i in range(0, len(entity_files), batch_size)
+        ]
+        chunksize = max(1, len(batches) // (args.workers * 4))
+
+        combined_stats = Counter(
+            files_processed=0,
+            nodes_created=0,
+            relationships_created=0,
+            duplicates_merged=0,
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(args.workers * 2, args.person_embeddings),
+        ) as executor:
+            for stats in executor.map(
+                process_file_batch,
+                batches,
+                range(len(batches)),
+                chunksize=chunksize,
+            ):
+                combined_stats.update(stats)
 
         stats = combined_stats
     else:
         logger.info("Building graph (sequential mode)...")
-        builder = GraphBuilder(neo4j, batch_size=1000)
+        builder = GraphBuilder(neo4j, person_embeddings=args.person_embeddings)
         stats = builder.build_from_filings(entity_files)
 
     logger.info("")
@@ -219,7 +341,12 @@ def main() -> int:
     if not args.no_xbrl:
         logger.info("Importing XBRL facts...")
         xbrl_importer = XBRLImporter(neo4j, duckdb)
-        xbrl_stats = xbrl_importer.import_facts(key_concepts_only=not args.all_facts)
+        if args.xbrl_import_dir:
+            xbrl_stats = xbrl_importer.import_facts_bulk(
+                args.xbrl_import_dir, key_concepts_only=not args.all_facts
+            )
+        else:
+            xbrl_stats = xbrl_importer.import_facts(key_concepts_only=not args.all_facts)
 
         logger.info(f"  Facts imported: {xbrl_stats['facts_imported']:,}")
         logger.info(
@@ -244,7 +371,7 @@ def main() -> int:
             logger.info(f"    {rel_type}: {count:,}")
 
     # Close connections
-    neo4j.close()
+    Neo4jClient.shutdown_all()
     duckdb.close()
 
     logger.info("")
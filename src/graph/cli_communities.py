@@ -6,6 +6,7 @@ Usage:
     python -m src.graph.cli_communities                # Full run
     python -m src.graph.cli_communities --detect-only  # Skip summarization
     python -m src.graph.cli_communities --min-members 10
+    python -m src.graph.cli_communities --leiden-stats-only  # Stats, no write-back
 """
 
 from __future__ import annotations
@@ -41,6 +42,12 @@ def main() -> int:
         action="store_true",
         help="Run Leiden clustering only, skip summarization",
     )
+    parser.add_argument(
+        "--leiden-stats-only",
+        action="store_true",
+        help="Report Leiden community count and modularity without writing "
+        "communities to the graph (implies no summarization)",
+    )
     parser.add_argument(
         "--min-members",
         type=int,
@@ -53,6 +60,12 @@ def main() -> int:
         default=500,
         help="Max communities to summarize (default: 500, for cost control)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Summarization requests in flight at once (default: 16)",
+    )
     parser.add_argument(
         "--graph-name",
         default="sec-filings",
@@ -91,6 +104,7 @@ def main() -> int:
         G,
         include_hierarchy=True,
         seed=args.seed,
+        stats_only=args.leiden_stats_only,
     )
 
     logger.info(f"Detected {stats['community_count']} communities across {stats['levels']} levels")
@@ -98,6 +112,14 @@ def main() -> int:
     logger.info(f"  Compute time: {stats['computation_ms']}ms")
     logger.info("")
 
+    if args.leiden_stats_only:
+        # Nothing was written back, so there are no communities to read
+        client.close()
+        logger.info("=" * 70)
+        logger.info("LEIDEN STATISTICS COMPLETE (communities not written)")
+        logger.info("=" * 70)
+        return 0
+
     # --- Step 2: Retrieve communities ---
     communities = detector.get_communities()
     logger.info(f"Retrieved {len(communities)} communities total")
@@ -125,24 +147,19 @@ def main() -> int:
         logger.error("Set DEEPSEEK_API_KEY env var or pass --detect-only to skip")
         return 1
 
-    summaries: list[dict] = []
-    for i, community in enumerate(to_summarize, 1):
+    # Read members first; the LLM requests then run concurrently
+    items = []
+    for community in to_summarize:
         community_id = community["community_id"]
-
-        if i % 25 == 0:
-            logger.info(f"Progress: {i}/{len(to_summarize)} communities summarized")
-
-        # Get members
         members = detector.get_community_members(community_id, limit=100)
         relationships = detector.get_community_relationships(community_id)
+        items.append((community_id, members, relationships))
 
-        # Generate summary
-        summary = summarizer.summarize_community(community_id, members, relationships)
-
-        # Persist to Neo4j
-        summarizer.save_summary(client, community_id, summary)
+    summaries = summarizer.summarize_many_sync(items, concurrency=args.concurrency)
+    logger.info(f"{len(summaries)} communities summarized")
 
-        summaries.append(summary)
+    # Persist to Neo4j
+    summarizer.save_summaries(client, summaries)
 
     # --- Step 4: Save summaries to JSON ---
     output_dir = root / "data"
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from graphdatascience import GraphDataScience
 
-from src.graph.graph_connector import Neo4jClient
+from src.graph.graph_connector import COMMUNITY_LABELS, Neo4jClient
 from src.infrastructure.config import get_config
 from src.infrastructure.logger import get_logger
 
@@ -23,10 +23,7 @@ class CommunityDetector:
 
     # Node labels and relationship types to include in the projection.
     # Must match what actually exists in the graph (see db.labels / db.relationshipTypes).
-    NODE_LABELS = [
-        "Company", "Person", "Filing", "RiskFactor", "FinancialMetric",
-        "Org", "Product", "Gpe", "Law", "Risk", "Metric",
-    ]
+    NODE_LABELS = list(COMMUNITY_LABELS)
     REL_TYPES = [
         "FILED",
         "HAS_EXECUTIVE",
@@ -74,8 +71,7 @@ class CommunityDetector:
             GDS Graph object
         """
         # Drop existing projection if present
-        existing = self.gds.graph.list()
-        if any(g["graphName"] == graph_name for _, g in existing.iterrows()):
+        if self.gds.graph.exists(graph_name)["exists"]:
             logger.info(f"Dropping existing projection '{graph_name}'")
             self.gds.graph.drop(graph_name)
 
@@ -101,6 +97,7 @@ class CommunityDetector:
         G: object,
         include_hierarchy: bool = True,
         seed: int = 42,
+        stats_only: bool = False,
     ) -> dict:
         """
         Run Leiden community detection algorithm.
@@ -109,21 +106,32 @@ class CommunityDetector:
             G: GDS Graph object (from project_graph)
             include_hierarchy: Include intermediate communities for hierarchy
             seed: Random seed for reproducibility
+            stats_only: Compute statistics only (gds.leiden.stats), skipping
+                the write-back of the community property to every node
 
         Returns:
             Statistics dict with community_count, levels, modularity, etc.
         """
         logger.info("Running Leiden clustering...")
 
-        result = self.gds.leiden.write(
-            G,
-            writeProperty="community",
-            includeIntermediateCommunities=include_hierarchy,
-            randomSeed=seed,
-        )
+        if stats_only:
+            result = self.gds.leiden.stats(
+                G,
+                includeIntermediateCommunities=include_hierarchy,
+                randomSeed=seed,
+            )
+            node_count = G.node_count()
+        else:
+            result = self.gds.leiden.write(
+                G,
+                writeProperty="community",
+                includeIntermediateCommunities=include_hierarchy,
+                randomSeed=seed,
+            )
+            node_count = result["nodePropertiesWritten"]
 
         stats = {
-            "node_count": result["nodePropertiesWritten"],
+            "node_count": node_count,
             "community_count": result["communityCount"],
             "levels": result.get("ranLevels", result.get("levels", 1)),
             "modularity": result.get("modularity"),
@@ -7,33 +7,127 @@ from SpaCy + LLM extraction results.
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 
-from src.graph.graph_connector import Neo4jClient
+from src.graph.graph_connector import NODE_KEYS, Neo4jClient
 from src.infrastructure.logger import get_logger
 
+try:
+    # SIMD JSON parsing for the entity files; accepts bytes like json.loads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger("finloom.graph.graph_builder")
 
+# A node is referenced by (label, business key) so batched relationship
+# writes can MATCH through the label's uniqueness constraint
+NodeRef = tuple[str, str]
+
+# Property each label is keyed on; entity labels not listed use "text"
+_NODE_KEYS = NODE_KEYS
+
+# Optional embedding-based Person dedup (fastembed + Neo4j vector index).
+# Scores from db.index.vector.queryNodes are cosine similarity rescaled
+# to [0, 1] as (1 + cos) / 2, so the cosine cutoff is converted.
+_PERSON_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_PERSON_EMBED_DIM = 384
+_PERSON_VECTOR_INDEX = "person_emb"
+_PERSON_MATCH_COSINE = 0.92
+_PERSON_MATCH_SCORE = (1 + _PERSON_MATCH_COSINE) / 2
+
+# Risk descriptions are stored truncated to this many characters
+_RISK_DESCRIPTION_LEN = 1000
+
+# Entity types deduplicated by fuzzy name matching, and the minimum
+# fuzz.ratio score for two names to be treated as the same node
+_FUZZY_TYPES = frozenset({"PERSON", "ORG"})
+_FUZZY_CUTOFF = 90
+
+# Fuzzy candidates are blocked on this many leading characters of the
+# lowercased name, so each lookup compares against a handful of names
+_BLOCK_PREFIX = 3
+
+# MERGE that reports whether it created the node, in one round-trip. The
+# marker property is set only on create and removed in the same statement;
+# {set} holds any SET applied to created and matched nodes alike.
+_MERGE_REPORTING_NEW = """
+MERGE ({pattern})
+ON CREATE SET e._is_new = true{on_create}{set}
+WITH e, coalesce(e._is_new, false) AS is_new
+REMOVE e._is_new
+RETURN is_new
+"""
+
+# Batched form for one label: MERGE every queued text, count the new nodes
+_MERGE_MANY_REPORTING_NEW = """
+UNWIND $texts AS text
+MERGE (e:{label} {{{key}: text}})
+ON CREATE SET e._is_new = true
+WITH e, coalesce(e._is_new, false) AS is_new
+REMOVE e._is_new
+RETURN count(e) AS merged, count(CASE WHEN is_new THEN 1 END) AS created
+"""
+
+# Node label for each NER entity type (spaCy OntoNotes plus the custom
+# EntityRuler types), e.g. WORK_OF_ART -> Workofart
+_ENTITY_TYPES = (
+    "PERSON", "NORP", "FAC", "ORG", "GPE", "LOC", "PRODUCT", "EVENT",
+    "WORK_OF_ART", "LAW", "LANGUAGE", "DATE", "TIME", "PERCENT", "MONEY",
+    "QUANTITY", "ORDINAL", "CARDINAL", "METRIC", "RISK",
+)
+_LABEL_MAP = {ent_type: ent_type.capitalize().replace("_", "") for ent_type in _ENTITY_TYPES}
+
+# Batched MERGE per label, built once so every flush reuses the same string
+_CREATE_QUERY = {
+    label: _MERGE_MANY_REPORTING_NEW.format(label=label, key=_NODE_KEYS.get(label, "text"))
+    for label in _LABEL_MAP.values()
+}
+
 
 class GraphBuilder:
     """Build knowledge graph from extracted entities with deduplication."""
 
-    def __init__(self, neo4j_client: Neo4jClient, batch_size: int = 500):
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        batch_size: int = 10_000,
+        flush_workers: int = 4,
+        person_embeddings: bool = False,
+    ):
         """
         Initialize graph builder.
 
         Args:
             neo4j_client: Neo4j client instance
             batch_size: Number of operations to batch before flush
+            flush_workers: Threads writing relationship groups concurrently
+                during a flush (1 writes them in order)
+            person_embeddings: Deduplicate LLM-extracted people against the
+                whole graph by name embedding (requires fastembed)
         """
         self.client = neo4j_client
-        self.entity_cache: dict[str, str] = {}  # Cache for deduplication
+        # Cache for deduplication: ent_type -> {lowercased text: node_ref}
+        self._cache_by_type: defaultdict[str, dict[str, NodeRef]] = defaultdict(dict)
         self.batch_size = batch_size
-        self.relationship_batch: list[dict] = []  # Pending relationships
+        # Pending relationships, grouped as (from_label, to_label, rel_type) -> rows
+        self._by_type: defaultdict[tuple[str, str, str], list[dict]] = defaultdict(list)
+        self._pending_relationships = 0
+        self._constrained_labels: set[str] = set()  # Entity labels with a text constraint
+        # (ent_type, name prefix) -> {lowercased name: node_ref}
+        self._fuzzy_blocks: dict[tuple[str, str], dict[str, NodeRef]] = {}
+        self._pending_nodes: dict[str, list[str]] = {}  # label -> texts to MERGE
+        self.flush_workers = flush_workers
+        self._flush_pool: ThreadPoolExecutor | None = None  # Started on first flush
+        self._person_embedder = self._load_person_embedder() if person_embeddings else None
         self.stats = {
             "nodes_created": 0,
             "relationships_created": 0,
@@ -59,27 +153,33 @@ class GraphBuilder:
                 logger.info(
                     f"Progress: {i}/{len(entity_files)} files "
                     f"({self.stats['nodes_created']:,} nodes, "
-                    f"{self.stats['relationships_created']:,} relationships)"
+                    f"{self.stats['relationships_created']:,} relationships, "
+                    f"{self._pending_relationships:,} buffered)"
                 )
 
             try:
+                # Relationships flush when the batch fills, not per filing
                 self._process_filing(entity_file)
-                self._flush_relationships()  # Flush after each filing
                 self.stats["files_processed"] += 1
             except Exception as e:
                 logger.error(f"Failed to process {entity_file.name}: {e}")
                 continue
 
-        # Final flush for any remaining relationships
-        self._flush_relationships(force=True)
+        # Final flush for any remaining relationships; the flush threads are
+        # stopped even if it raises
+        try:
+            self._flush_relationships(force=True)
+        finally:
+            if self._flush_pool is not None:
+                self._flush_pool.shutdown()
+                self._flush_pool = None
         
         logger.info(f"Graph build complete: {self.stats}")
         return self.stats
 
     def _process_filing(self, entity_file: Path) -> None:
         """Process single filing JSON file."""
-        with open(entity_file) as f:
-            data = json.load(f)
+        data = _json_loads(entity_file.read_bytes())
 
         accession = data["accession_number"]
         ticker = data.get("ticker", "UNKNOWN")
@@ -100,8 +200,11 @@ class GraphBuilder:
         for section in data.get("sections", []):
             self._process_section(section, filing_id, company_id)
 
+        # Write the filing's new entity nodes before any relationship flush
+        self._flush_pending_nodes()
+
     def _process_section(
-        self, section: dict, filing_id: str, company_id: str
+        self, section: dict, filing_id: NodeRef, company_id: NodeRef
     ) -> None:
         """Process section and extract entities."""
 
@@ -127,8 +230,11 @@ class GraphBuilder:
 
             # Process LLM Risk Factors
             for risk_data in llm_data.get("risk_factors", []):
-                risk_id = self._create_risk_factor_node(risk_data)
-                self.stats["nodes_created"] += 1
+                risk_id, is_new = self._create_risk_factor_node(risk_data)
+                if is_new:
+                    self.stats["nodes_created"] += 1
+                else:
+                    self.stats["duplicates_merged"] += 1
 
                 # Link Filing -> RiskFactor
                 self._create_relationship(filing_id, risk_id, "DISCLOSES_RISK")
@@ -150,165 +256,318 @@ class GraphBuilder:
                 if not entity_text or len(entity_text) < 2:
                     continue
 
-                entity_id, is_new = self._create_entity_node(ent_type, entity_text)
-                if is_new:
-                    self.stats["nodes_created"] += 1
-                else:
-                    self.stats["duplicates_merged"] += 1
+                entity_id = self._create_entity_node(ent_type, entity_text)
 
                 # Link Filing -> Entity
                 self._create_relationship(filing_id, entity_id, f"MENTIONS_{ent_type}")
                 self.stats["relationships_created"] += 1
 
-    def _create_company_node(self, ticker: str, name: str | None = None) -> str:
+    def _create_company_node(self, ticker: str, name: str | None = None) -> NodeRef:
         """Create or get Company node."""
         query = """
         MERGE (c:Company {ticker: $ticker})
         ON CREATE SET c.name = $name
-        RETURN elementId(c) as id
         """
-        result = self.client.execute_query(
-            query, {"ticker": ticker, "name": name or ticker}
-        )
-        return result[0]["id"]
+        self.client.execute_write(query, {"ticker": ticker, "name": name or ticker})
+        return "Company", ticker
 
     def _create_filing_node(
         self, accession: str, ticker: str, filing_date: str | None
-    ) -> str:
+    ) -> NodeRef:
         """Create Filing node."""
         query = """
         MERGE (f:Filing {accession_number: $accession})
         ON CREATE SET 
             f.ticker = $ticker,
             f.filing_date = date($filing_date)
-        RETURN elementId(f) as id
         """
-        result = self.client.execute_query(
+        self.client.execute_write(
             query,
             {"accession": accession, "ticker": ticker, "filing_date": filing_date},
         )
-        node_id = result[0]["id"]
         self.stats["nodes_created"] += 1
-        return node_id
+        return "Filing", accession
 
-    def _create_entity_node(self, ent_type: str, text: str) -> tuple[str, bool]:
+    def _create_entity_node(self, ent_type: str, text: str) -> NodeRef:
         """
-        Create entity node with full deduplication.
+        Resolve an entity to a node with full deduplication.
+
+        New entities are queued in _pending_nodes and written by
+        _flush_pending_nodes; their reference is known up front because
+        nodes are keyed on text.
 
         Returns:
-            (node_id, is_new) tuple
+            Node reference
         """
         # Check cache for exact match
-        cache_key = f"{ent_type}:{text.lower()}"
-        if cache_key in self.entity_cache:
-            return self.entity_cache[cache_key], False
+        text_lower = text.lower()
+        cached_ref = self._cache_by_type[ent_type].get(text_lower)
+        if cached_ref is not None:
+            self.stats["duplicates_merged"] += 1
+            return cached_ref
 
         # Fuzzy matching for PERSON and ORG only (expensive)
-        if ent_type in ["PERSON", "ORG"]:
-            for cached_key, cached_id in self.entity_cache.items():
-                if cached_key.startswith(f"{ent_type}:"):
-                    cached_text = cached_key.split(":", 1)[1]
-                    similarity = fuzz.ratio(text.lower(), cached_text)
-                    if similarity >= 90:
-                        # Found fuzzy match
-                        logger.debug(f"Fuzzy match: '{text}' ≈ '{cached_text}' ({similarity}%)")
-                        self.entity_cache[cache_key] = cached_id
-                        return cached_id, False
-
-        # Create new node
-        label = ent_type.capitalize().replace("_", "")
-        query = f"""
-        CREATE (e:{label} {{text: $text}})
-        RETURN elementId(e) as id
+        if ent_type in _FUZZY_TYPES:
+            cached_ref = self._fuzzy_match(ent_type, text_lower)
+            if cached_ref is not None:
+                self._remember_node(ent_type, text_lower, cached_ref)
+                self.stats["duplicates_merged"] += 1
+                return cached_ref
+
+        # Queue new node
+        label = _LABEL_MAP.get(ent_type) or ent_type.capitalize().replace("_", "")
+        self._pending_nodes.setdefault(label, []).append(text)
+
+        node_ref = (label, text)
+        self._remember_node(ent_type, text_lower, node_ref)
+        return node_ref
+
+    def _flush_pending_nodes(self) -> None:
+        """
+        MERGE queued entity nodes with one UNWIND query per label.
+
+        MERGE rather than CREATE: the text constraint would reject a node
+        another worker has already written. Labels with their own business
+        key (Person) are merged on that key.
         """
-        result = self.client.execute_write(query, {"text": text})
-        # Get node ID from result
-        node_id = self.client.execute_query(
-            f"MATCH (e:{label} {{text: $text}}) RETURN elementId(e) as id LIMIT 1",
-            {"text": text},
-        )[0]["id"]
+        pending, self._pending_nodes = list(self._pending_nodes.items()), {}
 
-        self.entity_cache[cache_key] = node_id
-        return node_id, True
+        for done, (label, texts) in enumerate(pending):
+            key = _NODE_KEYS.get(label, "text")
+            try:
+                if key == "text":
+                    self._ensure_text_constraint(label)
 
-    def _create_person_node(self, person_data: dict) -> tuple[str, bool]:
+                query = _CREATE_QUERY.get(label) or _MERGE_MANY_REPORTING_NEW.format(
+                    label=label, key=key
+                )
+                result = self.client.execute_query(
+                    query, {"texts": texts}, write=True, raw=True
+                )
+            except Exception:
+                # The texts are already cached, so nothing would queue them
+                # again; put the unwritten labels back for the next flush
+                unwritten = dict(pending[done:])
+                for queued_label, queued in self._pending_nodes.items():
+                    unwritten.setdefault(queued_label, []).extend(queued)
+                self._pending_nodes = unwritten
+                raise
+            created = result[0]["created"]
+            self.stats["nodes_created"] += created
+            self.stats["duplicates_merged"] += result[0]["merged"] - created
+
+    def _fuzzy_match(self, ent_type: str, text_lower: str) -> NodeRef | None:
+        """
+        Find a cached node whose name nearly matches text_lower.
+
+        Only names sharing the first _BLOCK_PREFIX characters are compared,
+        so a typo inside that prefix is not caught.
+
+        Args:
+            ent_type: Entity type (PERSON, ORG)
+            text_lower: Lowercased name
+
+        Returns:
+            Reference to the best cached node scoring at least
+            _FUZZY_CUTOFF, or None
+        """
+        block = self._fuzzy_blocks.get((ent_type, text_lower[:_BLOCK_PREFIX]))
+        if not block:
+            return None
+
+        match = process.extractOne(
+            text_lower, list(block), scorer=fuzz.ratio, score_cutoff=_FUZZY_CUTOFF
+        )
+        if match is None:
+            return None
+
+        cached_text, similarity, _ = match
+        logger.debug(f"Fuzzy match: '{text_lower}' ≈ '{cached_text}' ({similarity:.0f}%)")
+        return block[cached_text]
+
+    def _remember_node(self, ent_type: str, text_lower: str, node_ref: NodeRef) -> None:
+        """Cache a node under a lowercased name and add it to its fuzzy block."""
+        self._cache_by_type[ent_type][text_lower] = node_ref
+        if ent_type in _FUZZY_TYPES:
+            block_key = (ent_type, text_lower[:_BLOCK_PREFIX])
+            self._fuzzy_blocks.setdefault(block_key, {})[text_lower] = node_ref
+
+    def _ensure_text_constraint(self, label: str) -> None:
+        """
+        Create the uniqueness constraint on text for an entity label, once.
+
+        bootstrap_indexes declares the labels in _LABEL_MAP up front; this
+        also covers labels for entity types outside that map, and builders
+        used without the CLI.
+        """
+        if label in self._constrained_labels:
+            return
+
+        self._constrained_labels.add(label)
+        _create_text_constraint(self.client, label)
+
+    def _create_person_node(self, person_data: dict) -> tuple[NodeRef | None, bool]:
         """Create Person node with role from LLM extraction."""
         name = person_data.get("name", "").strip()
         if not name:
-            # Return dummy node if no name
-            return "", False
+            # No node without a name; the relationship is skipped
+            return None, False
 
         role = person_data.get("role", "Unknown")
-        cache_key = f"PERSON:{name.lower()}"
-
-        if cache_key in self.entity_cache:
-            return self.entity_cache[cache_key], False
+        name_lower = name.lower()
+        cached_ref = self._cache_by_type["PERSON"].get(name_lower)
+        if cached_ref is not None:
+            return cached_ref, False
 
         # Fuzzy match on existing people
-        for cached_key, cached_id in self.entity_cache.items():
-            if cached_key.startswith("PERSON:"):
-                cached_name = cached_key.split(":", 1)[1]
-                similarity = fuzz.ratio(name.lower(), cached_name)
-                if similarity >= 90:
-                    logger.debug(f"Fuzzy match: '{name}' ≈ '{cached_name}' ({similarity}%)")
-                    self.entity_cache[cache_key] = cached_id
-                    return cached_id, False
+        cached_ref = self._fuzzy_match("PERSON", name_lower)
+        if cached_ref is not None:
+            self._remember_node("PERSON", name_lower, cached_ref)
+            return cached_ref, False
+
+        # Nearest person already in the graph, including other workers' nodes
+        embedding = None
+        if self._person_embedder is not None:
+            embedding = next(iter(self._person_embedder.embed([name]))).tolist()
+            match = self._nearest_person(embedding)
+            if match is not None:
+                logger.debug(f"Embedding match: '{name}' ≈ '{match}'")
+                node_ref = ("Person", match)
+                self._remember_node("PERSON", name_lower, node_ref)
+                return node_ref, False
 
         # Create new Person node
-        query = """
-        MERGE (p:Person {name: $name})
-        ON CREATE SET p.role = $role
-        RETURN elementId(p) as id
+        is_new = self._merge_person(name, role, embedding)
+
+        node_ref = ("Person", name)
+        self._remember_node("PERSON", name_lower, node_ref)
+        return node_ref, is_new
+
+    def _merge_person(
+        self, name: str, role: str, embedding: list[float] | None = None
+    ) -> bool:
         """
-        result = self.client.execute_query(query, {"name": name, "role": role})
-        node_id = result[0]["id"]
+        Write a Person node, setting role only if the node is new.
 
-        self.entity_cache[cache_key] = node_id
-        return node_id, True
+        An embedding is also stored on an existing node that has none yet,
+        so people created before embedding dedup become matchable.
 
-    def _create_risk_factor_node(self, risk_data: dict) -> str:
-        """Create RiskFactor node from LLM extraction."""
-        query = """
-        CREATE (r:RiskFactor {
-            category: $category,
-            severity: $severity,
-            description: $description
-        })
-        RETURN elementId(r) as id
+        Returns:
+            True if the node was created
         """
+        set_embedding = ""
+        if embedding is not None:
+            set_embedding = "\nSET e.embedding = coalesce(e.embedding, $embedding)"
         result = self.client.execute_query(
-            query,
+            _MERGE_REPORTING_NEW.format(
+                pattern="e:Person {name: $name}", on_create=", e.role = $role", set=set_embedding
+            ),
+            {"name": name, "role": role, "embedding": embedding},
+            write=True,
+            raw=True,
+        )
+        return result[0]["is_new"]
+
+    def _load_person_embedder(self) -> Any | None:
+        """
+        Load the name embedding model and ensure the Person vector index.
+
+        Returns:
+            fastembed TextEmbedding, or None if fastembed is not installed
+        """
+        try:
+            model = _person_embedding_model()
+        except ImportError:
+            logger.warning("fastembed not installed; person embedding dedup disabled")
+            return None
+
+        try:
+            self.client.execute_write(
+                f"CREATE VECTOR INDEX {_PERSON_VECTOR_INDEX} IF NOT EXISTS "
+                "FOR (p:Person) ON (p.embedding) "
+                f"OPTIONS {{indexConfig: {{`vector.dimensions`: {_PERSON_EMBED_DIM}, "
+                "`vector.similarity_function`: 'cosine'}}"
+            )
+        except Exception as e:
+            logger.warning(f"Vector index creation failed, person embedding dedup disabled: {e}")
+            return None
+
+        return model
+
+    def _nearest_person(self, embedding: list[float]) -> str | None:
+        """
+        Find the most similar existing Person by name embedding.
+
+        Returns:
+            Name of the nearest person scoring at least _PERSON_MATCH_SCORE,
+            or None
+        """
+        result = self.client.execute_query(
+            f"CALL db.index.vector.queryNodes('{_PERSON_VECTOR_INDEX}', 1, $embedding) "
+            "YIELD node, score WHERE score >= $min_score "
+            "RETURN node.name AS name",
+            {"embedding": embedding, "min_score": _PERSON_MATCH_SCORE},
+            raw=True,
+        )
+        return result[0]["name"] if result else None
+
+    def _create_risk_factor_node(self, risk_data: dict) -> tuple[NodeRef, bool]:
+        """
+        Create RiskFactor node from LLM extraction.
+
+        Risks are merged on a hash of the truncated description, so a risk
+        repeated across filings becomes one node and its text is only
+        stored when first seen.
+
+        Returns:
+            (node_ref, is_new) tuple
+        """
+        description = risk_data.get("description", "")[:_RISK_DESCRIPTION_LEN]
+        risk_hash = _risk_hash(description)
+        result = self.client.execute_query(
+            _MERGE_REPORTING_NEW.format(
+                pattern="e:RiskFactor {hash: $hash}",
+                on_create=(
+                    ", e.category = $category, e.severity = $severity, "
+                    "e.description = $description"
+                ),
+                set="",
+            ),
             {
+                "hash": risk_hash,
                 "category": risk_data.get("category", "Unknown"),
                 "severity": risk_data.get("severity", 3),
-                "description": risk_data.get("description", "")[:1000],  # Truncate
+                "description": description,
             },
+            write=True,
+            raw=True,
         )
-        return result[0]["id"]
+        return ("RiskFactor", risk_hash), result[0]["is_new"]
 
     def _create_relationship(
         self,
-        from_id: str,
-        to_id: str,
+        from_ref: NodeRef | None,
+        to_ref: NodeRef | None,
         rel_type: str,
         properties: dict | None = None,
     ) -> None:
         """Queue relationship for batched creation."""
-        if not from_id or not to_id:
+        if not from_ref or not to_ref:
             return
 
-        # Add to batch
-        self.relationship_batch.append({
-            "from_id": from_id,
-            "to_id": to_id,
-            "rel_type": rel_type,
-            "properties": properties or {}
+        # Add to batch, already grouped by endpoint labels and type so each
+        # UNWIND matches on one constraint index per side
+        self._by_type[(from_ref[0], to_ref[0], rel_type)].append({
+            "fk": from_ref[1],
+            "tk": to_ref[1],
+            "props": properties or {},
         })
+        self._pending_relationships += 1
         
         self.stats["relationships_created"] += 1
         
         # Auto-flush if batch full
-        if len(self.relationship_batch) >= self.batch_size:
+        if self._pending_relationships >= self.batch_size:
             self._flush_relationships()
     
     def _flush_relationships(self, force: bool = False) -> None:
@@ -318,51 +577,135 @@ class GraphBuilder:
         Args:
             force: Flush even if batch not full
         """
-        if not self.relationship_batch:
+        if not self._pending_relationships:
             return
         
-        if not force and len(self.relationship_batch) < self.batch_size:
+        if not force and self._pending_relationships < self.batch_size:
             return
         
-        # Group by relationship type for efficient batching
-        by_type: dict[str, list] = {}
-        for rel in self.relationship_batch:
-            rel_type = rel["rel_type"]
-            if rel_type not in by_type:
-                by_type[rel_type] = []
-            by_type[rel_type].append(rel)
-        
-        # Flush each type
-        for rel_type, rels in by_type.items():
-            try:
-                self._flush_relationship_batch(rel_type, rels)
-            except Exception as e:
-                logger.error(f"Failed to flush {rel_type} batch: {e}")
-        
-        # Clear batch
-        self.relationship_batch.clear()
+        # Endpoints must exist before the MATCHes below run
+        self._flush_pending_nodes()
+
+        # Flush each group. Groups are independent transactions, each on
+        # its own driver session, so they can be written concurrently.
+        groups = [(group, rels) for group, rels in self._by_type.items() if rels]
+        if self.flush_workers > 1 and len(groups) > 1:
+            if self._flush_pool is None:
+                self._flush_pool = ThreadPoolExecutor(
+                    max_workers=self.flush_workers, thread_name_prefix="graph-flush"
+                )
+            list(self._flush_pool.map(lambda item: self._flush_group(*item), groups))
+        else:
+            for group, rels in groups:
+                self._flush_group(group, rels)
+
+        # Clear batch; each group's list is reused by the next one
+        for _, rels in groups:
+            rels.clear()
+        self._pending_relationships = 0
+
+    def _flush_group(self, group: tuple[str, str, str], rels: list[dict]) -> None:
+        """Flush one relationship group, logging rather than raising on failure."""
+        from_label, to_label, rel_type = group
+        try:
+            self._flush_relationship_batch(from_label, to_label, rel_type, rels)
+        except Exception as e:
+            logger.error(f"Failed to flush {from_label}-{rel_type}->{to_label} batch: {e}")
     
-    def _flush_relationship_batch(self, rel_type: str, rels: list[dict]) -> None:
-        """Flush single relationship type batch."""
+    def _flush_relationship_batch(
+        self, from_label: str, to_label: str, rel_type: str, rels: list[dict]
+    ) -> None:
+        """Flush one (from_label, to_label, rel_type) relationship batch."""
+        match_from = _match_endpoint("a", from_label, "fk")
+        match_to = _match_endpoint("b", to_label, "tk")
+
         # Check if any relationships have properties
-        has_props = any(rel["properties"] for rel in rels)
+        has_props = any(rel["props"] for rel in rels)
         
         if has_props:
             # Use UNWIND with properties
             query = f"""
-            UNWIND $rels as rel
-            MATCH (a) WHERE elementId(a) = rel.from_id
-            MATCH (b) WHERE elementId(b) = rel.to_id
-            MERGE (a)-[r:{rel_type}]->(b)
-            SET r += rel.properties
+            UNWIND $rels as r
+            {match_from}
+            {match_to}
+            MERGE (a)-[x:{rel_type}]->(b)
+            SET x += r.props
             """
         else:
             # Simpler query without properties
             query = f"""
-            UNWIND $rels as rel
-            MATCH (a) WHERE elementId(a) = rel.from_id
-            MATCH (b) WHERE elementId(b) = rel.to_id
-            MERGE (a)-[r:{rel_type}]->(b)
+            UNWIND $rels as r
+            {match_from}
+            {match_to}
+            MERGE (a)-[x:{rel_type}]->(b)
             """
         
         self.client.execute_write(query, {"rels": rels})
+
+
+def bootstrap_indexes(client: Neo4jClient) -> None:
+    """
+    Create every constraint and index the graph build relies on.
+
+    Run once before any builder starts so the first MERGEs and relationship
+    MATCHes already use index seeks: the fixed constraints and indexes from
+    Neo4jClient, plus a text uniqueness constraint per entity label.
+
+    Args:
+        client: Neo4j client instance
+    """
+    client.create_constraints()
+    client.create_indexes()
+
+    created = 0
+    for label in sorted(set(_LABEL_MAP.values())):
+        if _NODE_KEYS.get(label, "text") == "text" and _create_text_constraint(client, label):
+            created += 1
+    logger.info(f"Created/verified {created} entity text constraints")
+
+
+def _create_text_constraint(client: Neo4jClient, label: str) -> bool:
+    """
+    Create the uniqueness constraint on text for one entity label.
+
+    Returns:
+        True if the constraint exists afterwards
+    """
+    try:
+        client.execute_write(
+            f"CREATE CONSTRAINT {label.lower()}_text_unique IF NOT EXISTS "
+            f"FOR (e:{label}) REQUIRE e.text IS UNIQUE"
+        )
+        return True
+    except Exception as e:
+        # Existing duplicates block the constraint; matches still work
+        logger.warning(f"Constraint creation failed for {label}.text: {e}")
+        return False
+
+
+def _match_endpoint(var: str, label: str, field: str) -> str:
+    """
+    Build the MATCH clause locating one relationship endpoint by its key.
+
+    Args:
+        var: Cypher variable to bind
+        label: Node label
+        field: Row field holding the key value
+
+    Returns:
+        MATCH clause over the label's key property
+    """
+    return f"MATCH ({var}:{label} {{{_NODE_KEYS.get(label, 'text')}: r.{field}}})"
+
+
+@lru_cache(maxsize=1)
+def _person_embedding_model() -> Any:
+    """Load the name embedding model once per process."""
+    from fastembed import TextEmbedding
+
+    return TextEmbedding(_PERSON_EMBED_MODEL)
+
+
+def _risk_hash(description: str) -> str:
+    """Key a risk factor by a 128-bit BLAKE2b digest of its description."""
+    return hashlib.blake2b(description.encode("utf-8"), digest_size=16).hexdigest()
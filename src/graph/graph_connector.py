@@ -9,16 +9,122 @@ Provides:
 - Health checks
 """
 
-from typing import Any
-
-from neo4j import GraphDatabase
-from neo4j.exceptions import Neo4jError, ServiceUnavailable
-
+import atexit
+import functools
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from neo4j import Driver, GraphDatabase, Record, Result
+from neo4j.exceptions import Neo4jError, ServiceUnavailable, SessionExpired, TransientError
+
+try:
+    from neo4j import RoutingControl
+except ImportError:  # driver < 5.5: no driver-level execute_query
+    RoutingControl = None
+
+from src.core.exceptions import DatabaseError
 from src.infrastructure.config import get_config
 from src.infrastructure.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger("finloom.graph.graph_connector")
 
+# Business key each node label is merged and matched on; labels not
+# listed (NER entity labels) are keyed on "text"
+NODE_KEYS: dict[str, str] = {
+    "Company": "ticker",
+    "Filing": "accession_number",
+    "Person": "name",
+    "RiskFactor": "hash",
+}
+
+# Uniqueness constraint backing each business key, by constraint name
+_KEY_CONSTRAINTS: dict[str, tuple[str, str]] = {
+    "filing_accession_unique": ("Filing", "accession_number"),
+    "company_ticker_unique": ("Company", "ticker"),
+    "person_name_unique": ("Person", "name"),
+    "risk_factor_hash_unique": ("RiskFactor", "hash"),
+}
+
+# Range indexes that older schemas kept on key properties; an existing one
+# makes the matching CREATE CONSTRAINT fail as an equivalent index
+_LEGACY_KEY_INDEXES = ("company_ticker", "person_name")
+
+# Labels Leiden clusters; each gets an index on its community property
+COMMUNITY_LABELS = (
+    "Company", "Person", "Filing", "RiskFactor", "FinancialMetric",
+    "Org", "Product", "Gpe", "Law", "Risk", "Metric",
+)
+
+# Cypher runtime selection. Short plain queries skip the pipelined
+# runtime's setup cost under the slotted one; schema commands, procedure
+# calls and queries with their own CYPHER options are sent unchanged.
+Runtime = Literal["auto", "slotted", "pipelined"]
+_AUTO_SLOTTED_MAX_LEN = 200
+_NO_RUNTIME_HINT = re.compile(
+    r"^\s*(?:CYPHER|SHOW|DROP|USE)\b|\b(?:INDEX|CONSTRAINT|CALL)\b", re.IGNORECASE
+)
+
+# Retry policy for transient failures outside the driver's managed
+# transactions: deadlocks, leader switches, dropped connections
+_RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+_MAX_ATTEMPTS = 5
+_RETRY_MAX_WAIT = 10.0
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _retry_transient(func: _F) -> _F:
+    """
+    Retry a call on transient Neo4j errors with jittered exponential backoff.
+
+    Waits a random time up to min(2**attempt, _RETRY_MAX_WAIT) seconds
+    between attempts ("full jitter"), so clients that failed together do
+    not retry together. Other errors, including client errors such as
+    syntax errors, are raised immediately.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                wait = random.uniform(0, min(2.0**attempt, _RETRY_MAX_WAIT))
+                logger.warning(
+                    f"Transient Neo4j error ({type(e).__name__}), "
+                    f"retry {attempt + 1}/{_MAX_ATTEMPTS - 1} in {wait:.1f}s: {e}"
+                )
+                time.sleep(wait)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@_retry_transient
+def _consume(session: Any, query: str) -> Any:
+    """Run one auto-commit statement on an open session, retrying transient errors."""
+    return session.run(query).consume()
+
+
+def _record_dicts(result: Result) -> list[dict[str, Any]]:
+    """Collect a result's records as dictionaries."""
+    return [record.data() for record in result]
+
+
+# One driver (and so one connection pool) per (uri, user, database) per
+# process, shared by every Neo4jClient
+_DRIVER_CACHE: dict[tuple[str, str, str], Driver] = {}
+_CACHE_LOCK = threading.Lock()
+
 
 class Neo4jClient:
     """
@@ -37,6 +143,7 @@ class Neo4jClient:
         user: str | None = None,
         password: str | None = None,
         database: str | None = None,
+        max_connection_pool_size: int | None = None,
     ):
         """
         Initialize Neo4j client.
@@ -46,6 +153,8 @@ class Neo4jClient:
             user: Username (default: from config)
             password: Password (default: from config)
             database: Database name (default: from config)
+            max_connection_pool_size: Driver pool size, sized to the
+                caller's concurrency (default: from config)
         """
         config = get_config()
         neo4j_config = config.get_neo4j_config()
@@ -55,24 +164,53 @@ class Neo4jClient:
         self.password = password or neo4j_config["password"]
         self.database = database or neo4j_config["database"]
 
-        try:
-            self.driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password),
-                max_connection_pool_size=neo4j_config["max_connection_pool_size"],
-                connection_timeout=neo4j_config["connection_timeout"],
-                max_transaction_retry_time=neo4j_config["max_transaction_retry_time"],
-            )
-            logger.info(f"Connected to Neo4j at {self.uri}")
-        except ServiceUnavailable as e:
-            logger.error(f"Failed to connect to Neo4j at {self.uri}: {e}")
-            raise
+        key = (self.uri, self.user, self.database)
+        with _CACHE_LOCK:
+            driver = _DRIVER_CACHE.get(key)
+            if driver is None:
+                try:
+                    driver = GraphDatabase.driver(
+                        self.uri,
+                        auth=(self.user, self.password),
+                        max_connection_pool_size=(
+                            max_connection_pool_size
+                            or neo4j_config["max_connection_pool_size"]
+                        ),
+                        connection_timeout=neo4j_config["connection_timeout"],
+                        max_transaction_retry_time=neo4j_config["max_transaction_retry_time"],
+                        connection_acquisition_timeout=neo4j_config[
+                            "connection_acquisition_timeout"
+                        ],
+                        keep_alive=neo4j_config["keep_alive"],
+                    )
+                    driver.verify_connectivity()
+                except ServiceUnavailable as e:
+                    logger.error(f"Failed to connect to Neo4j at {self.uri}: {e}")
+                    raise
+                _DRIVER_CACHE[key] = driver
+                logger.info(f"Connected to Neo4j at {self.uri}")
+        self.driver = driver
+        # Driver-level execute_query (5.5+) manages sessions and retries itself
+        self._fast_path = RoutingControl is not None and hasattr(driver, "execute_query")
 
     def close(self) -> None:
-        """Close database connection and release resources."""
-        if self.driver:
-            self.driver.close()
-            logger.info("Neo4j connection closed")
+        """
+        Release this client.
+
+        The driver is shared with every other client in the process, so it
+        stays open; shutdown_all() closes it.
+        """
+        logger.debug("Neo4j client released (shared driver kept open)")
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every shared driver in this process."""
+        with _CACHE_LOCK:
+            for driver in _DRIVER_CACHE.values():
+                driver.close()
+            if _DRIVER_CACHE:
+                logger.info("Neo4j connection closed")
+            _DRIVER_CACHE.clear()
 
     def __enter__(self):
         """Context manager entry."""
@@ -83,33 +221,248 @@ class Neo4jClient:
         self.close()
 
     def execute_query(
-        self, query: str, parameters: dict | None = None
-    ) -> list[dict[str, Any]]:
+        self,
+        query: str,
+        parameters: dict | None = None,
+        runtime: Runtime = "auto",
+        write: bool = False,
+        raw: bool = False,
+    ) -> list[dict[str, Any]] | list[Record]:
         """
         Execute a read query and return results.
         
         Args:
             query: Cypher query string
             parameters: Query parameters
+            runtime: Cypher runtime; "auto" uses slotted for short plain queries
+            write: Run in write mode, for writes whose records are needed
+                (e.g. MERGE ... RETURN)
+            raw: Return the driver's Record objects (mapping access, no
+                per-row dict copy) instead of dictionaries
         
         Returns:
-            List of result records as dictionaries
+            List of result records as dictionaries, or Records if raw
         
         Raises:
             Neo4jError: If query execution fails
         """
+        query = _with_runtime(query, runtime)
+        try:
+            if self._fast_path:
+                result_records, _, _ = self.driver.execute_query(
+                    query,
+                    parameters or {},
+                    database_=self.database,
+                    routing_=RoutingControl.WRITE if write else RoutingControl.READ,
+                )
+                records = result_records if raw else [record.data() for record in result_records]
+            else:
+                records = self._session_run(query, parameters, list if raw else _record_dicts)
+            logger.debug(f"Query executed: {query[:100]}... returned {len(records)} records")
+            return records
+        except Neo4jError as e:
+            logger.error(f"Query failed: {query[:100]}... Error: {e}")
+            raise
+
+    def execute_read_tx(
+        self, query: str, parameters: dict | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read query in a managed read transaction.
+
+        The driver retries the transaction function itself on transient
+        errors and routes it to a reader, which plain session.run does not.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of result records as dictionaries
+
+        Raises:
+            Neo4jError: If query execution fails
+        """
+        def _read(tx):
+            return [record.data() for record in tx.run(query, parameters or {})]
+
         try:
             with self.driver.session(database=self.database) as session:
-                result = session.run(query, parameters or {})
-                records = [record.data() for record in result]
-                logger.debug(f"Query executed: {query[:100]}... returned {len(records)} records")
-                return records
+                records = session.execute_read(_read)
+            logger.debug(f"Read transaction executed: {query[:100]}... returned {len(records)} records")
+            return records
         except Neo4jError as e:
             logger.error(f"Query failed: {query[:100]}... Error: {e}")
             raise
 
-    def execute_write(
+    def execute_query_df(
+        self, query: str, parameters: dict | None = None, runtime: Runtime = "auto"
+    ) -> "pd.DataFrame":
+        """
+        Execute a read query and return the result as a pandas DataFrame.
+
+        The driver fills the frame column by column, skipping the per-row
+        dicts execute_query builds.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            runtime: Cypher runtime; "auto" uses slotted for short plain queries
+
+        Returns:
+            DataFrame with one column per returned key
+
+        Raises:
+            Neo4jError: If query execution fails
+        """
+        query = _with_runtime(query, runtime)
+        try:
+            if self._fast_path:
+                df = self.driver.execute_query(
+                    query,
+                    parameters or {},
+                    database_=self.database,
+                    routing_=RoutingControl.READ,
+                    result_transformer_=Result.to_df,
+                )
+            else:
+                df = self._session_run(query, parameters, Result.to_df)
+            logger.debug(f"Query executed: {query[:100]}... returned {len(df)} rows")
+            return df
+        except Neo4jError as e:
+            logger.error(f"Query failed: {query[:100]}... Error: {e}")
+            raise
+
+    @contextmanager
+    def iter_query(
         self, query: str, parameters: dict | None = None
+    ) -> Iterator[Iterator[dict[str, Any]]]:
+        """
+        Stream a read query's records instead of collecting them.
+
+        Records are fetched from the server as the caller iterates, so
+        memory stays flat for large results. The session stays open for
+        the duration of the with-block. Transient errors are retried until
+        the first record arrives, but not once the caller is consuming rows.
+
+        Usage:
+            with client.iter_query("MATCH (n) RETURN n.name AS name") as rows:
+                for row in rows:
+                    ...
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Iterator over result records as dictionaries
+
+        Raises:
+            Neo4jError: If query execution fails
+        """
+        try:
+            session, result = self._open_stream(query, parameters)
+            with session:
+                yield (record.data() for record in result)
+        except Neo4jError as e:
+            logger.error(f"Query failed: {query[:100]}... Error: {e}")
+            raise
+
+    @_retry_transient
+    def _session_run(
+        self, query: str, parameters: dict | None, transform: Callable[[Result], Any]
+    ) -> Any:
+        """
+        Run a query in an auto-commit transaction on its own session.
+
+        Used where driver-level execute_query is unavailable. Auto-commit
+        runs get no driver retries, so transient errors are retried here.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            transform: Turns the result into the return value while the
+                session is open
+
+        Returns:
+            transform's return value
+        """
+        with self.driver.session(database=self.database) as session:
+            return transform(session.run(query, parameters or {}))
+
+    @_retry_transient
+    def _open_stream(self, query: str, parameters: dict | None) -> tuple[Any, Result]:
+        """
+        Open a session and start a streaming query, retrying transient errors.
+
+        Peeks at the first record so connection and transient failures
+        surface here, before the caller has seen any rows.
+
+        Returns:
+            (open session, result); the caller closes the session
+        """
+        session = self.driver.session(database=self.database)
+        try:
+            result = session.run(query, parameters or {})
+            result.peek()
+        except BaseException:
+            session.close()
+            raise
+        return session, result
+
+    def paginate(
+        self,
+        match: str,
+        key_prop: str,
+        page_size: int = 1000,
+        parameters: dict | None = None,
+        returns: str = "n",
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Page through nodes in key order using keyset (seek) pagination.
+
+        Each page resumes after the last key seen (WHERE n.key > $last_key
+        ORDER BY n.key LIMIT $limit) instead of SKIP, so the server does
+        O(page) work per page rather than re-walking every earlier row.
+        With an index on key_prop the seek is an index range lookup. Keys
+        must be unique, or rows sharing a key across a page boundary are
+        skipped; nodes without the key are never returned.
+
+        Usage:
+            for page in client.paginate("MATCH (n:Company)", "ticker"):
+                ...
+
+        Args:
+            match: MATCH clause binding the paged node as `n`, with no
+                WHERE/RETURN (filter with a WITH ... WHERE, or a pattern)
+            key_prop: Unique, ordered property of n to page on
+            page_size: Rows per page
+            parameters: Extra query parameters used by match/returns
+            returns: RETURN expression list (default: the node)
+
+        Yields:
+            Lists of result records as dictionaries, at most page_size long
+        """
+        tail = f"RETURN n.{key_prop} AS _page_key, {returns} ORDER BY n.{key_prop} LIMIT $limit"
+        first_query = f"{match} WHERE n.{key_prop} IS NOT NULL {tail}"
+        next_query = f"{match} WHERE n.{key_prop} > $last_key {tail}"
+
+        params = {**(parameters or {}), "limit": page_size}
+        query = first_query
+        while True:
+            records = self.execute_query(query, params)
+            if not records:
+                return
+            params["last_key"] = records[-1]["_page_key"]
+            for record in records:
+                del record["_page_key"]
+            yield records
+            if len(records) < page_size:
+                return
+            query = next_query
+
+    def execute_write(
+        self, query: str, parameters: dict | None = None, runtime: Runtime = "auto"
     ) -> Any:
         """
         Execute a write query (CREATE, MERGE, DELETE, etc.).
@@ -117,25 +470,165 @@ class Neo4jClient:
         Args:
             query: Cypher query string
             parameters: Query parameters
+            runtime: Cypher runtime; "auto" uses slotted for short plain queries
         
         Returns:
-            Query result summary
+            Query result summary (ResultSummary)
         
         Raises:
             Neo4jError: If query execution fails
         """
+        query = _with_runtime(query, runtime)
+        try:
+            if self._fast_path:
+                _, summary, _ = self.driver.execute_query(
+                    query,
+                    parameters or {},
+                    database_=self.database,
+                    routing_=RoutingControl.WRITE,
+                )
+            else:
+                with self.driver.session(database=self.database) as session:
+                    def _run_query(tx):
+                        return tx.run(query, parameters or {}).consume()
+
+                    summary = session.execute_write(_run_query)
+            logger.debug(f"Write query executed: {query[:100]}...")
+            return summary
+        except Neo4jError as e:
+            logger.error(f"Write query failed: {query[:100]}... Error: {e}")
+            raise
+
+    def execute_write_batch(
+        self, statements: list[tuple[str, dict | None]]
+    ) -> list[Any]:
+        """
+        Execute several write queries in one managed write transaction.
+
+        The statements share one session and commit together, so either
+        all of them apply or none do. The driver retries the whole
+        transaction on transient errors.
+
+        Args:
+            statements: (Cypher query string, parameters) pairs, run in order
+
+        Returns:
+            Query result summaries (ResultSummary), one per statement
+
+        Raises:
+            Neo4jError: If any statement fails (nothing is committed)
+        """
+        def _run_all(tx):
+            return [tx.run(query, parameters or {}).consume() for query, parameters in statements]
+
         try:
             with self.driver.session(database=self.database) as session:
-                def _run_query(tx):
-                    return tx.run(query, parameters or {})
+                summaries = session.execute_write(_run_all)
+            logger.debug(f"Write transaction executed: {len(statements)} statements")
+            return summaries
+        except Neo4jError as e:
+            logger.error(f"Write transaction of {len(statements)} statements failed: {e}")
+            raise
+
+    def execute_autocommit(self, query: str, parameters: dict | None = None) -> Any:
+        """
+        Execute a write query in an auto-commit transaction.
 
-                result = session.execute_write(_run_query)
-                logger.debug(f"Write query executed: {query[:100]}...")
-                return result
+        Needed for statements that open their own transactions, such as
+        CALL { ... } IN TRANSACTIONS, which fail inside the managed
+        transactions execute_write uses. Not retried: a partial run has
+        already committed its earlier batches.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            Query result summary (ResultSummary)
+
+        Raises:
+            Neo4jError: If query execution fails
+        """
+        try:
+            with self.driver.session(database=self.database) as session:
+                summary = session.run(query, parameters or {}).consume()
+            logger.debug(f"Auto-commit query executed: {query[:100]}...")
+            return summary
         except Neo4jError as e:
-            logger.error(f"Write query failed: {query[:100]}... Error: {e}")
+            logger.error(f"Auto-commit query failed: {query[:100]}... Error: {e}")
             raise
 
+    def bulk_merge_nodes(
+        self,
+        label: str,
+        rows: list[dict[str, Any]],
+        key: str | None = None,
+        batch_size: int = 5000,
+    ) -> int:
+        """
+        MERGE many nodes of one label with one UNWIND statement per batch.
+
+        Each row is a property map; the node is matched on its key property
+        and every other property is copied onto it.
+
+        Args:
+            label: Node label
+            rows: Node property maps, each containing the key property
+            key: Property to merge on (default: NODE_KEYS, else "text")
+            batch_size: Rows per transaction
+
+        Returns:
+            Number of rows sent
+        """
+        key = key or NODE_KEYS.get(label, "text")
+        query = (
+            f"UNWIND $rows AS row "
+            f"MERGE (n:{label} {{{key}: row.{key}}}) "
+            f"SET n += row"
+        )
+        for start in range(0, len(rows), batch_size):
+            self.execute_write(query, {"rows": rows[start:start + batch_size]})
+        logger.debug(f"Merged {len(rows)} {label} nodes")
+        return len(rows)
+
+    def bulk_merge_relationships(
+        self,
+        from_label: str,
+        rel_type: str,
+        to_label: str,
+        pairs: list[dict[str, Any]],
+        batch_size: int = 5000,
+    ) -> int:
+        """
+        MERGE many relationships of one type with one UNWIND statement per batch.
+
+        Endpoints are matched on their labels' NODE_KEYS properties, so the
+        lookups go through the uniqueness constraints.
+
+        Args:
+            from_label: Start node label
+            rel_type: Relationship type
+            to_label: End node label
+            pairs: Dicts with "from" and "to" keys and optional "props"
+            batch_size: Pairs per transaction
+
+        Returns:
+            Number of pairs sent
+        """
+        from_key = NODE_KEYS.get(from_label, "text")
+        to_key = NODE_KEYS.get(to_label, "text")
+        query = (
+            f"UNWIND $pairs AS p "
+            f"MATCH (a:{from_label} {{{from_key}: p.from}}) "
+            f"MATCH (b:{to_label} {{{to_key}: p.to}}) "
+            f"MERGE (a)-[r:{rel_type}]->(b) "
+            f"SET r += coalesce(p.props, {{}})"
+        )
+        for start in range(0, len(pairs), batch_size):
+            self.execute_write(query, {"pairs": pairs[start:start + batch_size]})
+        logger.debug(f"Merged {len(pairs)} {from_label}-{rel_type}->{to_label} relationships")
+        return len(pairs)
+
     def create_indexes(self) -> None:
         """
         Create indexes for better query performance.
@@ -145,23 +638,19 @@ class Neo4jClient:
         so we skip those here.
         """
         indexes = [
-            "CREATE INDEX company_ticker IF NOT EXISTS FOR (c:Company) ON (c.ticker)",
-            "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
             "CREATE INDEX metric_concept IF NOT EXISTS FOR (m:FinancialMetric) ON (m.concept_name)",
             "CREATE INDEX section_type IF NOT EXISTS FOR (s:Section) ON (s.section_type)",
             "CREATE INDEX risk_category IF NOT EXISTS FOR (r:RiskFactor) ON (r.category)",
             "CREATE INDEX event_type IF NOT EXISTS FOR (e:Event) ON (e.event_type)",
         ]
+        # Property indexes need a label, so community lookups get one per label
+        indexes += [
+            f"CREATE INDEX {label.lower()}_community IF NOT EXISTS "
+            f"FOR (n:{label}) ON (n.community)"
+            for label in COMMUNITY_LABELS
+        ]
 
-        created = 0
-        for index_query in indexes:
-            try:
-                self.execute_write(index_query)
-                created += 1
-            except Neo4jError as e:
-                # Index might already exist, log but don't fail
-                logger.warning(f"Index creation failed (may already exist): {e}")
-
+        created = self._run_many(indexes, "Index")
         logger.info(f"Created/verified {created} indexes")
 
     def create_constraints(self) -> None:
@@ -170,26 +659,102 @@ class Neo4jClient:
         
         Ensures data integrity by enforcing uniqueness:
         - Company.cik must be unique
+        - Company.ticker must be unique
         - Filing.accession_number must be unique
+        - Person.name must be unique
+        - RiskFactor.hash must be unique
+
+        The ticker, accession number, name and hash constraints back the
+        index lookups GraphBuilder uses to match relationship endpoints.
+        Legacy range indexes on those keys are dropped first.
+
+        Raises:
+            DatabaseError: If existing duplicate key values would block a
+                business key constraint
         """
+        self._drop_legacy_key_indexes()
+        self._check_key_duplicates()
+
         constraints = [
             "CREATE CONSTRAINT company_cik_unique IF NOT EXISTS "
             "FOR (c:Company) REQUIRE c.cik IS UNIQUE",
-            "CREATE CONSTRAINT filing_accession_unique IF NOT EXISTS "
-            "FOR (f:Filing) REQUIRE f.accession_number IS UNIQUE",
+        ]
+        constraints += [
+            f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{key} IS UNIQUE"
+            for name, (label, key) in _KEY_CONSTRAINTS.items()
         ]
 
-        created = 0
-        for constraint_query in constraints:
-            try:
-                self.execute_write(constraint_query)
-                created += 1
-            except Neo4jError as e:
-                # Constraint might already exist, log but don't fail
-                logger.warning(f"Constraint creation failed (may already exist): {e}")
-
+        created = self._run_many(constraints, "Constraint")
         logger.info(f"Created/verified {created} constraints")
 
+    def _drop_legacy_key_indexes(self) -> None:
+        """Drop range indexes that would block the business key constraints."""
+        with self.driver.session(database=self.database) as session:
+            for name in _LEGACY_KEY_INDEXES:
+                try:
+                    summary = _consume(session, f"DROP INDEX {name} IF EXISTS")
+                except Neo4jError as e:
+                    logger.error(f"Could not drop legacy index {name}: {e}")
+                    raise
+                if summary.counters.indexes_removed:
+                    logger.info(f"Dropped legacy index {name}")
+
+    def _check_key_duplicates(self) -> None:
+        """
+        Make sure business key constraints about to be created can be.
+
+        Raises:
+            DatabaseError: If a label without its key constraint holds
+                duplicate key values
+        """
+        existing = {
+            record["name"]
+            for record in self.execute_query("SHOW CONSTRAINTS YIELD name RETURN name")
+        }
+        for name, (label, key) in _KEY_CONSTRAINTS.items():
+            if name in existing:
+                continue
+            record = self.execute_query(
+                f"MATCH (n:{label}) WHERE n.{key} IS NOT NULL "
+                f"WITH n.{key} AS value, count(*) AS copies WHERE copies > 1 "
+                "RETURN count(*) AS duplicated, collect(value)[..5] AS examples"
+            )[0]
+            if record["duplicated"]:
+                message = (
+                    f"Cannot create {name}: {record['duplicated']} {label}.{key} "
+                    "values occur on more than one node; merge or delete the "
+                    "duplicates first"
+                )
+                logger.error(f"{message} (e.g. {record['examples']})")
+                raise DatabaseError(message, {"examples": record["examples"]})
+
+    def _run_many(self, queries: list[str], kind: str) -> int:
+        """
+        Run schema statements one after another on a single session.
+
+        Each statement still runs in its own auto-commit transaction (Neo4j
+        does not mix schema changes in one), but they share one pooled
+        connection instead of checking out a session each. Transient errors
+        are retried per statement.
+
+        Args:
+            queries: DDL statements
+            kind: What the statements create, for warnings
+
+        Returns:
+            Number of statements that succeeded
+        """
+        succeeded = 0
+        with self.driver.session(database=self.database) as session:
+            for query in queries:
+                try:
+                    _consume(session, query)
+                    succeeded += 1
+                except Neo4jError as e:
+                    # Might already exist, log but don't fail
+                    logger.warning(f"{kind} creation failed (may already exist): {e}")
+        return succeeded
+
     def verify_connection(self) -> bool:
         """
         Test database connection.
@@ -198,7 +763,7 @@ class Neo4jClient:
             True if connection is healthy, False otherwise
         """
         try:
-            result = self.execute_query("RETURN 1 as test")
+            result = self.execute_query("RETURN 1 as test", runtime="slotted")
             success = result[0]["test"] == 1
             if success:
                 logger.info("Neo4j connection verified")
@@ -218,34 +783,19 @@ class Neo4jClient:
             # Get Neo4j version
             version_result = self.execute_query("CALL dbms.components() YIELD name, versions RETURN name, versions")
 
-            # Get node counts by label
-            label_counts = self.execute_query(
-                """
-                CALL db.labels() YIELD label
-                CALL apoc.cypher.run(
-                    'MATCH (n:`' + label + '`) RETURN count(n) as count', 
-                    {}
-                ) YIELD value
-                RETURN label, value.count as count
-                """
-            )
-
-            # Get relationship counts by type
-            rel_counts = self.execute_query(
-                """
-                CALL db.relationshipTypes() YIELD relationshipType
-                CALL apoc.cypher.run(
-                    'MATCH ()-[r:`' + relationshipType + '`]->() RETURN count(r) as count', 
-                    {}
-                ) YIELD value
-                RETURN relationshipType, value.count as count
-                """
-            )
+            # Label and relationship-type counts from the count store, in one call
+            stats = self.execute_query(
+                "CALL apoc.meta.stats() "
+                "YIELD labels, relTypesCount, nodeCount, relCount "
+                "RETURN labels, relTypesCount, nodeCount, relCount"
+            )[0]
 
             return {
                 "version": version_result[0] if version_result else "unknown",
-                "node_counts": {r["label"]: r["count"] for r in label_counts},
-                "relationship_counts": {r["relationshipType"]: r["count"] for r in rel_counts},
+                "total_nodes": stats["nodeCount"],
+                "total_relationships": stats["relCount"],
+                "node_counts": stats["labels"],
+                "relationship_counts": stats["relTypesCount"],
             }
         except Exception as e:
             logger.warning(f"Could not retrieve database info: {e}")
@@ -282,14 +832,64 @@ class Neo4jClient:
         batch_size = 10000
         deleted = 0
 
+        try:
+            # Batches run inside the server, several at once; periodic.iterate
+            # opens its own transactions, so call it in an auto-commit one
+            with self.driver.session(database=self.database) as session:
+                record = session.run(
+                    "CALL apoc.periodic.iterate("
+                    "'MATCH (n) RETURN n', 'DETACH DELETE n', "
+                    "{batchSize: $batch_size, parallel: true, concurrency: 8}) "
+                    "YIELD batches, committedOperations, failedBatches "
+                    "RETURN batches, committedOperations, failedBatches",
+                    {"batch_size": batch_size},
+                ).single()
+            deleted = record["committedOperations"]
+            if not record["failedBatches"]:
+                logger.warning(
+                    f"Database cleared: {deleted} nodes deleted in {record['batches']} batches"
+                )
+                return
+            # Parallel batches can deadlock on shared relationships; the loop
+            # below removes whatever they left behind
+            logger.warning(f"{record['failedBatches']} delete batches failed, retrying serially")
+        except Neo4jError as e:
+            if "Unknown procedure" not in str(e) and "no procedure" not in str(e).lower():
+                raise
+            logger.info("apoc.periodic.iterate unavailable, deleting in a loop")
+
         while True:
-            result = self.execute_write(
-                f"MATCH (n) WITH n LIMIT {batch_size} DETACH DELETE n RETURN count(n) as deleted"
+            summary = self.execute_write(
+                f"MATCH (n) WITH n LIMIT {batch_size} DETACH DELETE n"
             )
-            batch_deleted = result.value()[0] if result else 0
+            batch_deleted = summary.counters.nodes_deleted
             deleted += batch_deleted
 
             if batch_deleted == 0:
                 break
 
         logger.warning(f"Database cleared: {deleted} nodes deleted")
+
+
+def _with_runtime(query: str, runtime: Runtime) -> str:
+    """
+    Prefix a query with a CYPHER runtime option.
+
+    Args:
+        query: Cypher query string
+        runtime: "slotted"/"pipelined" to force a runtime, "auto" to use
+            slotted for short queries that accept the option
+
+    Returns:
+        The query, prefixed when a runtime applies
+    """
+    if _NO_RUNTIME_HINT.search(query):
+        return query
+    if runtime == "auto":
+        if len(query) >= _AUTO_SLOTTED_MAX_LEN:
+            return query
+        runtime = "slotted"
+    return f"CYPHER runtime={runtime} {query}"
+
+
+atexit.register(Neo4jClient.shutdown_all)
@@ -1,161 +1,214 @@
 """
-Graph schema definitions using Pydantic.
+Graph schema definitions using slotted dataclasses.
 
 Defines 8 node types and 12 relationship types for SEC filing data:
 - Company, Person, Filing, Section, FinancialMetric, RiskFactor, BusinessSegment, Event
 - Relationships connect these nodes to represent filing structure and business relationships
+
+Models are frozen, slotted dataclasses: bulk ingest builds them by the
+thousand from already-typed extraction output, so they skip per-instance
+dicts and only check required field types and declared ranges rather than
+coercing values. to_dict() gives the Neo4j properties; model_validate()
+and model_dump() keep the earlier BaseModel API, aliases included.
 """
 
 from __future__ import annotations
 
+from dataclasses import MISSING, asdict, dataclass, field, fields
 from datetime import date
+from functools import cache
+from typing import Any
+
+# Runtime types for the annotations used by required fields
+_FIELD_TYPES: dict[str, type | tuple[type, ...]] = {
+    "str": str,
+    "int": int,
+    "float": (int, float),
+    "date": date,
+    "dict": dict,
+}
+
+
+@cache
+def _required_fields(cls: type) -> tuple[tuple[str, str, type | tuple[type, ...]], ...]:
+    """(name, annotation, runtime type) of a model's checkable fields without a default."""
+    return tuple(
+        (f.name, f.type, _FIELD_TYPES[f.type])
+        for f in fields(cls)
+        if f.default is MISSING and f.default_factory is MISSING and f.type in _FIELD_TYPES
+    )
+
+
+class _NodeMixin:
+    """Shared validation and serialization for node and relationship models."""
+
+    __slots__ = ()
+
+    # Stored property name -> field name, for fields stored under another name
+    _ALIASES: dict[str, str] = {}
+    # Field name -> inclusive (low, high) bounds
+    _RANGES: dict[str, tuple[int, int]] = {}
+
+    def __post_init__(self) -> None:
+        """Check required field types and declared ranges."""
+        cls = type(self)
+        for name, annotation, expected in _required_fields(cls):
+            value = getattr(self, name)
+            if not isinstance(value, expected):
+                raise ValueError(
+                    f"{cls.__name__}.{name} must be {annotation}, got {type(value).__name__}"
+                )
+        for name, (low, high) in self._RANGES.items():
+            value = getattr(self, name)
+            if not low <= value <= high:
+                raise ValueError(f"{name} must be between {low} and {high}, got {value}")
+
+    @classmethod
+    def model_validate(cls, data: dict[str, Any]) -> Any:
+        """Build a model from a dict keyed by field names or their aliases."""
+        fields_by_alias = cls._ALIASES
+        return cls(**{fields_by_alias.get(key, key): value for key, value in data.items()})
+
+    def model_dump(self, by_alias: bool = False) -> dict[str, Any]:
+        """Convert to a dict keyed by field names, or by aliases if by_alias."""
+        return self.to_dict() if by_alias else asdict(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a property dictionary for Neo4j query parameters."""
+        props = asdict(self)
+        for alias, name in self._ALIASES.items():
+            props[alias] = props.pop(name)
+        return props
 
-from pydantic import BaseModel, Field
 
 # =============================================================================
 # Node Models (8 required)
 # =============================================================================
 
 
-class CompanyNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CompanyNode(_NodeMixin):
     """
     Company entity node.
     
     Represents a public company that files with the SEC.
     """
 
-    cik: str = Field(..., description="Central Index Key (unique identifier)")
-    name: str = Field(..., description="Official company name")
-    ticker: str = Field(..., description="Stock ticker symbol")
-    sector: str | None = Field(default=None, description="Business sector")
-    sic_code: str | None = Field(default=None, description="Standard Industrial Classification code")
-    fiscal_year_end: str | None = Field(
-        default=None, description="Fiscal year end (MMDD format)"
-    )
+    cik: str  # Central Index Key (unique identifier)
+    name: str  # Official company name
+    ticker: str  # Stock ticker symbol
+    sector: str | None = None  # Business sector
+    sic_code: str | None = None  # Standard Industrial Classification code
+    fiscal_year_end: str | None = None  # Fiscal year end (MMDD format)
 
 
-class PersonNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PersonNode(_NodeMixin):
     """
     Person entity node (executives, directors, key management).
     
     Represents individuals mentioned in SEC filings.
     """
 
-    name: str = Field(..., description="Full name")
-    role: str = Field(..., description="Position/title (CEO, CFO, Director, etc.)")
-    tenure_start: date | None = Field(default=None, description="Start date of tenure")
-    tenure_end: date | None = Field(default=None, description="End date of tenure (if no longer active)")
-    aliases: list[str] = Field(
-        default_factory=list, description="Name variations and aliases"
-    )
+    name: str  # Full name
+    role: str  # Position/title (CEO, CFO, Director, etc.)
+    tenure_start: date | None = None  # Start date of tenure
+    tenure_end: date | None = None  # End date of tenure (if no longer active)
+    aliases: list[str] = field(default_factory=list)  # Name variations and aliases
 
 
-class FilingNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FilingNode(_NodeMixin):
     """
     SEC filing document node.
     
     Represents a single filing (10-K, 10-Q, etc.).
     """
 
-    accession_number: str = Field(..., description="Unique SEC accession number")
-    form_type: str = Field(..., description="Form type (10-K, 10-Q, 8-K, etc.)")
-    filing_date: date = Field(..., description="Date filed with SEC")
-    fiscal_period: str | None = Field(
-        default=None, description="Fiscal period (FY, Q1, Q2, Q3, Q4)"
-    )
-    document_count: int = Field(default=0, description="Number of documents in filing")
+    accession_number: str  # Unique SEC accession number
+    form_type: str  # Form type (10-K, 10-Q, 8-K, etc.)
+    filing_date: date  # Date filed with SEC
+    fiscal_period: str | None = None  # Fiscal period (FY, Q1, Q2, Q3, Q4)
+    document_count: int = 0  # Number of documents in filing
 
 
-class SectionNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SectionNode(_NodeMixin):
     """
     Filing section node.
     
     Represents a specific section within a filing (Item 1, Item 1A, etc.).
     """
 
-    section_type: str = Field(
-        ..., description="Section identifier (item_1, item_1a, item_7, etc.)"
-    )
-    content_summary: str | None = Field(
-        default=None, description="Brief summary of section content"
-    )
-    word_count: int = Field(default=0, description="Word count of section")
-    markdown_hash: str | None = Field(
-        default=None, description="Hash of markdown content for deduplication"
-    )
+    section_type: str  # Section identifier (item_1, item_1a, item_7, etc.)
+    content_summary: str | None = None  # Brief summary of section content
+    word_count: int = 0  # Word count of section
+    markdown_hash: str | None = None  # Hash of markdown content for deduplication
 
 
-class FinancialMetricNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FinancialMetricNode(_NodeMixin):
     """
     Financial metric/fact node.
     
     Represents a single financial data point extracted from XBRL.
     """
 
-    concept_name: str = Field(..., description="XBRL concept name (e.g., Revenue, Assets)")
-    value: float = Field(..., description="Numeric value")
-    unit: str = Field(..., description="Unit of measurement (USD, shares, etc.)")
-    period_start: date | None = Field(default=None, description="Period start date")
-    period_end: date | None = Field(default=None, description="Period end date")
-    context_ref: str | None = Field(
-        default=None, description="XBRL context reference for traceability"
-    )
+    concept_name: str  # XBRL concept name (e.g., Revenue, Assets)
+    value: float  # Numeric value
+    unit: str  # Unit of measurement (USD, shares, etc.)
+    period_start: date | None = None  # Period start date
+    period_end: date | None = None  # Period end date
+    context_ref: str | None = None  # XBRL context reference for traceability
 
 
-class RiskFactorNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RiskFactorNode(_NodeMixin):
     """
     Risk factor node.
     
     Represents a risk disclosed in Item 1A.
     """
 
-    category: str = Field(
-        ..., description="Risk category (operational, financial, regulatory, etc.)"
-    )
-    severity: int = Field(..., ge=1, le=5, description="Severity rating (1=low, 5=critical)")
-    description: str = Field(..., description="Risk description text")
-    first_mentioned_date: date | None = Field(
-        default=None, description="First date this risk appeared in filings"
-    )
+    category: str  # Risk category (operational, financial, regulatory, etc.)
+    severity: int  # Severity rating (1=low, 5=critical)
+    description: str  # Risk description text
+    first_mentioned_date: date | None = None  # First date this risk appeared in filings
 
+    _RANGES = {"severity": (1, 5)}
 
-class BusinessSegmentNode(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class BusinessSegmentNode(_NodeMixin):
     """
     Business segment node.
     
     Represents a business unit, product line, or geographic segment.
     """
 
-    name: str = Field(..., description="Segment name")
-    revenue: float | None = Field(default=None, description="Segment revenue (USD)")
-    geography: str | None = Field(
-        default=None, description="Geographic region (if geographic segment)"
-    )
-    product_line: str | None = Field(
-        default=None, description="Product/service line (if product segment)"
-    )
+    name: str  # Segment name
+    revenue: float | None = None  # Segment revenue (USD)
+    geography: str | None = None  # Geographic region (if geographic segment)
+    product_line: str | None = None  # Product/service line (if product segment)
 
 
-class EventNode(BaseModel):
+@dataclass(slots=True, frozen=True)
+class EventNode(_NodeMixin):
     """
     Business event node.
     
     Represents significant events (acquisitions, restructuring, lawsuits, etc.).
+    event_type and event_date are aliased to the "type" and "date"
+    properties they are stored as.
     """
 
-    event_type: str = Field(
-        ...,
-        description="Event type (acquisition, divestiture, lawsuit, restructuring, etc.)",
-        alias="type",
-    )
-    event_date: date = Field(..., description="Event date", alias="date")
-    description: str = Field(..., description="Event description")
-    impact: str | None = Field(
-        default=None, description="Business impact assessment (positive, negative, neutral)"
-    )
-    related_entities: list[str] = Field(
-        default_factory=list, description="Names of other entities involved"
-    )
+    event_type: str  # Event type (acquisition, divestiture, lawsuit, restructuring, etc.)
+    event_date: date  # Event date
+    description: str  # Event description
+    impact: str | None = None  # Business impact assessment (positive, negative, neutral)
+    related_entities: list[str] = field(default_factory=list)  # Names of other entities involved
+
+    _ALIASES = {"type": "event_type", "date": "event_date"}
 
 
 # =============================================================================
@@ -163,7 +216,8 @@ class EventNode(BaseModel):
 # =============================================================================
 
 
-class Relationship(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Relationship(_NodeMixin):
     """
     Generic relationship model for graph edges.
     
@@ -182,14 +236,10 @@ class Relationship(BaseModel):
     12. AFFECTS: RiskFactor -> BusinessSegment
     """
 
-    from_node: str = Field(..., description="Source node ID or label")
-    to_node: str = Field(..., description="Target node ID or label")
-    relationship_type: str = Field(
-        ..., description="Relationship type (FILED, HAS_EXECUTIVE, etc.)"
-    )
-    properties: dict = Field(
-        default_factory=dict, description="Additional relationship properties"
-    )
+    from_node: str  # Source node ID or label
+    to_node: str  # Target node ID or label
+    relationship_type: str  # Relationship type (FILED, HAS_EXECUTIVE, etc.)
+    properties: dict = field(default_factory=dict)  # Additional relationship properties
 
 
 # =============================================================================
@@ -7,15 +7,29 @@ capturing themes, companies, and time periods.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from collections import Counter
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
-from src.graph.graph_connector import Neo4jClient
+from src.graph.graph_connector import COMMUNITY_LABELS, Neo4jClient
 from src.infrastructure.logger import get_logger
 
+try:
+    # C JSON codec for model responses and stored summaries
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        """Serialize to a JSON str (Neo4j stores the summary as a string)."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = get_logger("finloom.graph.summarization")
 
 _DEEPSEEK_BASE_URL = "https://api.deepseek.com"
@@ -23,6 +37,47 @@ _DEFAULT_MODEL = "deepseek-chat"
 
 # Keys to extract from Neo4j node properties for summarization
 _NODE_DISPLAY_KEYS = ("name", "ticker", "concept_name", "category", "section_type", "description")
+_DISPLAY_KEY_SET = frozenset(_NODE_DISPLAY_KEYS)
+
+# Longer string property values are cut to this many characters in the prompt
+_TRUNC_LEN = 120
+_TRUNC_SUFFIX = "..."
+
+# Summarization prompt, filled per community with format_map
+_PROMPT_TEMPLATE = """Summarize this cluster of financial entities from SEC filings.
+
+Community ID: {community_id}
+Total nodes: {node_count}
+Node type distribution: {type_dist}
+{rel_section}
+Sample nodes:
+{node_descriptions}
+
+Return a JSON object with these fields:
+{{
+  "title": "Short descriptive title (max 10 words)",
+  "description": "2-3 sentence summary of what connects these entities",
+  "themes": ["theme1", "theme2", "theme3"],
+  "time_period": "YYYY-YYYY or null if not identifiable",
+  "companies": ["TICKER1", "TICKER2"] or []
+}}"""
+
+# Summary write-back, one statement per community label so each MATCH
+# can use that label's community index
+_SAVE_SUMMARY_QUERIES = tuple(
+    f"UNWIND $rows AS row "
+    f"MATCH (n:{label}) WHERE n.community = row.cid "
+    f"SET n.community_summary = row.js"
+    for label in COMMUNITY_LABELS
+)
+
+
+def _summary_rows(summaries: list[dict]) -> list[dict]:
+    """Turn summaries into (community id, JSON) rows for the UNWIND writes."""
+    return [
+        {"cid": summary["community_id"], "js": _json_dumps(summary)}
+        for summary in summaries
+    ]
 
 
 class CommunitySummarizer:
@@ -49,6 +104,7 @@ class CommunitySummarizer:
             )
 
         self.client = OpenAI(api_key=resolved_key, base_url=base_url)
+        self.aclient = AsyncOpenAI(api_key=resolved_key, base_url=base_url)
         self.model = model
         logger.info(f"CommunitySummarizer initialized (model={model}, base_url={base_url})")
 
@@ -69,56 +125,82 @@ class CommunitySummarizer:
         Returns:
             Summary dict with title, description, themes, time_period, companies, member_count
         """
-        type_dist = self._get_node_type_distribution(nodes)
-        node_descriptions = self._format_nodes(nodes, max_nodes=30)
+        prompt = self._build_prompt(community_id, nodes, relationships)
 
-        rel_section = ""
-        if relationships:
-            rel_lines = [f"  - {r['rel_type']}: {r['count']}" for r in relationships[:10]]
-            rel_section = f"\nRelationship types:\n" + "\n".join(rel_lines)
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                temperature=0.3,
+            )
+            return self._parse_response(response, community_id, nodes)
 
-        prompt = f"""Summarize this cluster of financial entities from SEC filings.
+        except Exception as e:
+            logger.error(f"Summarization failed for community {community_id}: {e}")
+            return self._fallback_summary(community_id, nodes, e)
 
-Community ID: {community_id}
-Total nodes: {len(nodes)}
-Node type distribution: {type_dist}
-{rel_section}
-Sample nodes:
-{node_descriptions}
+    async def summarize_many(
+        self,
+        items: list[tuple[int, list[dict], list[dict] | None]],
+        concurrency: int = 16,
+    ) -> list[dict]:
+        """
+        Summarize many communities with overlapping API requests.
 
-Return a JSON object with these fields:
-{{
-  "title": "Short descriptive title (max 10 words)",
-  "description": "2-3 sentence summary of what connects these entities",
-  "themes": ["theme1", "theme2", "theme3"],
-  "time_period": "YYYY-YYYY or null if not identifiable",
-  "companies": ["TICKER1", "TICKER2"] or []
-}}"""
+        Args:
+            items: (community_id, nodes, relationships) per community
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Summary dicts in the order of items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(community_id, nodes, relationships):
+            async with semaphore:
+                return await self._summarize_one(community_id, nodes, relationships)
+
+        return await asyncio.gather(*(_bounded(*item) for item in items))
+
+    def summarize_many_sync(
+        self,
+        items: list[tuple[int, list[dict], list[dict] | None]],
+        concurrency: int = 16,
+    ) -> list[dict]:
+        """
+        Blocking wrapper around summarize_many for synchronous callers.
+
+        Args:
+            items: (community_id, nodes, relationships) per community
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Summary dicts in the order of items
+        """
+        return asyncio.run(self.summarize_many(items, concurrency))
+
+    async def _summarize_one(
+        self,
+        community_id: int,
+        nodes: list[dict],
+        relationships: list[dict] | None = None,
+    ) -> dict:
+        """Async counterpart of summarize_community."""
+        prompt = self._build_prompt(community_id, nodes, relationships)
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 response_format={"type": "json_object"},
                 temperature=0.3,
             )
-
-            summary = json.loads(response.choices[0].message.content)
-            summary["community_id"] = community_id
-            summary["member_count"] = len(nodes)
-            return summary
+            return self._parse_response(response, community_id, nodes)
 
         except Exception as e:
             logger.error(f"Summarization failed for community {community_id}: {e}")
-            return {
-                "community_id": community_id,
-                "title": f"Community {community_id}",
-                "description": f"Summary generation failed: {e}",
-                "themes": [],
-                "time_period": None,
-                "companies": [],
-                "member_count": len(nodes),
-            }
+            return self._fallback_summary(community_id, nodes, e)
 
     def save_summary(
         self, neo4j_client: Neo4jClient, community_id: int, summary: dict
@@ -139,38 +221,116 @@ Return a JSON object with these fields:
             query,
             {
                 "community_id": community_id,
-                "summary_json": json.dumps(summary),
+                "summary_json": _json_dumps(summary),
             },
         )
 
+    def save_summaries(self, neo4j_client: Neo4jClient, summaries: list[dict]) -> None:
+        """
+        Persist many community summaries in a single write transaction.
+
+        One batched write per label, so each matches through that label's
+        community index instead of scanning every node. All writes share
+        one session and commit once: either every summary lands or none do.
+
+        Args:
+            neo4j_client: Neo4j client
+            summaries: Summary dicts, each carrying its community_id
+        """
+        rows = _summary_rows(summaries)
+        if not rows:
+            return
+
+        neo4j_client.execute_write_batch(
+            [(query, {"rows": rows}) for query in _SAVE_SUMMARY_QUERIES]
+        )
+        logger.info(f"Saved {len(rows)} community summaries to Neo4j")
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _build_prompt(
+        self,
+        community_id: int,
+        nodes: list[dict],
+        relationships: list[dict] | None,
+    ) -> str:
+        """Build the summarization prompt for one community."""
+        type_dist, node_descriptions = self._analyze_nodes(nodes, max_nodes=30)
+
+        rel_section = ""
+        if relationships:
+            rel_section = "\nRelationship types:\n" + "\n".join(
+                f"  - {r['rel_type']}: {r['count']}" for r in relationships[:10]
+            )
+
+        return _PROMPT_TEMPLATE.format_map(
+            {
+                "community_id": community_id,
+                "node_count": len(nodes),
+                "type_dist": type_dist,
+                "rel_section": rel_section,
+                "node_descriptions": node_descriptions,
+            }
+        )
+
     @staticmethod
-    def _format_nodes(nodes: list[dict], max_nodes: int = 30) -> str:
-        """Format node list for the LLM prompt."""
+    def _parse_response(response, community_id: int, nodes: list[dict]) -> dict:
+        """Decode the model's JSON answer and attach community metadata."""
+        summary = _json_loads(response.choices[0].message.content)
+        summary["community_id"] = community_id
+        summary["member_count"] = len(nodes)
+        return summary
+
+    @staticmethod
+    def _fallback_summary(community_id: int, nodes: list[dict], error: Exception) -> dict:
+        """Placeholder summary for a community whose request failed."""
+        return {
+            "community_id": community_id,
+            "title": f"Community {community_id}",
+            "description": f"Summary generation failed: {error}",
+            "themes": [],
+            "time_period": None,
+            "companies": [],
+            "member_count": len(nodes),
+        }
+
+    @staticmethod
+    def _analyze_nodes(nodes: list[dict], max_nodes: int = 30) -> tuple[dict[str, int], str]:
+        """
+        Count node types and format the prompt's sample nodes in one pass.
+
+        Args:
+            nodes: Community member nodes
+            max_nodes: Number of nodes to list in the prompt
+
+        Returns:
+            (node type distribution, formatted node lines)
+        """
+        types: Counter[str] = Counter()
         lines = []
-        for node in nodes[:max_nodes]:
-            node_type = node.get("types", ["Unknown"])[0]
-            props = CommunitySummarizer._extract_display_props(node.get("n", {}))
-            lines.append(f"- {node_type}: {props}")
-        return "\n".join(lines)
+        for i, node in enumerate(nodes):
+            node_type = (node.get("types") or ("Unknown",))[0]
+            types[node_type] += 1
+            if i < max_nodes:
+                props = CommunitySummarizer._extract_display_props(node.get("n", {}))
+                lines.append(f"- {node_type}: {props}")
+        return dict(types), "\n".join(lines)
 
     @staticmethod
     def _extract_display_props(node_props: dict) -> str:
         """Extract human-readable properties from a node."""
+        present = node_props.keys() & _DISPLAY_KEY_SET
+        if not present:
+            return str(node_props)[:80]
+
         parts = []
+        # Walk the tuple, not the set, to keep display order stable
         for key in _NODE_DISPLAY_KEYS:
-            if key in node_props:
+            if key in present:
                 val = node_props[key]
-                if isinstance(val, str) and len(val) > 120:
-                    val = val[:120] + "..."
+                if isinstance(val, str) and len(val) > _TRUNC_LEN:
+                    val = val[:_TRUNC_LEN] + _TRUNC_SUFFIX
                 parts.append(f"{key}={val}")
-        return ", ".join(parts) if parts else str(node_props)[:80]
-
-    @staticmethod
-    def _get_node_type_distribution(nodes: list[dict]) -> dict[str, int]:
-        """Count node types in a community."""
-        types = [node.get("types", ["Unknown"])[0] for node in nodes]
-        return dict(Counter(types))
+        return ", ".join(parts)
@@ -6,18 +6,206 @@ Supports importing key financial concepts or all facts.
 
 from __future__ import annotations
 
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from neo4j.exceptions import Neo4jError, TransientError
+
 from src.graph.graph_connector import Neo4jClient
-from src.storage.database import Database
 from src.infrastructure.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.storage.database import Database
+
 logger = get_logger("finloom.graph.xbrl_importer")
 
+# Fact columns, in the facts query's order
+_FACT_COLUMNS = (
+    "accession_number",
+    "concept_name",
+    "value",
+    "unit",
+    "period_start",
+    "period_end",
+)
+
+# Batch create from parallel column lists: one Filing lookup per run of
+# rows sharing an accession number ($starts/$ends), then its facts
+_BATCH_QUERY = """
+UNWIND range(0, size($starts) - 1) AS run
+MATCH (f:Filing {accession_number: $accession_number[$starts[run]]})
+UNWIND range($starts[run], $ends[run] - 1) AS i
+CREATE (m:FinancialMetric {
+    concept_name: $concept_name[i],
+    value: $value[i],
+    unit: $unit[i],
+    period_start: date($period_start[i]),
+    period_end: date($period_end[i])
+})
+CREATE (f)-[:REPORTS_METRIC]->(m)
+"""
+
+# Single-fact create, used when a batch keeps failing
+_SINGLE_QUERY = """
+MATCH (f:Filing {accession_number: $accession_number})
+CREATE (m:FinancialMetric {
+    concept_name: $concept_name,
+    value: $value,
+    unit: $unit,
+    period_start: date($period_start),
+    period_end: date($period_end)
+})
+CREATE (f)-[:REPORTS_METRIC]->(m)
+"""
+
+# Rows per server-side transaction for LOAD CSV
+_LOAD_CSV_TX_ROWS = 50_000
+
+# Online bulk load of a facts CSV from Neo4j's import directory; the server
+# reads the file and commits every _LOAD_CSV_TX_ROWS rows itself. The batch
+# size is inlined so the statement does not rely on the server version
+# accepting a parameter in IN TRANSACTIONS OF.
+_LOAD_CSV_QUERY = f"""
+LOAD CSV WITH HEADERS FROM $url AS row
+CALL {{
+    WITH row
+    MATCH (f:Filing {{accession_number: row.accession_number}})
+    CREATE (m:FinancialMetric {{
+        concept_name: row.concept_name,
+        value: toFloat(row.value),
+        unit: row.unit,
+        period_start: date(row.period_start),
+        period_end: date(row.period_end)
+    }})
+    CREATE (f)-[:REPORTS_METRIC]->(m)
+}} IN TRANSACTIONS OF {_LOAD_CSV_TX_ROWS} ROWS
+"""
+
+# Below this many facts, the CSV round trip is not worth it and
+# import_facts_bulk uses the Bolt path
+_BULK_MIN_ROWS = 100_000
+
+# Schema the import relies on; names match Neo4jClient's, so an existing
+# equivalent index or constraint is recognized rather than duplicated
+_REQUIRED_SCHEMA = (
+    "CREATE CONSTRAINT filing_accession_unique IF NOT EXISTS "
+    "FOR (f:Filing) REQUIRE f.accession_number IS UNIQUE",
+    "CREATE INDEX metric_concept IF NOT EXISTS "
+    "FOR (m:FinancialMetric) ON (m.concept_name)",
+)
+
+# Facts per UNWIND transaction; FINLOOM_XBRL_BATCH_SIZE overrides
+_DEFAULT_BATCH_SIZE = 10_000
+
+# Facts query from DuckDB, already shaped as Cypher parameters: numeric
+# values as DOUBLE, ISO date strings, default unit. Unordered, so rows
+# stream as soon as the scan produces them
+_FACTS_QUERY = """
+    SELECT
+        f.accession_number,
+        f.concept_name,
+        TRY_CAST(f.value AS DOUBLE) AS value,
+        COALESCE(f.unit, 'USD') AS unit,
+        strftime(f.period_start, '%Y-%m-%d') AS period_start,
+        strftime(f.period_end, '%Y-%m-%d') AS period_end
+    FROM facts f
+    WHERE TRY_CAST(f.value AS DOUBLE) IS NOT NULL
+    {concept_filter}
+"""
+_ALL_FACTS_QUERY = _FACTS_QUERY.format(concept_filter="")
+# Concept list is bound as a parameter, so the statement text never changes
+_KEY_FACTS_QUERY = _FACTS_QUERY.format(
+    concept_filter="AND f.concept_name IN (SELECT UNNEST(?))"
+)
+
+
+def _run_starts(accessions: pa.Array) -> list[int]:
+    """
+    Find where each run of equal accession numbers begins.
+
+    Args:
+        accessions: Accession number column of a sorted record batch
+
+    Returns:
+        Row offsets of run starts
+    """
+    size = len(accessions)
+    if size < 2:
+        return list(range(size))
+    changed = pc.not_equal(accessions.slice(1), accessions.slice(0, size - 1))
+    return [0, *pc.add(pc.indices_nonzero(changed), 1).to_pylist()]
+
+
+def _shard_batch(record_batch: pa.RecordBatch, shards: int) -> list[pa.RecordBatch | None]:
+    """
+    Split a record batch by filing into one sorted batch per shard.
+
+    All rows of a filing land in the same shard, so shards never write to
+    the same Filing node.
+
+    Args:
+        record_batch: Fact rows from DuckDB
+        shards: Number of shards
+
+    Returns:
+        Per shard, its rows sorted by accession number, or None if it got none
+    """
+    record_batch = record_batch.sort_by("accession_number")
+    if shards == 1:
+        return [record_batch]
+
+    accessions = record_batch.column("accession_number")
+    starts = _run_starts(accessions)
+    ends = starts[1:] + [len(record_batch)]
+    rows: list[list[int]] = [[] for _ in range(shards)]
+    for start, end in zip(starts, ends, strict=True):
+        # str hashes are salted per process; routing only needs them stable
+        # within this import
+        rows[hash(accessions[start].as_py()) % shards].extend(range(start, end))
+    return [
+        record_batch.take(pa.array(indices, pa.int64())) if indices else None
+        for indices in rows
+    ]
+
+
+def _batch_columns(batches: list[pa.RecordBatch]) -> tuple[dict[str, list], list[int]]:
+    """
+    Merge buffered record batches into Cypher column lists.
+
+    Args:
+        batches: Non-empty record batches of one shard
+
+    Returns:
+        Column lists sorted by accession number, and their run starts
+    """
+    table = pa.Table.from_batches(batches).sort_by("accession_number").combine_chunks()
+    # Columns go to Neo4j as they are; no per-row dicts
+    columns = {name: table.column(name).to_pylist() for name in _FACT_COLUMNS}
+    return columns, _run_starts(table.column("accession_number").chunk(0))
+
+
+def _slice_columns(columns: dict[str, list], start: int, stop: int) -> dict[str, list]:
+    """Take rows [start, stop) of a column batch."""
+    return {name: values[start:stop] for name, values in columns.items()}
+
+
+def _sql_string(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
 
 class XBRLImporter:
     """Import XBRL financial facts to Neo4j graph."""
 
     # Key financial concepts (most important metrics)
-    KEY_CONCEPTS = [
+    KEY_CONCEPTS = (
         "us-gaap:Revenue",
         "us-gaap:Revenues",
         "us-gaap:NetIncomeLoss",
@@ -28,19 +216,35 @@ class XBRLImporter:
         "us-gaap:EarningsPerShareDiluted",
         "us-gaap:OperatingIncomeLoss",
         "us-gaap:CashAndCashEquivalentsAtCarryingValue",
-    ]
+    )
 
-    def __init__(self, neo4j_client: Neo4jClient, duckdb: Database):
+    def __init__(
+        self,
+        neo4j_client: Neo4jClient,
+        duckdb: Database,
+        batch_size: int | None = None,
+        workers: int = 4,
+    ):
         """
         Initialize XBRL importer.
 
         Args:
             neo4j_client: Neo4j client instance
             duckdb: DuckDB database instance
+            batch_size: Facts per Neo4j transaction (default:
+                FINLOOM_XBRL_BATCH_SIZE, else 10,000)
+            workers: Concurrent Neo4j writers, each owning a disjoint set
+                of filings
         """
         self.neo4j = neo4j_client
         self.duckdb = duckdb
-        logger.info("XBRLImporter initialized")
+        self.batch_size = batch_size or int(
+            os.getenv("FINLOOM_XBRL_BATCH_SIZE", _DEFAULT_BATCH_SIZE)
+        )
+        self.workers = workers
+        logger.info(
+            f"XBRLImporter initialized (batch_size={self.batch_size:,}, workers={workers})"
+        )
 
     def import_facts(self, key_concepts_only: bool = True) -> dict:
         """
@@ -56,125 +260,258 @@ class XBRLImporter:
             f"Importing XBRL facts (key_concepts_only={key_concepts_only})..."
         )
 
-        # Build query filter
+        self._ensure_indexes()
+
         if key_concepts_only:
-            concept_list = ','.join([f"'{c}'" for c in self.KEY_CONCEPTS])
-            concept_filter = f"AND concept_name IN ({concept_list})"
+            query, params = _KEY_FACTS_QUERY, [list(self.KEY_CONCEPTS)]
         else:
-            concept_filter = ""
-
-        # Query facts from DuckDB
-        query = f"""
-            SELECT 
-                f.accession_number,
-                f.concept_name,
-                f.value,
-                f.unit,
-                f.period_start,
-                f.period_end
-            FROM facts f
-            WHERE f.value IS NOT NULL
-            {concept_filter}
-            ORDER BY f.accession_number, f.concept_name
-        """
+            query, params = _ALL_FACTS_QUERY, []
+
+        # Import in batches streamed from DuckDB as Arrow record batches,
+        # so only buffered and in-flight batches are in memory at a time
+        total_imported = 0
+
+        def _drain_one() -> None:
+            nonlocal total_imported
+            count = in_flight.popleft().result()
+            total_imported += count
+            if total_imported % 10000 < count:
+                logger.info(f"Imported {total_imported:,} facts...")
+
+        # Filings are hashed to `workers` shards, each written by its own
+        # single thread, so concurrent transactions never lock the same
+        # Filing. Rows are buffered per shard up to batch_size; the bounded
+        # queue lets each shard have one batch running and one waiting.
+        shards = self.workers
+        buffers: list[list[pa.RecordBatch]] = [[] for _ in range(shards)]
+        buffered = [0] * shards
+        in_flight: deque[Future[int]] = deque()
+
+        def _submit(shard: int) -> None:
+            if len(in_flight) >= 2 * shards:
+                _drain_one()
+            columns, starts = _batch_columns(buffers[shard])
+            buffers[shard], buffered[shard] = [], 0
+            in_flight.append(
+                executors[shard].submit(self._import_fact_batch, columns, starts)
+            )
 
         logger.info("Querying DuckDB for facts...")
-        facts = self.duckdb.connection.execute(query).fetchall()
-        logger.info(f"Found {len(facts):,} facts to import")
+        with ExitStack() as stack:
+            cursor = stack.enter_context(self._scan_cursor())
+            reader = cursor.execute(query, params).fetch_record_batch(
+                rows_per_batch=self.batch_size
+            )
+            executors = [
+                stack.enter_context(ThreadPoolExecutor(max_workers=1))
+                for _ in range(shards)
+            ]
+            for record_batch in reader:
+                for shard, part in enumerate(_shard_batch(record_batch, shards)):
+                    if part is None or not part.num_rows:
+                        continue
+                    buffers[shard].append(part)
+                    buffered[shard] += part.num_rows
+                    if buffered[shard] >= self.batch_size:
+                        _submit(shard)
+            for shard in range(shards):
+                if buffers[shard]:
+                    _submit(shard)
+            while in_flight:
+                _drain_one()
 
-        if not facts:
+        if not total_imported:
             logger.warning("No facts found to import")
             return {"facts_imported": 0, "relationships_created": 0}
 
-        # Import in batches
-        batch_size = 1000
-        total_imported = 0
+        logger.info(f"✓ Imported {total_imported:,} XBRL facts")
+
+        return {
+            "facts_imported": total_imported,
+            "relationships_created": total_imported,  # 1 relationship per fact
+        }
+
+    def import_facts_bulk(
+        self,
+        import_dir: Path,
+        key_concepts_only: bool = False,
+        min_rows: int = _BULK_MIN_ROWS,
+        file_name: str = "xbrl_facts.csv",
+    ) -> dict:
+        """
+        Import XBRL facts through a CSV file and server-side LOAD CSV.
+
+        DuckDB writes the facts straight to a CSV in Neo4j's import
+        directory, which Neo4j then loads in batched transactions of its
+        own, avoiding a Bolt round trip per batch. CSV rather than Parquet:
+        LOAD CSV is the only server-side file reader in Neo4j Community
+        without plugins. Exports smaller than min_rows are discarded and
+        imported over Bolt with import_facts.
+
+        Args:
+            import_dir: Local path of the Neo4j server's import directory
+            key_concepts_only: If True, only import major financial metrics
+            min_rows: Smallest export loaded via LOAD CSV
+            file_name: CSV file name inside import_dir
+
+        Returns:
+            Statistics dictionary
+        """
+        logger.info(
+            f"Bulk importing XBRL facts (key_concepts_only={key_concepts_only})..."
+        )
+
+        if key_concepts_only:
+            # COPY takes no bound parameters; the concepts are our constants
+            concepts = ", ".join(_sql_string(c) for c in self.KEY_CONCEPTS)
+            query = _FACTS_QUERY.format(
+                concept_filter=f"AND f.concept_name IN ({concepts})"
+            )
+        else:
+            query = _ALL_FACTS_QUERY
+
+        csv_path = Path(import_dir) / file_name
+        logger.info(f"Exporting facts from DuckDB to {csv_path}...")
+        with self._scan_cursor() as cursor:
+            exported = cursor.execute(
+                f"COPY ({query}) TO {_sql_string(str(csv_path))} (FORMAT CSV, HEADER)"
+            ).fetchone()[0]
+
+        if exported < min_rows:
+            csv_path.unlink(missing_ok=True)
+            logger.info(
+                f"{exported:,} facts is below the bulk threshold ({min_rows:,}), "
+                "importing over Bolt"
+            )
+            return self.import_facts(key_concepts_only=key_concepts_only)
 
-        for i in range(0, len(facts), batch_size):
-            batch = facts[i : i + batch_size]
-            self._import_fact_batch(batch)
-            total_imported += len(batch)
+        self._ensure_indexes()
 
-            if (i + batch_size) % 10000 == 0:
-                logger.info(f"Imported {total_imported:,} / {len(facts):,} facts...")
+        logger.info(f"Loading {exported:,} facts with LOAD CSV...")
+        summary = self.neo4j.execute_autocommit(_LOAD_CSV_QUERY, {"url": f"file:///{file_name}"})
+        csv_path.unlink(missing_ok=True)
 
-        logger.info(f"✓ Imported {len(facts):,} XBRL facts")
+        counters = summary.counters
+        logger.info(f"✓ Imported {counters.nodes_created:,} XBRL facts")
 
         return {
-            "facts_imported": len(facts),
-            "relationships_created": len(facts),  # 1 relationship per fact
+            "facts_imported": counters.nodes_created,
+            "relationships_created": counters.relationships_created,
         }
 
-    def _import_fact_batch(self, batch: list[tuple]) -> None:
+    @contextmanager
+    def _scan_cursor(self) -> Iterator[Any]:
         """
-        Import batch of facts to Neo4j.
+        Open a dedicated DuckDB cursor for the facts scan.
 
-        Args:
-            batch: List of fact tuples (accession, concept, value, unit, start, end)
+        The scan gets its own connection to the shared database, and DuckDB
+        is allowed one thread per core while it runs. threads is a global
+        setting, so its previous value is restored afterwards.
+
+        Yields:
+            DuckDB cursor, closed on exit
         """
-        # Prepare data for Cypher UNWIND
-        facts_data = []
-        for fact in batch:
-            accession, concept, value, unit, period_start, period_end = fact
+        cursor = self.duckdb.connection.cursor()
+        try:
+            threads = cursor.execute("SELECT current_setting('threads')").fetchone()[0]
+            cursor.execute(f"SET threads = {os.cpu_count() or 1}")
+            try:
+                yield cursor
+            finally:
+                cursor.execute(f"SET threads = {int(threads)}")
+        finally:
+            cursor.close()
 
-            # Skip if value is not numeric
+    def _ensure_indexes(self) -> None:
+        """Make sure Filing lookups by accession number are index-backed."""
+        for statement in _REQUIRED_SCHEMA:
             try:
-                value = float(value)
-            except (ValueError, TypeError):
+                summary = self.neo4j.execute_write(statement)
+            except Neo4jError as e:
+                logger.warning(f"Could not ensure schema (may already exist): {e}")
                 continue
+            counters = summary.counters
+            if counters.constraints_added or counters.indexes_added:
+                logger.info(f"Created: {statement}")
 
-            facts_data.append(
-                {
-                    "accession_number": accession,
-                    "concept_name": concept,
-                    "value": value,
-                    "unit": unit or "USD",
-                    "period_start": str(period_start) if period_start else None,
-                    "period_end": str(period_end) if period_end else None,
-                }
-            )
+    def _import_fact_batch(
+        self, columns: dict[str, list], starts: list[int] | None = None
+    ) -> int:
+        """
+        Import batch of facts to Neo4j.
+
+        Args:
+            columns: Equal-length value lists keyed by the query's column
+                names, with float values and ISO date strings
+            starts: Precomputed accession run starts, if known
 
-        if not facts_data:
-            return
-
-        # Batch create with UNWIND
-        query = """
-        UNWIND $facts as fact
-        MATCH (f:Filing {accession_number: fact.accession_number})
-        CREATE (m:FinancialMetric {
-            concept_name: fact.concept_name,
-            value: fact.value,
-            unit: fact.unit,
-            period_start: date(fact.period_start),
-            period_end: date(fact.period_end)
-        })
-        CREATE (f)-[:REPORTS_METRIC]->(m)
+        Returns:
+            Number of facts in the batch
         """
+        # Rows arrive typed and filtered by the DuckDB query
+        size = len(columns["accession_number"])
+        if not size:
+            return 0
 
         try:
-            self.neo4j.execute_write(query, {"facts": facts_data})
-        except Exception as e:
+            self._write_facts(columns, starts)
+            return size
+        except TransientError as e:
+            if size < 2:
+                logger.error(f"Failed to import batch: {e}")
+                self._import_singly(columns)
+                return size
+            # Usually transaction memory: retry once as two halves
+            logger.warning(f"Batch of {size:,} failed ({e}), retrying in halves")
+        except Neo4jError as e:
             logger.error(f"Failed to import batch: {e}")
-            # Try individual imports for this batch
-            for fact_data in facts_data:
-                try:
-                    self._import_single_fact(fact_data)
-                except Exception as e2:
-                    logger.error(
-                        f"Failed to import fact for {fact_data['accession_number']}: {e2}"
-                    )
+            self._import_singly(columns)
+            return size
+
+        middle = size // 2
+        for half in (_slice_columns(columns, 0, middle), _slice_columns(columns, middle, size)):
+            try:
+                self._write_facts(half)
+            except Neo4jError as e:
+                logger.error(f"Failed to import half batch: {e}")
+                self._import_singly(half)
+        return size
+
+    def _write_facts(
+        self, columns: dict[str, list], starts: list[int] | None = None
+    ) -> None:
+        """
+        Create metric nodes for a column batch in one transaction.
+
+        Consecutive rows of the same filing form a run, and each run's
+        Filing is matched once rather than once per fact.
+
+        Args:
+            columns: Value lists keyed by the query's column names
+            starts: Precomputed accession run starts; found here if omitted
+        """
+        accessions = columns["accession_number"]
+        if starts is None:
+            starts = [
+                i
+                for i in range(len(accessions))
+                if i == 0 or accessions[i] != accessions[i - 1]
+            ]
+        ends = starts[1:] + [len(accessions)]
+
+        self.neo4j.execute_write(_BATCH_QUERY, {**columns, "starts": starts, "ends": ends})
+
+    def _import_singly(self, columns: dict[str, list]) -> None:
+        """Import facts one by one after their batch failed."""
+        for values in zip(*(columns[name] for name in _FACT_COLUMNS), strict=True):
+            fact_data = dict(zip(_FACT_COLUMNS, values, strict=True))
+            try:
+                self._import_single_fact(fact_data)
+            except Neo4jError as e:
+                logger.error(
+                    f"Failed to import fact for {fact_data['accession_number']}: {e}"
+                )
 
     def _import_single_fact(self, fact_data: dict) -> None:
         """Import single fact (fallback for batch failures)."""
-        query = """
-        MATCH (f:Filing {accession_number: $accession_number})
-        CREATE (m:FinancialMetric {
-            concept_name: $concept_name,
-            value: $value,
-            unit: $unit,
-            period_start: date($period_start),
-            period_end: date($period_end)
-        })
-        CREATE (f)-[:REPORTS_METRIC]->(m)
-        """
-        self.neo4j.execute_write(query, fact_data)
+        self.neo4j.execute_write(_SINGLE_QUERY, fact_data)
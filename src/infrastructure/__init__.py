@@ -10,6 +10,7 @@ from .config import (
     get_project_root,
     load_config,
 )
+from .lazy_imports import make_lazy_getattr
 from .logger import get_logger, setup_logging
 from .request_throttle import RateLimiter
 
@@ -29,4 +30,6 @@ __all__ = [
     "get_logger",
     # Rate limiting
     "RateLimiter",
+    # Lazy package exports
+    "make_lazy_getattr",
 ]
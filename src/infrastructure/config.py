@@ -129,6 +129,8 @@ class Neo4jConfig(BaseModel):
     max_connection_pool_size: int = Field(default=50)
     connection_timeout: int = Field(default=30)
     max_transaction_retry_time: int = Field(default=30)
+    connection_acquisition_timeout: int = Field(default=60)
+    keep_alive: bool = Field(default=True)
 
 
 class Settings(BaseModel):
@@ -436,6 +438,8 @@ class AppConfig:
             "max_connection_pool_size": self._settings.neo4j.max_connection_pool_size,
             "connection_timeout": self._settings.neo4j.connection_timeout,
             "max_transaction_retry_time": self._settings.neo4j.max_transaction_retry_time,
+            "connection_acquisition_timeout": self._settings.neo4j.connection_acquisition_timeout,
+            "keep_alive": self._settings.neo4j.keep_alive,
         }
 
     def validate(self) -> list[str]:
@@ -0,0 +1,43 @@
+"""
+Lazy package exports (PEP 562).
+
+Packages whose submodules pull in heavy dependencies list their public
+names here instead of importing them, so importing the package, or one
+light submodule, does not load the others.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def make_lazy_getattr(
+    lazy_imports: dict[str, str], namespace: dict[str, Any]
+) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ that imports public names on first access.
+
+    Usage (in a package __init__):
+        _LAZY_IMPORTS = {"SECApi": "src.downloads.sec_api"}
+        __getattr__ = make_lazy_getattr(_LAZY_IMPORTS, globals())
+
+    Args:
+        lazy_imports: Public name -> defining submodule
+        namespace: The package's globals(); resolved names are stored there
+            so later lookups skip __getattr__
+
+    Returns:
+        __getattr__ function for the package
+    """
+    module_name = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:  # noqa: N807 - PEP 562 hook name
+        """Import a public name from its submodule on first access."""
+        if name in lazy_imports:
+            module = importlib.import_module(lazy_imports[name])
+            value = getattr(module, name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -4,21 +4,69 @@ Logging setup for FinLoom SEC Data Pipeline.
 Provides structured JSON logging with correlation IDs and standard logging configuration.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.config
 import logging.handlers
+import queue
 import sys
+import time
 import uuid
 from contextvars import ContextVar
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
 import yaml
 
 from .config import get_project_root, get_settings
 
+try:
+    # C JSON encoder for log records
+    import orjson
+
+    def _dumps(data: dict) -> str:
+        """Serialize a log record dict to a JSON string."""
+        try:
+            return orjson.dumps(
+                data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # Integers wider than 64 bits; json.dumps takes anything it did
+            return json.dumps(data, default=str)
+except ImportError:
+    _dumps = json.dumps
+
+try:
+    # Resolved once; JsonFormatter adds trace context when a span is active
+    from opentelemetry.trace import get_current_span as _get_current_span
+except ImportError:
+    _get_current_span = None
+
+# UTC timestamps: the "YYYY-mm-ddTHH:MM:SS" part is formatted once per
+# second and reused, only the microseconds are formatted per record
+_TS_FMT = "%Y-%m-%dT%H:%M:%S"
+_ts_prefix: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(t: float) -> str:
+    """Format epoch seconds as an ISO 8601 UTC timestamp with microseconds."""
+    global _ts_prefix
+    second = int(t)
+    cached_second, prefix = _ts_prefix
+    if second != cached_second:
+        prefix = time.strftime(_TS_FMT, time.gmtime(second))
+        _ts_prefix = (second, prefix)
+    return f"{prefix}.{int((t - second) * 1_000_000):06d}Z"
+
+
+# C libyaml loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Background listener owning the fallback configuration's handlers
+_queue_listener: logging.handlers.QueueListener | None = None
+
 # Thread-safe correlation ID storage
 correlation_id: ContextVar[str] = ContextVar('correlation_id', default=None)
 request_id: ContextVar[str] = ContextVar('request_id', default=None)
@@ -38,7 +86,28 @@ class CorrelationIdFilter(logging.Filter):
         return True
 
 
-def set_correlation_id(cid: Optional[str] = None) -> str:
+def _install_record_factory() -> None:
+    """
+    Stamp correlation and request IDs on records as they are created.
+
+    Does the CorrelationIdFilter's work once per record, on the calling
+    thread, instead of once per handler. Installing twice is a no-op.
+    """
+    base_factory = logging.getLogRecordFactory()
+    if getattr(base_factory, "_finloom_ids", False):
+        return
+
+    def factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = base_factory(*args, **kwargs)
+        record.correlation_id = correlation_id.get() or 'none'
+        record.request_id = request_id.get() or 'none'
+        return record
+
+    factory._finloom_ids = True
+    logging.setLogRecordFactory(factory)
+
+
+def set_correlation_id(cid: str | None = None) -> str:
     """
     Set correlation ID for current context.
     
@@ -53,12 +122,12 @@ def set_correlation_id(cid: Optional[str] = None) -> str:
     return new_id
 
 
-def get_correlation_id() -> Optional[str]:
+def get_correlation_id() -> str | None:
     """Get current correlation ID."""
     return correlation_id.get()
 
 
-def set_request_id(rid: Optional[str] = None) -> str:
+def set_request_id(rid: str | None = None) -> str:
     """
     Set request ID for current context.
     
@@ -73,7 +142,7 @@ def set_request_id(rid: Optional[str] = None) -> str:
     return new_id
 
 
-def get_request_id() -> Optional[str]:
+def get_request_id() -> str | None:
     """Get current request ID."""
     return request_id.get()
 
@@ -94,7 +163,7 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -106,17 +175,14 @@ class JsonFormatter(logging.Formatter):
         }
         
         # Add OpenTelemetry trace context if available
-        try:
-            from opentelemetry import trace
-            span = trace.get_current_span()
-            if span and span.get_span_context().is_valid:
-                ctx = span.get_span_context()
-                log_data["trace_id"] = format(ctx.trace_id, '032x')
-                log_data["span_id"] = format(ctx.span_id, '016x')
-        except ImportError:
-            pass  # OpenTelemetry not installed
-        except Exception:
-            pass  # Ignore tracing errors
+        if _get_current_span is not None:
+            try:
+                ctx = _get_current_span().get_span_context()
+                if ctx.is_valid:
+                    log_data["trace_id"] = format(ctx.trace_id, '032x')
+                    log_data["span_id"] = format(ctx.span_id, '016x')
+            except Exception:
+                pass  # Ignore tracing errors
         
         # Add exception info if present
         if record.exc_info:
@@ -124,10 +190,11 @@ class JsonFormatter(logging.Formatter):
             log_data["exception_type"] = record.exc_info[0].__name__ if record.exc_info[0] else None
         
         # Add extra fields
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            log_data.update(extra_fields)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class ContextAdapter(logging.LoggerAdapter):
@@ -137,23 +204,45 @@ class ContextAdapter(logging.LoggerAdapter):
     Allows adding extra fields to log records for structured logging.
     """
     
+    def __init__(self, logger: logging.Logger, extra: dict[str, Any]):
+        super().__init__(logger, extra)
+        # Record attributes plus extra_fields for JsonFormatter, built once;
+        # LoggerAdapter.log only calls process() for enabled levels
+        self._template = {**extra, "extra_fields": dict(extra)}
+    
     def process(self, msg: str, kwargs: dict) -> tuple[str, dict]:
         """Process log message and add extra context."""
-        extra = kwargs.get("extra", {})
-        extra.update(self.extra)
+        extra = kwargs.get("extra")
+        if not extra:
+            kwargs["extra"] = self._template
+            return msg, kwargs
         
-        # Store extra fields for JsonFormatter
-        if "extra_fields" not in extra:
-            extra["extra_fields"] = {}
-        extra["extra_fields"].update(self.extra)
-        
-        kwargs["extra"] = extra
+        fields = extra.get("extra_fields")
+        kwargs["extra"] = {
+            **extra,
+            **self.extra,
+            "extra_fields": {**fields, **self.extra} if fields else self._template["extra_fields"],
+        }
         return msg, kwargs
 
 
+def _load_config(config_path: Path) -> dict:
+    """
+    Load a YAML logging config, with the C libyaml loader when available.
+
+    Args:
+        config_path: Path to logging config YAML file.
+
+    Returns:
+        Logging config dictionary.
+    """
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 def setup_logging(
-    config_path: Optional[str] = None,
-    log_level: Optional[str] = None,
+    config_path: str | None = None,
+    log_level: str | None = None,
 ) -> None:
     """
     Set up logging configuration.
@@ -164,6 +253,9 @@ def setup_logging(
     """
     project_root = get_project_root()
     
+    # Correlation IDs are stamped at record creation, not by handler filters
+    _install_record_factory()
+    
     # Ensure logs directory exists
     logs_dir = project_root / "logs"
     logs_dir.mkdir(exist_ok=True)
@@ -177,8 +269,7 @@ def setup_logging(
             config_path = project_root / config_path
     
     if config_path.exists():
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_config(config_path)
         
         # Update log file paths to be absolute
         for handler_name, handler_config in config.get("handlers", {}).items():
@@ -187,20 +278,6 @@ def setup_logging(
                 if not Path(filename).is_absolute():
                     handler_config["filename"] = str(project_root / filename)
         
-        # Add correlation ID filter to all handlers
-        for handler_name in config.get("handlers", {}).keys():
-            if "filters" not in config["handlers"][handler_name]:
-                config["handlers"][handler_name]["filters"] = []
-            if "correlation_id" not in config["handlers"][handler_name]["filters"]:
-                config["handlers"][handler_name]["filters"].append("correlation_id")
-        
-        # Add correlation ID filter definition
-        if "filters" not in config:
-            config["filters"] = {}
-        config["filters"]["correlation_id"] = {
-            "()": "src.infrastructure.logger.CorrelationIdFilter"
-        }
-        
         # Apply config
         logging.config.dictConfig(config)
     else:
@@ -212,22 +289,46 @@ def setup_logging(
         logging.getLogger().setLevel(getattr(logging, log_level.upper()))
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process listener.
+
+    The stock prepare() pre-formats the record and drops exc_info so it can
+    be pickled; records here never leave the process, so only the message
+    is merged and exc_info stays for JsonFormatter's exception fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments into a copy of the record."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def _setup_basic_logging(level: str) -> None:
     """Set up basic logging configuration as fallback."""
     project_root = get_project_root()
     logs_dir = project_root / "logs"
     logs_dir.mkdir(exist_ok=True)
     
-    # Create correlation ID filter
-    correlation_filter = CorrelationIdFilter()
-    
     # Create handlers
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(
         logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] - %(message)s")
     )
-    console_handler.addFilter(correlation_filter)
     
     file_handler = logging.handlers.RotatingFileHandler(
         logs_dir / "finloom.log",
@@ -237,18 +338,33 @@ def _setup_basic_logging(level: str) -> None:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(JsonFormatter())
-    file_handler.addFilter(correlation_filter)
     
-    # Configure root logger
+    # Callers only enqueue records; a background listener formats and
+    # writes them. Correlation IDs are already on the record, read from the
+    # caller's context by the record factory.
+    global _queue_listener
     root_logger = logging.getLogger()
+    if _queue_listener is not None:
+        _stop_queue_listener()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, _LocalQueueHandler):
+                root_logger.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _LocalQueueHandler(log_queue)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Configure root logger
     root_logger.setLevel(getattr(logging, level.upper()))
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(queue_handler)
 
 
 def get_logger(
     name: str,
-    context: Optional[dict[str, Any]] = None,
+    context: dict[str, Any] | None = None,
 ) -> logging.Logger | ContextAdapter:
     """
     Get a logger instance.
@@ -272,7 +388,7 @@ def log_operation(
     logger: logging.Logger,
     operation: str,
     success: bool,
-    duration_ms: Optional[float] = None,
+    duration_ms: float | None = None,
     **kwargs: Any,
 ) -> None:
     """
@@ -285,6 +401,10 @@ def log_operation(
         duration_ms: Operation duration in milliseconds.
         **kwargs: Additional context to log.
     """
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+
     extra_fields = {
         "operation": operation,
         "success": success,
@@ -293,7 +413,6 @@ def log_operation(
         extra_fields["duration_ms"] = duration_ms
     extra_fields.update(kwargs)
     
-    level = logging.INFO if success else logging.ERROR
     message = f"Operation '{operation}' {'succeeded' if success else 'failed'}"
     
     logger.log(level, message, extra={"extra_fields": extra_fields})
@@ -2,13 +2,32 @@
 SEC filing readers and extractors module.
 
 Combines XBRL parsing, LLM-based extraction, and section finding.
+
+Exports are resolved lazily (PEP 562) so that importing one reader does not
+pull in the dependencies of the others (openai, spaCy pipelines, Arelle).
 """
 
-from .xbrl_reader import XBRLParser, XBRLParseResult, XBRLFact
-from .ai_reader import LLMExtractor, PersonExtraction, RiskFactorExtraction, ExtractionResult
-from .entity_finder import FinancialEntityExtractor
-from .section_extractor import SectionExtractor
-from .section_finder import SectionRetriever
+from src.infrastructure.lazy_imports import make_lazy_getattr
+
+# Public name -> defining submodule
+_LAZY_IMPORTS = {
+    # XBRL parsing
+    "XBRLParser": "src.readers.xbrl_reader",
+    "XBRLParseResult": "src.readers.xbrl_reader",
+    "XBRLFact": "src.readers.xbrl_reader",
+    # LLM extraction
+    "LLMExtractor": "src.readers.ai_reader",
+    "PersonExtraction": "src.readers.ai_reader",
+    "RiskFactorExtraction": "src.readers.ai_reader",
+    "ExtractionResult": "src.readers.ai_reader",
+    # Entity extraction
+    "FinancialEntityExtractor": "src.readers.entity_finder",
+    # Section finding
+    "SectionExtractor": "src.readers.section_extractor",
+    "SectionRetriever": "src.readers.section_finder",
+}
+
+__getattr__ = make_lazy_getattr(_LAZY_IMPORTS, globals())
 
 __all__ = [
     # XBRL parsing
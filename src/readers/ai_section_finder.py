@@ -9,11 +9,104 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from src.infrastructure.request_throttle import AdaptiveRateLimiter
+
+try:
+    # Faster parsing of LLM JSON replies; errors subclass ValueError like json's
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Start of the next markdown heading, used to end a title-located section
+NEXT_HEADING_PATTERN = re.compile(r"(?:^|\n)#+\s+[A-Z]", re.MULTILINE)
+
+# Table of contents detection: ITEM references clustered near the start
+TOC_ITEM_PATTERN = re.compile(r"item\s+\d", re.IGNORECASE)
+TOC_SEARCH_CHARS = 40000  # Where to look for the ToC
+TOC_WINDOW_CHARS = 8000  # Size of the ToC slice sent to the LLM
+TOC_MIN_ITEMS = 5  # ITEM references a window needs to count as the ToC
+TOC_MAX_GAP_CHARS = 2000  # Largest gap between ITEM references of one ToC
+TOC_FALLBACK_CHARS = 20000  # Slice used when no ToC cluster is found
+
+
+def _extract_toc_text(full_markdown: str) -> str:
+    """
+    Slice the table of contents out of a filing for the LLM prompt.
+
+    Cover pages spend several KB on names, addresses and disclaimers
+    before the ToC. Finds the tightest run of TOC_MIN_ITEMS ITEM
+    references in the first TOC_SEARCH_CHARS, widens it to every ITEM
+    reference within TOC_MAX_GAP_CHARS of its neighbour (the tightest run
+    is often the dense Part II block, not Item 1), and returns at least
+    TOC_WINDOW_CHARS from the line of the first one, through the line of
+    the last.
+
+    Args:
+        full_markdown: Complete filing markdown
+
+    Returns:
+        ToC text, or the first TOC_FALLBACK_CHARS if no cluster is found
+    """
+    head = full_markdown[:TOC_SEARCH_CHARS]
+    offsets = [match.start() for match in TOC_ITEM_PATTERN.finditer(head)]
+
+    best = None
+    best_span = TOC_WINDOW_CHARS
+    for i in range(len(offsets) - TOC_MIN_ITEMS + 1):
+        span = offsets[i + TOC_MIN_ITEMS - 1] - offsets[i]
+        if span < best_span:
+            best, best_span = i, span
+
+    if best is None:
+        return full_markdown[:TOC_FALLBACK_CHARS]
+
+    first, last = best, best + TOC_MIN_ITEMS - 1
+    while first > 0 and offsets[first] - offsets[first - 1] <= TOC_MAX_GAP_CHARS:
+        first -= 1
+    while last < len(offsets) - 1 and offsets[last + 1] - offsets[last] <= TOC_MAX_GAP_CHARS:
+        last += 1
+
+    line_start = full_markdown.rfind("\n", 0, offsets[first]) + 1
+    line_end = full_markdown.find("\n", offsets[last])
+    if line_end == -1:
+        line_end = len(full_markdown)
+    return full_markdown[line_start:max(line_end, line_start + TOC_WINDOW_CHARS)]
+
+
+# Title heading styles, in order of preference
+_TITLE_STYLES = ("md", "bold", "plain")
+
+
+@lru_cache(maxsize=512)
+def _compile_title_pattern(title_lower: str) -> re.Pattern:
+    """
+    Compile one alternation matching a section title in any heading style.
+
+    Cached per title since the same titles recur across filings.
+
+    Args:
+        title_lower: Lowercased section title
+
+    Returns:
+        Pattern with named groups md (markdown heading), bold and plain
+    """
+    escaped = re.escape(title_lower)
+    return re.compile(
+        rf"(?P<md>(?:^|\n)#+\s*{escaped}\s*\n)"
+        rf"|(?P<bold>(?:^|\n)\*\*{escaped}\*\*\s*\n)"
+        rf"|(?P<plain>(?:^|\n){escaped}\s*\n)",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
 
 class LLMSectionFinder:
     """
@@ -23,29 +116,36 @@ class LLMSectionFinder:
     Cost: ~$0.01 per filing.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini"):
+    # Items analyze_toc() always maps, so later requests for the same filing
+    # can be answered without another call
+    TOC_ITEMS = ("ITEM 1", "ITEM 1A", "ITEM 7", "ITEM 10", "ITEM 11")
+
+    def __init__(self, model: str = "gpt-4o-mini", requests_per_second: float = 5.0):
         """
         Initialize LLM section finder.
         
         Args:
             model: OpenAI model to use (default: gpt-4o-mini)
+            requests_per_second: Request rate for concurrent (async) calls
         """
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)
         self.model = model
+
+        # Token bucket for async fan-out; backs off when OpenAI reports
+        # that the request quota is exhausted
+        self._rate_limiter = AdaptiveRateLimiter(rate=requests_per_second, min_rate=0.5)
         logger.info(f"LLMSectionFinder initialized with model: {model}")
 
     def find_section(self, full_markdown: str, item: str) -> str | None:
         """
         Find a specific section using LLM analysis.
         
-        Strategy:
-        1. Extract table of contents
-        2. Ask LLM to map requested item to section title
-        3. Find and extract that section from the markdown
+        Convenience wrapper around find_sections() for a single item.
         
         Args:
             full_markdown: Complete filing markdown
@@ -54,58 +154,325 @@ class LLMSectionFinder:
         Returns:
             Section text or None if not found
         """
+        return self.find_sections(full_markdown, [item]).get(item)
+
+    def find_sections(self, full_markdown: str, items: list[str]) -> dict[str, str | None]:
+        """
+        Find several sections of one filing with a single LLM call.
+
+        Strategy:
+        1. Extract table of contents
+        2. Ask LLM to map every requested item to its section title at once
+        3. Find and extract each section from the markdown locally
+
+        Sending the ToC once for all items avoids paying for the same ~20KB
+        prompt (and a network round trip) per item.
+
+        Args:
+            full_markdown: Complete filing markdown
+            items: Item numbers (e.g., ["ITEM 10", "ITEM 11"])
+
+        Returns:
+            Dictionary mapping item -> section text (or None)
+        """
+        if not items:
+            return {}
+
         try:
-            # Extract first ~20KB which usually contains ToC
-            toc_text = full_markdown[:20000]
-            
-            # Ask LLM to find the section title
-            prompt = self._build_section_mapping_prompt(toc_text, item)
-            
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a SEC filing analysis expert. Extract section titles from table of contents. Output valid JSON only.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=200,
-                temperature=0,
-                response_format={"type": "json_object"},
+                **self._build_request(full_markdown, items)
             )
-            
             content = response.choices[0].message.content
-            if not content:
-                logger.warning(f"Empty LLM response for {item}")
+        except Exception as e:
+            logger.error(f"LLM section finding failed for {', '.join(items)}: {e}")
+            return dict.fromkeys(items)
+
+        return self._resolve_mappings(full_markdown, items, content)
+
+    def analyze_toc(self, full_markdown: str, items: list[str] | None = None) -> dict[str, str | None]:
+        """
+        Map the standard items (plus any extra items) to section titles in one call.
+
+        The result can be cached per filing and passed to
+        extract_mapped_sections() for each later request.
+
+        Args:
+            full_markdown: Complete filing markdown
+            items: Additional item numbers to map beyond TOC_ITEMS
+
+        Returns:
+            Dictionary mapping item -> section title (None if the LLM found
+            none), or empty if the call failed
+        """
+        all_items = list(dict.fromkeys([*self.TOC_ITEMS, *(items or [])]))
+
+        try:
+            response = self.client.chat.completions.create(
+                **self._build_request(full_markdown, all_items)
+            )
+            content = response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"LLM ToC analysis failed: {e}")
+            return {}
+
+        return self._parse_titles(all_items, content)
+
+    async def find_sections_async(
+        self, full_markdown: str, items: list[str]
+    ) -> dict[str, str | None]:
+        """
+        Async variant of find_sections() for concurrent Tier 3 requests.
+
+        Requests are paced by a shared token bucket, which slows down when
+        the x-ratelimit-remaining-requests response header reaches zero.
+
+        Args:
+            full_markdown: Complete filing markdown
+            items: Item numbers (e.g., ["ITEM 10", "ITEM 11"])
+
+        Returns:
+            Dictionary mapping item -> section text (or None)
+        """
+        if not items:
+            return {}
+
+        try:
+            await self._rate_limiter.acquire_async()
+            raw = await self.async_client.chat.completions.with_raw_response.create(
+                **self._build_request(full_markdown, items)
+            )
+            self._report_rate_limit(raw.headers.get("x-ratelimit-remaining-requests"))
+            content = raw.parse().choices[0].message.content
+        except Exception as e:
+            logger.error(f"LLM section finding failed for {', '.join(items)}: {e}")
+            return dict.fromkeys(items)
+
+        return self._resolve_mappings(full_markdown, items, content)
+
+    def collect_batch_requests(
+        self,
+        filings: list[tuple[str, str, list[str]]],
+        output_path: str | Path,
+    ) -> dict[str, list[str]]:
+        """
+        Write section mapping requests to a Batch API input file.
+
+        For non-interactive backfills: the Batch API completes within 24h
+        at half the price of live calls. One request is written per filing,
+        keyed by accession number.
+
+        Args:
+            filings: (accession_number, full_markdown, items) tuples
+            output_path: JSONL file to write
+
+        Returns:
+            Manifest mapping accession_number -> items, needed by resolve_batch()
+        """
+        manifest: dict[str, list[str]] = {}
+
+        with open(output_path, "w") as f:
+            for accession_number, full_markdown, items in filings:
+                if not items or accession_number in manifest:
+                    continue
+                request = {
+                    "custom_id": accession_number,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_request(full_markdown, items),
+                }
+                f.write(json.dumps(request) + "\n")
+                manifest[accession_number] = list(items)
+
+        logger.info(f"Wrote {len(manifest)} batch requests to {output_path}")
+        return manifest
+
+    def submit_batch(self, requests_path: str | Path) -> str | None:
+        """
+        Upload a file from collect_batch_requests() and start the batch.
+
+        Args:
+            requests_path: JSONL file of batch requests
+
+        Returns:
+            Batch ID, or None if submission failed
+        """
+        try:
+            with open(requests_path, "rb") as f:
+                batch_file = self.client.files.create(file=f, purpose="batch")
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except Exception as e:
+            logger.error(f"Failed to submit batch {requests_path}: {e}")
+            return None
+
+        logger.info(f"Submitted batch {batch.id} ({requests_path})")
+        return batch.id
+
+    def resolve_batch(
+        self,
+        batch_id: str,
+        manifest: dict[str, list[str]],
+        get_markdown: Callable[[str], str | None],
+    ) -> dict[str, dict[str, str | None]] | None:
+        """
+        Download a finished batch and extract the mapped sections locally.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+            manifest: Mapping returned by collect_batch_requests()
+            get_markdown: Returns full_markdown for an accession number
+
+        Returns:
+            Dictionary mapping accession_number -> {item: section text or None},
+            or None if the batch has not completed
+        """
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status != "completed":
+                logger.info(f"Batch {batch_id} not ready (status: {batch.status})")
                 return None
+            output = self.client.files.content(batch.output_file_id).text
+        except Exception as e:
+            logger.error(f"Failed to fetch batch {batch_id}: {e}")
+            return None
+
+        results = {
+            accession_number: dict.fromkeys(items)
+            for accession_number, items in manifest.items()
+        }
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            accession_number = record.get("custom_id")
+            items = manifest.get(accession_number)
+            if not items:
+                continue
             
-            data = json.loads(content)
-            section_title = data.get("section_title")
-            page_number = data.get("page_number")
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.error(f"Batch request failed for {accession_number}: {record.get('error')}")
+                continue
+            
+            full_markdown = get_markdown(accession_number)
+            if not full_markdown:
+                logger.warning(f"No full_markdown found for {accession_number}")
+                continue
+            
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[accession_number] = self._resolve_mappings(full_markdown, items, content)
+
+        return results
+
+    def _build_request(self, full_markdown: str, items: list[str]) -> dict:
+        """Build chat completion arguments for a section mapping request."""
+        toc_text = _extract_toc_text(full_markdown)
+        logger.debug(f"ToC text for {', '.join(items)}: {len(toc_text)} chars")
+
+        # Ask LLM to find the section titles
+        prompt = self._build_section_mapping_prompt(toc_text, items)
+
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a SEC filing analysis expert. Extract section titles from table of contents. Output valid JSON only.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": 200 * len(items),
+            "temperature": 0,
+            "response_format": {"type": "json_object"},
+        }
+
+    def _resolve_mappings(
+        self, full_markdown: str, items: list[str], content: str | None
+    ) -> dict[str, str | None]:
+        """Parse the LLM's title mappings and extract each section locally."""
+        titles = self._parse_titles(items, content)
+        return self.extract_mapped_sections(full_markdown, {item: titles.get(item) for item in items})
+
+    def _parse_titles(self, items: list[str], content: str | None) -> dict[str, str | None]:
+        """
+        Parse section titles from an LLM mapping response.
+
+        Returns:
+            Dictionary mapping item -> section title (or None), or empty if
+            the response was empty or invalid
+        """
+        if not content:
+            logger.warning(f"Empty LLM response for {', '.join(items)}")
+            return {}
+
+        try:
+            mappings = _json_loads(content).get("mappings") or {}
+        except (ValueError, AttributeError) as e:
+            logger.error(f"Invalid LLM response for {', '.join(items)}: {e}")
+            return {}
+
+        titles: dict[str, str | None] = {}
+        for item in items:
+            mapping = mappings.get(item) or {}
+            section_title = mapping.get("section_title")
+            page_number = mapping.get("page_number")
             
             if not section_title:
                 logger.warning(f"LLM could not find section title for {item}")
-                return None
+                titles[item] = None
+                continue
             
             logger.info(f"LLM mapped {item} -> '{section_title}' (page {page_number})")
+            titles[item] = section_title
+
+        return titles
+
+    def extract_mapped_sections(
+        self, full_markdown: str, titles: dict[str, str | None]
+    ) -> dict[str, str | None]:
+        """
+        Extract sections whose titles are already known (no LLM call).
+
+        Args:
+            full_markdown: Complete filing markdown
+            titles: Item -> section title, as returned by analyze_toc()
+
+        Returns:
+            Dictionary mapping item -> section text (or None)
+        """
+        results: dict[str, str | None] = {}
+
+        for item, section_title in titles.items():
+            results[item] = None
+            if not section_title:
+                continue
             
             # Now find this section in the full markdown
             section_text = self._extract_by_title(full_markdown, section_title)
             
             if section_text:
                 logger.info(f"LLM found {item} ({len(section_text)} chars)")
-                return section_text
-            
-            logger.warning(f"Could not find section '{section_title}' in markdown")
-            return None
+                results[item] = section_text
+            else:
+                logger.warning(f"Could not find section '{section_title}' in markdown")
         
-        except Exception as e:
-            logger.error(f"LLM section finding failed for {item}: {e}")
-            return None
+        return results
+
+    def _report_rate_limit(self, remaining: str | None) -> None:
+        """Feed OpenAI's remaining-request header back into the rate limiter."""
+        if remaining is None:
+            return
+        if remaining.strip() == "0":
+            self._rate_limiter.report_rate_limit()
+        else:
+            self._rate_limiter.report_success()
 
-    def _build_section_mapping_prompt(self, toc_text: str, item: str) -> str:
-        """Build prompt to find section title from ToC."""
+    def _build_section_mapping_prompt(self, toc_text: str, items: list[str]) -> str:
+        """Build prompt to find section titles for several items from ToC."""
         item_descriptions = {
             "ITEM 1": "Business",
             "ITEM 1A": "Risk Factors",
@@ -114,26 +481,29 @@ class LLMSectionFinder:
             "ITEM 11": "Executive Compensation",
         }
         
-        description = item_descriptions.get(item, item)
+        item_lines = "\n".join(
+            f"- {item} ({item_descriptions.get(item, item)})" for item in items
+        )
         
-        return f"""Analyze this SEC filing table of contents and find the section that corresponds to {item} ({description}).
+        return f"""Analyze this SEC filing table of contents and find the section that corresponds to each of these items:
+{item_lines}
 
-The filing may use non-standard section names. Look for the section that covers {description.lower()}.
+The filing may use non-standard section names. For each item, look for the section that covers its description.
 
 Table of Contents:
 {toc_text}
 
-Output JSON format:
+Output JSON format, with one entry per requested item:
 {{
-  "section_title": "The exact section title from the ToC",
-  "page_number": The page number if shown (or null)
+  "mappings": {{
+    "ITEM X": {{
+      "section_title": "The exact section title from the ToC",
+      "page_number": The page number if shown (or null)
+    }}
+  }}
 }}
 
-If you cannot find a matching section, output:
-{{
-  "section_title": null,
-  "page_number": null
-}}"""
+If you cannot find a matching section for an item, use null for its section_title and page_number."""
 
     def _extract_by_title(self, markdown: str, title: str) -> str | None:
         """
@@ -146,32 +516,26 @@ If you cannot find a matching section, output:
         Returns:
             Section text or None
         """
-        import re
-        
-        # Search for the title as a heading
-        patterns = [
-            # Markdown heading
-            re.compile(rf"(?:^|\n)#+\s*{re.escape(title)}\s*\n", re.IGNORECASE | re.MULTILINE),
-            # Bold text
-            re.compile(rf"(?:^|\n)\*\*{re.escape(title)}\*\*\s*\n", re.IGNORECASE | re.MULTILINE),
-            # Plain text heading
-            re.compile(rf"(?:^|\n){re.escape(title)}\s*\n", re.IGNORECASE | re.MULTILINE),
-        ]
+        # One scan: stop at the first markdown heading, otherwise keep the
+        # first bold and plain matches and prefer them in that order
+        first: dict[str, re.Match] = {}
+        for candidate in _compile_title_pattern(title.lower()).finditer(markdown):
+            first.setdefault(candidate.lastgroup, candidate)
+            if candidate.lastgroup == "md":
+                break
         
-        for pattern in patterns:
-            match = pattern.search(markdown)
-            if match:
-                start = match.start()
-                
-                # Find next heading/section
-                next_heading = re.compile(r"(?:^|\n)#+\s+[A-Z]", re.MULTILINE)
-                next_match = next_heading.search(markdown, start + len(match.group(0)))
-                
-                if next_match:
-                    end = next_match.start()
-                    return markdown[start:end].strip()
-                else:
-                    # Take next 50KB
-                    return markdown[start:start + 50000].strip()
+        match = next((first[style] for style in _TITLE_STYLES if style in first), None)
+        if match:
+            start = match.start()
+
+            # Find next heading/section
+            next_match = NEXT_HEADING_PATTERN.search(markdown, match.end())
+
+            if next_match:
+                end = next_match.start()
+                return markdown[start:end].strip()
+            else:
+                # Take next 50KB
+                return markdown[start:start + 50000].strip()
         
         return None
@@ -194,7 +194,7 @@ async def main_async(
     db = Database(db_path=str(db_path), read_only=True)
 
     extractor = LLMExtractor(provider=LLMProvider.DEEPSEEK)
-    retriever = SectionRetriever(db)
+    retriever = SectionRetriever(db, preload_llm=True)
 
     entity_dir = root / "data" / "extracted_entities"
     entity_files = sorted(entity_dir.glob("*.json"))
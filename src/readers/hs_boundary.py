@@ -0,0 +1,73 @@
+"""
+Optional Hyperscan backend for section boundary scanning.
+
+Compiles all boundary patterns into one Hyperscan database so a filing is
+scanned once for every pattern. Importing this module raises ImportError
+when python-hyperscan is not installed; SectionExtractor then keeps its
+regex scan.
+"""
+
+from __future__ import annotations
+
+import hyperscan
+
+
+class HyperscanBoundaryScanner:
+    """Find every match of a set of boundary patterns in one pass."""
+
+    def __init__(self, patterns: list[str]):
+        """
+        Compile boundary patterns into a block-mode Hyperscan database.
+
+        Args:
+            patterns: Lowercase regex sources, without inline flags
+        """
+        self._count = len(patterns)
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[pattern.encode("ascii") for pattern in patterns],
+            ids=list(range(self._count)),
+            elements=self._count,
+            # Report leftmost start offsets, like re's match.start()
+            flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST] * self._count,
+        )
+
+    def scan(self, text: str) -> list[tuple[list[int], list[int]]]:
+        """
+        Scan lowercased markdown for all patterns.
+
+        Hyperscan reports overlapping matches, so alongside the sorted start
+        offsets each pattern gets the furthest end reached by any match
+        starting at or before that offset.
+
+        Args:
+            text: Lowercased markdown with non-ASCII whitespace folded to
+                spaces (SectionExtractor._lowered), since Hyperscan's \\s
+                is ASCII-only
+
+        Returns:
+            Per pattern, (sorted match starts, running maximum of match ends)
+        """
+        # One byte per character keeps Hyperscan offsets equal to str offsets;
+        # characters outside Latin-1 cannot occur in the patterns anyway
+        data = text.encode("latin-1", errors="replace")
+
+        spans: list[dict[int, int]] = [{} for _ in range(self._count)]
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context) -> None:
+            found = spans[pattern_id]
+            if found.get(start, -1) < end:
+                found[start] = end
+
+        self._db.scan(data, match_event_handler=on_match)
+
+        index = []
+        for found in spans:
+            starts = sorted(found)
+            reach: list[int] = []
+            furthest = 0
+            for start in starts:
+                furthest = max(furthest, found[start])
+                reach.append(furthest)
+            index.append((starts, reach))
+        return index
@@ -8,112 +8,209 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_left
 from typing import Pattern
 
+try:
+    # google-re2: linear-time DFA matching, no backtracking on alternations
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 logger = logging.getLogger(__name__)
 
 
+_FLAGS_PREFIX = "(?m)"
+
+# Whitespace Python's \s accepts but RE2's and Hyperscan's do not (e.g.
+# U+00A0, common between "ITEM" and the item number in EDGAR markdown).
+# Folded to " " before scanning so every engine sees the same text.
+_NON_ASCII_SPACE = re.compile(r"[^\S \t\n\r\f]")
+
+
+def _compile(pattern: str) -> Pattern:
+    """
+    Compile a multi-line pattern with the fastest available engine.
+    
+    Patterns are written in lowercase and matched case-sensitively against
+    a lowercased copy of the markdown (see SectionExtractor._lowered), which
+    avoids case-folding every character during the scan.
+    """
+    # Inline flags work identically under re and re2
+    return _regex.compile(f"{_FLAGS_PREFIX}{pattern}")
+
+
+def _combine(named_patterns: list[tuple[str, Pattern]]) -> Pattern:
+    """Compile patterns into one alternation, each wrapped in its own named group."""
+    return _compile("|".join(
+        f"(?P<{name}>{pattern.pattern[len(_FLAGS_PREFIX):]})" for name, pattern in named_patterns
+    ))
+
+
+class _CandidateScan:
+    """
+    Lazily walk one item's combined pattern, recording the first match per group.
+
+    The scan only advances as far as needed: once the highest-priority
+    group of a strategy has matched, later text cannot change its result.
+    """
+
+    def __init__(self, combined: Pattern | None, markdown: str):
+        self._matches = combined.finditer(markdown) if combined is not None else iter(())
+        self._first: dict[str, re.Match] = {}
+
+    def first(self, prefix: str) -> re.Match | None:
+        """Return the first match of the highest-priority group named prefix<N>."""
+        top = prefix if prefix == "cr" else f"{prefix}0"
+        while top not in self._first:
+            match = next(self._matches, None)
+            if match is None:
+                break
+            self._first.setdefault(match.lastgroup, match)
+
+        found = [name for name in self._first if name.rstrip("0123456789") == prefix]
+        if not found:
+            return None
+        return self._first[min(found, key=lambda name: int(name[len(prefix):] or 0))]
+
+
 class SectionExtractor:
     """Extract sections from full markdown using multi-pattern regex."""
 
     # Standard ITEM patterns (most common)
     STANDARD_PATTERNS = {
         "ITEM 1": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+1[\.\s]+Business", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+1[\.\s]*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+1[\.\s]+business"),
+            _compile(r"(?:^|\n)\s*item\s+1[\.\s]*\n"),
         ],
         "ITEM 1A": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+1A[\.\s]+Risk\s+Factors", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+1A[\.\s]*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+1a[\.\s]+risk\s+factors"),
+            _compile(r"(?:^|\n)\s*item\s+1a[\.\s]*\n"),
         ],
         "ITEM 1B": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+1B[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+1b[\.\s]"),
         ],
         "ITEM 1C": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+1C[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+1c[\.\s]"),
         ],
         "ITEM 2": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+2[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+2[\.\s]"),
         ],
         "ITEM 7": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+7[\.\s]+Management", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+7[\.\s]+\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+7[\.\s]+management"),
+            _compile(r"(?:^|\n)\s*item\s+7[\.\s]+\n"),
         ],
         "ITEM 7A": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+7A[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+7a[\.\s]"),
         ],
         "ITEM 8": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+8[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+8[\.\s]"),
         ],
         "ITEM 9": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+9[\.\s]+Changes", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+9[\.\s]+\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+9[\.\s]+changes"),
+            _compile(r"(?:^|\n)\s*item\s+9[\.\s]+\n"),
         ],
         "ITEM 9A": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+9A[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+9a[\.\s]"),
         ],
         "ITEM 9B": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+9B[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+9b[\.\s]"),
         ],
         "ITEM 9C": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+9C[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+9c[\.\s]"),
         ],
         "ITEM 10": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+10[\.\s]+Directors", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+10[\.\s]*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+10[\.\s]+directors"),
+            _compile(r"(?:^|\n)\s*item\s+10[\.\s]*\n"),
         ],
         "ITEM 11": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+11[\.\s]+Executive\s+Compensation", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*ITEM\s+11[\.\s]*", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+11[\.\s]+executive\s+compensation"),
+            _compile(r"(?:^|\n)\s*item\s+11[\.\s]*"),
         ],
         "ITEM 12": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+12[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+12[\.\s]"),
         ],
         "ITEM 13": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+13[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+13[\.\s]"),
         ],
         "ITEM 14": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+14[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+14[\.\s]"),
         ],
         "ITEM 15": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+15[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+15[\.\s]"),
         ],
         "ITEM 16": [
-            re.compile(r"(?:^|\n)\s*ITEM\s+16[\.\s]", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*item\s+16[\.\s]"),
         ],
     }
 
     # Non-standard patterns (for companies like INTC that use custom headings)
     NONSTANDARD_PATTERNS = {
         "ITEM 1": [
-            re.compile(r"(?:^|\n)\s*#+\s*Overview\s*\n", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*#+\s*Our\s+Business\s*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*#+\s*overview\s*\n"),
+            _compile(r"(?:^|\n)\s*#+\s*our\s+business\s*\n"),
         ],
         "ITEM 1A": [
-            re.compile(r"(?:^|\n)\s*#+\s*Risk\s+Factors\s*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*#+\s*risk\s+factors\s*\n"),
         ],
         "ITEM 7": [
-            re.compile(r"(?:^|\n)\s*#+\s*Management.*Discussion\s+and\s+Analysis", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*#+\s*management.*discussion\s+and\s+analysis"),
         ],
         "ITEM 10": [
-            re.compile(r"(?:^|\n)\s*#+\s*Information\s+About.*Executive\s+Officers", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*#+\s*Executive\s+Officers", re.IGNORECASE | re.MULTILINE),
-            re.compile(r"(?:^|\n)\s*#+\s*Directors.*Executive\s+Officers", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*#+\s*information\s+about.*executive\s+officers"),
+            _compile(r"(?:^|\n)\s*#+\s*executive\s+officers"),
+            _compile(r"(?:^|\n)\s*#+\s*directors.*executive\s+officers"),
         ],
         "ITEM 11": [
-            re.compile(r"(?:^|\n)\s*#+\s*Executive\s+Compensation\s*\n", re.IGNORECASE | re.MULTILINE),
+            _compile(r"(?:^|\n)\s*#+\s*executive\s+compensation\s*\n"),
         ],
     }
 
     # Next section markers to find boundaries
     ALL_ITEM_PATTERNS = [
-        re.compile(r"(?:^|\n)\s*ITEM\s+\d+[A-C]?[\.\s]", re.IGNORECASE | re.MULTILINE),
-        re.compile(r"(?:^|\n)\s*#+\s*(?:Overview|Risk Factors|Management|Executive|Information About)", re.IGNORECASE | re.MULTILINE),
+        _compile(r"(?:^|\n)\s*item\s+\d+[a-c]?[\.\s]"),
+        _compile(r"(?:^|\n)\s*#+\s*(?:overview|risk factors|management|executive|information about)"),
     ]
 
+    # Literal each ALL_ITEM_PATTERNS entry requires
+    BOUNDARY_ANCHORS = ("item", "#")
+
+    # Start of a "Form 10-K Cross-Reference Index" table
+    CROSSREF_PATTERN = _compile(r"(?:form 10-k )?cross-reference index")
+
+    # Literal every pattern of a strategy requires; a filing without it
+    # cannot match, so the strategy's patterns are left out of the scan
+    STRATEGY_ANCHORS = {"std": "item", "ns": "#", "cr": "cross-reference index"}
+
     def __init__(self):
         """Initialize section extractor."""
         self.stats = {"standard": 0, "nonstandard": 0, "crossref": 0, "failed": 0}
+        
+        # (item, strategies present in the filing) -> alternation over every
+        # start-of-section candidate, in priority order, so a single scan
+        # serves all three strategies. Built on first use.
+        self._combined: dict[tuple[str, frozenset[str]], Pattern | None] = {}
+        
+        # Hyperscan finds all boundary patterns in one pass when installed
+        self._hs_scanner = None
+        try:
+            from src.readers.hs_boundary import HyperscanBoundaryScanner
+            self._hs_scanner = HyperscanBoundaryScanner(
+                [pattern.pattern[len(_FLAGS_PREFIX):] for pattern in self.ALL_ITEM_PATTERNS]
+            )
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"Hyperscan boundary scanner unavailable, using regex: {e}")
+        
+        # Lowercased copy and boundary offsets for the most recently scanned
+        # markdown. Callers extract several items from the same (cached)
+        # string in a row.
+        self._lower_source: str | None = None
+        self._lower: str = ""
+        self._strategies: frozenset[str] = frozenset()
+        self._boundary_source: str | None = None
+        self._boundary_index: list[tuple[list[int], list[int]]] = []
 
     def extract_section(self, full_markdown: str, item: str) -> str | None:
         """
@@ -131,6 +228,27 @@ class SectionExtractor:
         Returns:
             Section text or None if not found
         """
+        span = self.extract_section_range(full_markdown, item)
+        if span is None:
+            return None
+        start, end = span
+        return full_markdown[start:end]
+
+    def extract_section_range(self, full_markdown: str, item: str) -> tuple[int, int] | None:
+        """
+        Locate a section without copying it out of the markdown.
+
+        Uses the same strategies as extract_section. The range excludes
+        leading and trailing whitespace, so full_markdown[start:end] equals
+        the extract_section result.
+
+        Args:
+            full_markdown: Complete filing markdown
+            item: Item number (e.g., "ITEM 1", "ITEM 10")
+
+        Returns:
+            (start, end) character offsets, or None if not found
+        """
         if not full_markdown or not item:
             return None
 
@@ -140,80 +258,96 @@ class SectionExtractor:
         # Minimum length (allows "Refer to Item X" and "incorporated by reference")
         min_length = 15
 
+        lower = self._lowered(full_markdown)
+        candidates = _CandidateScan(self._combined_pattern(item, self._strategies), lower)
+
         # Try standard patterns first
-        section = self._extract_standard_item(full_markdown, item)
-        if section and len(section) > min_length:
+        match = candidates.first("std")
+        span = self._span_from_match(full_markdown, match) if match else None
+        if span and span[1] - span[0] > min_length:
             self.stats["standard"] += 1
-            logger.debug(f"Extracted {item} using standard pattern ({len(section)} chars)")
-            return section
+            logger.debug(f"Extracted {item} using standard pattern ({span[1] - span[0]} chars)")
+            return span
 
         # Try non-standard patterns
-        section = self._extract_nonstandard_item(full_markdown, item)
-        if section and len(section) > min_length:
+        match = candidates.first("ns")
+        span = self._span_from_match(full_markdown, match) if match else None
+        if span and span[1] - span[0] > min_length:
             self.stats["nonstandard"] += 1
-            logger.debug(f"Extracted {item} using non-standard pattern ({len(section)} chars)")
-            return section
+            logger.debug(f"Extracted {item} using non-standard pattern ({span[1] - span[0]} chars)")
+            return span
 
         # Try cross-reference index
-        section = self._extract_via_crossref(full_markdown, item)
-        if section and len(section) > min_length:
+        span = self._extract_via_crossref(full_markdown, item, candidates.first("cr"))
+        if span and span[1] - span[0] > min_length:
             self.stats["crossref"] += 1
-            logger.debug(f"Extracted {item} using cross-reference ({len(section)} chars)")
-            return section
+            logger.debug(f"Extracted {item} using cross-reference ({span[1] - span[0]} chars)")
+            return span
 
         self.stats["failed"] += 1
         logger.warning(f"Failed to extract {item} with any pattern")
         return None
 
-    def _extract_standard_item(self, markdown: str, item: str) -> str | None:
-        """Extract using standard ITEM patterns."""
-        patterns = self.STANDARD_PATTERNS.get(item, [])
+    def _combined_pattern(self, item: str, strategies: frozenset[str]) -> Pattern | None:
+        """
+        Get the alternation of start patterns for item, limited to strategies.
         
-        for pattern in patterns:
-            match = pattern.search(markdown)
-            if match:
-                start = match.start()
-                # Find next section boundary
-                end = self._find_next_section_boundary(markdown, start + len(match.group(0)))
-                if end:
-                    return markdown[start:end].strip()
-                else:
-                    # No next section, take rest of document (up to reasonable limit)
-                    return markdown[start:start + 100000].strip()
+        Args:
+            item: Normalized item number
+            strategies: Strategies whose anchor literal occurs in the filing
         
-        return None
+        Returns:
+            Compiled alternation, or None if no pattern can match
+        """
+        key = (item, strategies)
+        if key not in self._combined:
+            named: list[tuple[str, Pattern]] = []
+            if "std" in strategies:
+                named += [(f"std{i}", p) for i, p in enumerate(self.STANDARD_PATTERNS.get(item, []))]
+            if "ns" in strategies:
+                named += [(f"ns{i}", p) for i, p in enumerate(self.NONSTANDARD_PATTERNS.get(item, []))]
+            if "cr" in strategies:
+                named.append(("cr", self.CROSSREF_PATTERN))
+            self._combined[key] = _combine(named) if named else None
+        return self._combined[key]
 
-    def _extract_nonstandard_item(self, markdown: str, item: str) -> str | None:
-        """Extract using non-standard patterns for custom formats."""
-        patterns = self.NONSTANDARD_PATTERNS.get(item, [])
+    def _span_from_match(self, markdown: str, match: re.Match) -> tuple[int, int]:
+        """
+        Range from a section start match up to the next section boundary.
         
-        for pattern in patterns:
-            match = pattern.search(markdown)
-            if match:
-                start = match.start()
-                # Find next major section
-                end = self._find_next_section_boundary(markdown, start + len(match.group(0)))
-                if end:
-                    return markdown[start:end].strip()
-                else:
-                    return markdown[start:start + 100000].strip()
+        The match may come from the lowercased copy; offsets are shared.
+        Surrounding whitespace is trimmed as str.strip() would.
+        """
+        start = match.start()
+        # Find next section boundary
+        end = self._find_next_section_boundary(markdown, match.end())
+        if not end:
+            # No next section, take rest of document (up to reasonable limit)
+            end = min(start + 100000, len(markdown))
         
-        return None
+        while start < end and markdown[start].isspace():
+            start += 1
+        while end > start and markdown[end - 1].isspace():
+            end -= 1
+        return start, end
 
-    def _extract_via_crossref(self, markdown: str, item: str) -> str | None:
+    def _extract_via_crossref(
+        self, markdown: str, item: str, match: re.Match | None
+    ) -> tuple[int, int] | None:
         """
         Extract using cross-reference index mapping.
         
         Some companies (like INTC) provide a "Form 10-K Cross-Reference Index"
         that maps their custom section names to standard Item numbers.
-        """
-        # Look for cross-reference index
-        crossref_pattern = re.compile(
-            r"(?:Form 10-K )?Cross-Reference Index",
-            re.IGNORECASE
-        )
         
-        match = crossref_pattern.search(markdown)
+        Args:
+            markdown: Full markdown text
+            item: Normalized item number
+            match: Location of the cross-reference index, if any
+        
+        Returns:
+            (start, end) of the mapped section, or None
+        """
         if not match:
             return None
         
@@ -242,12 +376,7 @@ class SectionExtractor:
             
             title_match = title_pattern.search(markdown)
             if title_match:
-                start = title_match.start()
-                end = self._find_next_section_boundary(markdown, start + len(title_match.group(0)))
-                if end:
-                    return markdown[start:end].strip()
-                else:
-                    return markdown[start:start + 100000].strip()
+                return self._span_from_match(markdown, title_match)
         
         return None
 
@@ -255,6 +384,9 @@ class SectionExtractor:
         """
         Find the start of the next section after start_pos.
         
+        Each boundary pattern is scanned once per markdown; lookups are then
+        a binary search over the recorded match offsets.
+        
         Args:
             markdown: Full markdown text
             start_pos: Position to start searching from
@@ -263,13 +395,66 @@ class SectionExtractor:
             Position of next section start, or None if not found
         """
         # Search for next ITEM marker or major heading
-        for pattern in self.ALL_ITEM_PATTERNS:
-            match = pattern.search(markdown, start_pos)
-            if match:
-                return match.start()
+        lower = self._lowered(markdown)
+        for pattern, (starts, reach) in zip(self.ALL_ITEM_PATTERNS, self._get_boundary_index(markdown)):
+            i = bisect_left(starts, start_pos)
+            if i > 0 and reach[i - 1] > start_pos:
+                # start_pos falls inside a recorded match; a match may begin
+                # within it, so fall back to a direct search
+                match = pattern.search(lower, start_pos)
+                if match:
+                    return match.start()
+            elif i < len(starts):
+                return starts[i]
         
         return None
 
+    def _get_boundary_index(self, markdown: str) -> list[tuple[list[int], list[int]]]:
+        """
+        Return, per boundary pattern, sorted match starts and the furthest
+        match end seen up to each start, scanning markdown once.
+        """
+        if markdown is not self._boundary_source:
+            lower = self._lowered(markdown)
+            if self._hs_scanner is not None:
+                index = self._hs_scanner.scan(lower)
+            else:
+                index = []
+                for pattern, anchor in zip(self.ALL_ITEM_PATTERNS, self.BOUNDARY_ANCHORS):
+                    # finditer matches don't overlap, so ends are already increasing
+                    starts: list[int] = []
+                    ends: list[int] = []
+                    if anchor not in lower:
+                        index.append((starts, ends))
+                        continue
+                    for match in pattern.finditer(lower):
+                        starts.append(match.start())
+                        ends.append(match.end())
+                    index.append((starts, ends))
+            self._boundary_source = markdown
+            self._boundary_index = index
+        return self._boundary_index
+
+    def _lowered(self, markdown: str) -> str:
+        """
+        Return a lowercased copy of markdown with identical character offsets.
+        
+        str.lower() expands a few characters (e.g. U+0130); when that happens
+        those characters are left as-is so match offsets still index the original.
+        Non-ASCII whitespace becomes a plain space, one character for one.
+        """
+        if markdown is not self._lower_source:
+            lower = markdown.lower()
+            if len(lower) != len(markdown):
+                lower = "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in markdown)
+            lower = _NON_ASCII_SPACE.sub(" ", lower)
+            self._lower_source = markdown
+            self._lower = lower
+            self._strategies = frozenset(
+                strategy for strategy, anchor in self.STRATEGY_ANCHORS.items() if anchor in lower
+            )
+        return self._lower
+
     def get_stats(self) -> dict[str, int]:
         """Get extraction statistics."""
         return self.stats.copy()
@@ -8,16 +8,119 @@ Tier 3: LLM-based section finding (lazy loaded)
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections import Counter, OrderedDict
 from typing import TYPE_CHECKING
 
 from src.readers.section_extractor import SectionExtractor
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 if TYPE_CHECKING:
     from src.storage.database import Database
 
 logger = logging.getLogger(__name__)
 
+# Marks an LLM finder that has not been loaded yet (None means loading failed)
+_LLM_SENTINEL = object()
+
+
+class _MarkdownCache:
+    """
+    Size-bounded LRU cache of filing markdown.
+    
+    Entries are zstd-compressed when zstandard is installed (markdown
+    compresses ~5x). The most recently used filing is also kept
+    decompressed, since sections are requested filing by filing.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes | str] = OrderedDict()
+        self._size = 0
+        self._hot: tuple[str, str] | None = None
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=3)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    def get(self, key: str) -> str | None:
+        """Return cached markdown for key, or None."""
+        if self._hot is not None and self._hot[0] == key:
+            return self._hot[1]
+        
+        blob = self._entries.get(key)
+        if blob is None:
+            return None
+        
+        self._entries.move_to_end(key)
+        markdown = self._decompressor.decompress(blob).decode("utf-8") if zstandard else blob
+        self._hot = (key, markdown)
+        return markdown
+
+    def put(self, key: str, markdown: str) -> None:
+        """Cache markdown for key, evicting least recently used entries over budget."""
+        blob = self._compressor.compress(markdown.encode("utf-8")) if zstandard else markdown
+        
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = blob
+        self._size += len(blob)
+        self._hot = (key, markdown)
+        
+        while self._size > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached markdown."""
+        self._entries.clear()
+        self._size = 0
+        self._hot = None
+
+
+class _RetrievalStats(Counter):
+    """
+    Per-tier hit/miss counters.
+    
+    Derived totals and rates are computed once and reused until a counter
+    changes, so frequent stats polling does no repeated arithmetic.
+    """
+
+    KEYS = ("db_hits", "db_misses", "regex_hits", "regex_misses", "llm_hits", "llm_misses")
+
+    def __init__(self):
+        self._derived: dict[str, float] | None = None
+        super().__init__(dict.fromkeys(self.KEYS, 0))
+
+    def __setitem__(self, key: str, value: int) -> None:
+        super().__setitem__(key, value)
+        self._derived = None
+
+    @property
+    def derived(self) -> dict[str, float]:
+        """Totals and hit rates (percent) derived from the counters."""
+        if self._derived is None:
+            total_requests = self["db_hits"] + self["db_misses"]
+            self._derived = {
+                "total_requests": total_requests,
+                "db_hit_rate": (
+                    self["db_hits"] / total_requests * 100
+                    if total_requests > 0 else 0
+                ),
+                "regex_hit_rate": (
+                    self["regex_hits"] / self["db_misses"] * 100
+                    if self["db_misses"] > 0 else 0
+                ),
+                "llm_usage": self["llm_hits"] + self["llm_misses"],
+            }
+        return self._derived
+
 
 class SectionRetriever:
     """
@@ -32,30 +135,54 @@ class SectionRetriever:
     # Minimum length for a valid section (chars)
     MIN_SUBSTANTIAL_LENGTH = 1000  # Tier 1 threshold
     MIN_VALID_LENGTH = 15  # Tier 2/3 threshold (allows "Refer to Item X" and "incorporated by reference")
+    
+    # Resolved sections kept for repeat requests
+    SECTION_CACHE_SIZE = 2048
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, cache_mb: int = 256, preload_llm: bool = False):
         """
         Initialize section retriever.
         
         Args:
             db: Database connection
+            cache_mb: Memory budget for cached full_markdown, in MB
+            preload_llm: Load the Tier 3 LLM finder now instead of on first miss
         """
         self.db = db
         self.regex_extractor = SectionExtractor()
-        self._llm_finder = None  # Lazy load only if needed
+        self._llm_finder = _LLM_SENTINEL  # Lazy load only if needed
         
         # Statistics tracking
-        self.stats = {
-            "db_hits": 0,
-            "db_misses": 0,
-            "regex_hits": 0,
-            "regex_misses": 0,
-            "llm_hits": 0,
-            "llm_misses": 0,
-        }
+        self.stats = _RetrievalStats()
         
         # Cache full_markdown per filing to avoid repeated queries
-        self._markdown_cache: dict[str, str] = {}
+        self._markdown_cache = _MarkdownCache(max_bytes=cache_mb * 1024 * 1024)
+        
+        # (accession_number, normalized item) -> section text, LRU ordered
+        self._section_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        
+        # filings.section_offsets per filing: item -> [start, end], or None
+        # when regex found nothing. Lets Tier 2 read just the slice it needs.
+        self._offsets_cache: dict[str, dict[str, list[int] | None]] = {}
+        self._dirty_offsets: set[str] = set()
+        
+        # LLM item -> section title mapping per filing, from one ToC analysis
+        self._toc_map_cache: dict[str, dict[str, str | None]] = {}
+        
+        if preload_llm:
+            self.warmup()
+
+    def warmup(self) -> bool:
+        """
+        Load the Tier 3 LLM finder ahead of time.
+        
+        Batch jobs that expect Tier 3 misses can call this at startup so the
+        first miss does not pay for the openai import and client setup.
+        
+        Returns:
+            True if the finder is available
+        """
+        return self._load_llm_finder()
 
     def get_section(self, accession_number: str, item: str) -> str | None:
         """
@@ -68,13 +195,247 @@ class SectionRetriever:
         Returns:
             Section text or None if not found in any tier
         """
-        # Normalize item format
-        item = item.upper().strip()
+        return self.get_multiple_sections(accession_number, [item])[item]
+
+    def get_multiple_sections(
+        self, accession_number: str, items: list[str]
+    ) -> dict[str, str | None]:
+        """
+        Get multiple sections for a filing.
+        
+        Tier 1 and Tier 2 run per item; every item still unresolved after
+        that is sent to the LLM finder in a single batched Tier 3 call.
+        
+        Args:
+            accession_number: Filing accession number
+            items: List of item numbers
+        
+        Returns:
+            Dictionary mapping item -> section text (or None)
+        """
+        results, unresolved = self._resolve_without_llm(accession_number, items)
+        if not unresolved:
+            return results
+        
+        # Tier 3 needs the full markdown: cached if Tier 2 ran the regex,
+        # read now if stored offsets let Tier 2 fetch only slices
+        full_markdown = self._get_full_markdown(accession_number)
+        if not full_markdown:
+            return results
+        
+        found = self._get_via_llm(accession_number, full_markdown, list(unresolved))
+        self._apply_llm_results(accession_number, results, unresolved, found)
+        return results
+
+    async def get_sections_bulk(
+        self,
+        requests: list[tuple[str, list[str]]],
+        max_concurrent: int = 8,
+    ) -> dict[str, dict[str, str | None]]:
+        """
+        Get sections for many filings, running Tier 3 calls concurrently.
+        
+        Tier 1/2 lookups share the DuckDB connection and run in order; the
+        per-filing LLM calls are then issued together, bounded by a
+        semaphore, so wall time tracks the slowest call rather than the sum.
+        
+        Args:
+            requests: (accession_number, items) pairs
+            max_concurrent: Maximum in-flight LLM requests
+        
+        Returns:
+            Dictionary mapping accession_number -> {item: section text or None}
+        """
+        all_results: dict[str, dict[str, str | None]] = {}
+        pending: list[tuple[str, str, dict[str, list[str]]]] = []
+        
+        for accession_number, items in requests:
+            results, unresolved = self._resolve_without_llm(accession_number, items)
+            all_results[accession_number] = results
+            if unresolved:
+                full_markdown = self._get_full_markdown(accession_number)
+                if full_markdown:
+                    pending.append((accession_number, full_markdown, unresolved))
+        
+        if not pending or not self._load_llm_finder():
+            return all_results
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def _find(full_markdown: str, items: list[str]) -> dict[str, str | None]:
+            async with semaphore:
+                try:
+                    return await self._llm_finder.find_sections_async(full_markdown, items)
+                except Exception as e:
+                    logger.error(f"LLM section finding failed for {', '.join(items)}: {e}")
+                    return {}
+        
+        found_all = await asyncio.gather(
+            *(_find(full_markdown, list(unresolved)) for _, full_markdown, unresolved in pending)
+        )
+        
+        for (accession_number, _, unresolved), found in zip(pending, found_all):
+            self._apply_llm_results(accession_number, all_results[accession_number], unresolved, found)
+        
+        return all_results
+
+    def queue_for_llm(
+        self,
+        requests: list[tuple[str, list[str]]],
+        output_path: str,
+    ) -> dict[str, list[str]]:
+        """
+        Queue Tier 3 work for the OpenAI Batch API instead of live calls.
+        
+        Runs Tier 1/2 now and writes the items they could not resolve to a
+        batch input file. Submit it with the LLM finder's submit_batch() and
+        apply the results later with resolve_llm_batch().
+        
+        Args:
+            requests: (accession_number, items) pairs
+            output_path: JSONL file for the batch requests
+        
+        Returns:
+            Manifest mapping accession_number -> queued items (empty if nothing queued)
+        """
+        pending: list[tuple[str, str, list[str]]] = []
+        
+        for accession_number, items in requests:
+            _, unresolved = self._resolve_without_llm(accession_number, items)
+            if unresolved:
+                full_markdown = self._get_full_markdown(accession_number)
+                if full_markdown:
+                    pending.append((accession_number, full_markdown, list(unresolved)))
+        
+        if not pending or not self._load_llm_finder():
+            return {}
+        
+        return self._llm_finder.collect_batch_requests(pending, output_path)
+
+    def resolve_llm_batch(
+        self, batch_id: str, manifest: dict[str, list[str]]
+    ) -> dict[str, dict[str, str | None]] | None:
+        """
+        Apply a completed Tier 3 batch queued by queue_for_llm().
+        
+        Args:
+            batch_id: Batch ID from submit_batch()
+            manifest: Manifest returned by queue_for_llm()
+        
+        Returns:
+            Dictionary mapping accession_number -> {item: section text or None},
+            or None if the batch is not complete yet
+        """
+        if not self._load_llm_finder():
+            return None
+        
+        found_all = self._llm_finder.resolve_batch(batch_id, manifest, self._get_full_markdown)
+        if found_all is None:
+            return None
+        
+        all_results: dict[str, dict[str, str | None]] = {}
+        for accession_number, items in manifest.items():
+            results: dict[str, str | None] = {}
+            self._apply_llm_results(
+                accession_number,
+                results,
+                {item: [item] for item in items},
+                found_all.get(accession_number, {}),
+            )
+            all_results[accession_number] = results
+        
+        return all_results
+
+    def _resolve_without_llm(
+        self, accession_number: str, items: list[str]
+    ) -> tuple[dict[str, str | None], dict[str, list[str]]]:
+        """
+        Run Tier 1/2 for each item.
+        
+        Returns:
+            (results keyed by requested item, unresolved normalized item -> requested keys)
+        """
+        # Normalized item -> section, deduplicated; served from cache when possible
+        sections: dict[str, str | None] = {}
+        for item in items:
+            normalized = item.upper().strip()
+            if normalized not in sections:
+                sections[normalized] = self._get_cached_section(accession_number, normalized)
+        
+        missing = [normalized for normalized, section in sections.items() if section is None]
+        if missing:
+            # Tier 1 for every missing item in one query
+            db_sections = self._get_many_from_database(accession_number, missing)
+            for normalized in missing:
+                section = self._get_without_llm(accession_number, normalized, db_sections.get(normalized))
+                if section is not None:
+                    self._cache_section(accession_number, normalized, section)
+                sections[normalized] = section
+        
+        results: dict[str, str | None] = {}
+        unresolved: dict[str, list[str]] = {}
+        for item in items:
+            normalized = item.upper().strip()
+            results[item] = sections[normalized]
+            if results[item] is None:
+                unresolved.setdefault(normalized, []).append(item)
+        
+        return results, unresolved
+
+    def _apply_llm_results(
+        self,
+        accession_number: str,
+        results: dict[str, str | None],
+        unresolved: dict[str, list[str]],
+        found: dict[str, str | None],
+    ) -> None:
+        """Record Tier 3 outcomes in results and statistics."""
+        for normalized, keys in unresolved.items():
+            section = found.get(normalized)
+            if section and len(section) > self.MIN_VALID_LENGTH:
+                self.stats["llm_hits"] += 1
+                logger.info(f"Tier 3 (LLM) hit: {normalized} ({len(section)} chars)")
+                self._cache_section(accession_number, normalized, section)
+            else:
+                section = None
+                self.stats["llm_misses"] += 1
+                logger.warning(f"Tier 3 (LLM) miss: {normalized} - section not found in any tier")
+            for key in keys:
+                results[key] = section
+
+    def _get_cached_section(self, accession_number: str, item: str) -> str | None:
+        """Return a previously resolved section, marking it recently used."""
+        key = (accession_number, item)
+        section = self._section_cache.get(key)
+        if section is not None:
+            self._section_cache.move_to_end(key)
+        return section
+
+    def _cache_section(self, accession_number: str, item: str, section: str) -> None:
+        """Remember a resolved section, evicting the least recently used entry."""
+        self._section_cache[(accession_number, item)] = section
+        self._section_cache.move_to_end((accession_number, item))
+        if len(self._section_cache) > self.SECTION_CACHE_SIZE:
+            self._section_cache.popitem(last=False)
+
+    def _get_without_llm(
+        self, accession_number: str, item: str, db_section: str | None
+    ) -> str | None:
+        """
+        Get section text from Tier 1 (database) or Tier 2 (regex).
         
+        Args:
+            accession_number: Filing accession number
+            item: Normalized item number
+            db_section: Section markdown already read from filing_sections, if any
+        
+        Returns:
+            Section text or None if neither tier found it
+        """
         logger.debug(f"Retrieving {item} for {accession_number}")
         
         # Tier 1: Database
-        section = self._get_from_database(accession_number, item)
+        section = db_section
         if section and len(section) > self.MIN_SUBSTANTIAL_LENGTH:
             self.stats["db_hits"] += 1
             logger.debug(f"Tier 1 (DB) hit: {item} ({len(section)} chars)")
@@ -84,12 +445,7 @@ class SectionRetriever:
         logger.debug(f"Tier 1 (DB) miss: {item}")
         
         # Tier 2: Regex extraction from full_markdown
-        full_markdown = self._get_full_markdown(accession_number)
-        if not full_markdown:
-            logger.warning(f"No full_markdown found for {accession_number}")
-            return None
-        
-        section = self.regex_extractor.extract_section(full_markdown, item)
+        section = self._get_via_regex(accession_number, item)
         if section and len(section) > self.MIN_VALID_LENGTH:
             self.stats["regex_hits"] += 1
             logger.info(f"Tier 2 (Regex) hit: {item} ({len(section)} chars)")
@@ -97,63 +453,162 @@ class SectionRetriever:
         
         self.stats["regex_misses"] += 1
         logger.debug(f"Tier 2 (Regex) miss: {item}")
+        return None
+
+    def _get_via_regex(self, accession_number: str, item: str) -> str | None:
+        """
+        Get section text by regex, reusing offsets stored by an earlier run.
         
-        # Tier 3: LLM section finder (lazy loaded)
-        section = self._get_via_llm(full_markdown, item)
-        if section and len(section) > self.MIN_VALID_LENGTH:
-            self.stats["llm_hits"] += 1
-            logger.info(f"Tier 3 (LLM) hit: {item} ({len(section)} chars)")
-            return section
+        When filings.section_offsets already records the item, only that
+        slice of full_markdown is read and no regex runs. Otherwise the
+        regex result's range is recorded for save_section_offsets.
         
-        self.stats["llm_misses"] += 1
-        logger.warning(f"Tier 3 (LLM) miss: {item} - section not found in any tier")
-        return None
+        Args:
+            accession_number: Filing accession number
+            item: Normalized item number
+        
+        Returns:
+            Section text or None
+        """
+        offsets = self._get_section_offsets(accession_number)
+        if item in offsets:
+            span = offsets[item]
+            return self._get_markdown_range(accession_number, *span) if span else None
+        
+        full_markdown = self._get_full_markdown(accession_number)
+        if not full_markdown:
+            logger.warning(f"No full_markdown found for {accession_number}")
+            return None
+        
+        span = self.regex_extractor.extract_section_range(full_markdown, item)
+        offsets[item] = list(span) if span else None
+        self._dirty_offsets.add(accession_number)
+        return full_markdown[span[0]:span[1]] if span else None
 
-    def get_multiple_sections(
-        self, accession_number: str, items: list[str]
-    ) -> dict[str, str | None]:
+    def _get_section_offsets(self, accession_number: str) -> dict[str, list[int] | None]:
         """
-        Get multiple sections for a filing.
+        Get stored section offsets for a filing (with caching).
         
         Args:
             accession_number: Filing accession number
-            items: List of item numbers
         
         Returns:
-            Dictionary mapping item -> section text (or None)
+            Mutable item -> [start, end] mapping (empty if none stored)
         """
-        results = {}
-        for item in items:
-            results[item] = self.get_section(accession_number, item)
-        return results
+        if accession_number in self._offsets_cache:
+            return self._offsets_cache[accession_number]
+        
+        offsets: dict[str, list[int] | None] = {}
+        try:
+            result = self.db.connection.execute(
+                """
+                SELECT section_offsets
+                FROM filings
+                WHERE accession_number = ?
+                """,
+                [accession_number],
+            ).fetchone()
+            
+            if result and result[0]:
+                offsets = json.loads(result[0]) if isinstance(result[0], str) else dict(result[0])
+        
+        except Exception as e:
+            logger.debug(f"No section offsets for {accession_number}: {e}")
+        
+        self._offsets_cache[accession_number] = offsets
+        return offsets
 
-    def _get_from_database(self, accession_number: str, item: str) -> str | None:
+    def save_section_offsets(self) -> int:
         """
-        Get section from filing_sections table.
+        Persist section offsets recorded by regex lookups since the last save.
+        
+        Reads never write; callers holding a writable connection opt in by
+        calling this (e.g. after a batch of lookups).
+        
+        Returns:
+            Number of filings whose offsets were stored
+        """
+        saved = 0
+        for accession_number in sorted(self._dirty_offsets):
+            try:
+                self.db.connection.execute(
+                    """
+                    UPDATE filings
+                    SET section_offsets = ?
+                    WHERE accession_number = ?
+                    """,
+                    [json.dumps(self._offsets_cache[accession_number]), accession_number],
+                )
+            except Exception as e:
+                logger.warning(f"Could not store section offsets for {accession_number}: {e}")
+                continue
+            self._dirty_offsets.discard(accession_number)
+            saved += 1
+        return saved
+
+    def _get_markdown_range(self, accession_number: str, start: int, end: int) -> str | None:
+        """
+        Get full_markdown[start:end] without loading the whole document.
         
         Args:
             accession_number: Filing accession number
-            item: Item number
+            start: Start offset (0-based)
+            end: End offset (exclusive)
         
         Returns:
-            Section markdown or None
+            Section text or None
         """
+        full_markdown = self._markdown_cache.get(accession_number)
+        if full_markdown is not None:
+            return full_markdown[start:end]
+        
         try:
+            # DuckDB substr is 1-based and counts characters, like Python slicing
             result = self.db.connection.execute(
                 """
-                SELECT markdown
-                FROM filing_sections
-                WHERE accession_number = ? AND item = ?
+                SELECT substr(full_markdown, ?, ?)
+                FROM filings
+                WHERE accession_number = ?
                 """,
-                [accession_number, item],
+                [start + 1, end - start, accession_number],
             ).fetchone()
             
             return result[0] if result else None
         
         except Exception as e:
-            logger.error(f"Database query failed for {accession_number} {item}: {e}")
+            logger.error(f"Failed to read section range for {accession_number}: {e}")
             return None
 
+    def _get_many_from_database(
+        self, accession_number: str, items: list[str]
+    ) -> dict[str, str]:
+        """
+        Get sections from filing_sections table in a single query.
+        
+        Args:
+            accession_number: Filing accession number
+            items: Item numbers
+        
+        Returns:
+            Dictionary mapping item -> section markdown (missing items omitted)
+        """
+        placeholders = ", ".join("?" * len(items))
+        try:
+            rows = self.db.connection.execute(
+                f"""
+                SELECT item, markdown
+                FROM filing_sections
+                WHERE accession_number = ? AND item IN ({placeholders})
+                """,
+                [accession_number, *items],
+            ).fetchall()
+            
+            return {item: markdown for item, markdown in rows}
+        
+        except Exception as e:
+            logger.error(f"Database query failed for {accession_number} {', '.join(items)}: {e}")
+            return {}
+
     def _get_full_markdown(self, accession_number: str) -> str | None:
         """
         Get full_markdown from filings table (with caching).
@@ -165,8 +620,9 @@ class SectionRetriever:
             Full markdown text or None
         """
         # Check cache first
-        if accession_number in self._markdown_cache:
-            return self._markdown_cache[accession_number]
+        cached = self._markdown_cache.get(accession_number)
+        if cached is not None:
+            return cached
         
         try:
             result = self.db.connection.execute(
@@ -180,7 +636,7 @@ class SectionRetriever:
             
             if result and result[0]:
                 markdown = result[0]
-                self._markdown_cache[accession_number] = markdown
+                self._markdown_cache.put(accession_number, markdown)
                 return markdown
             
             return None
@@ -189,38 +645,65 @@ class SectionRetriever:
             logger.error(f"Failed to get full_markdown for {accession_number}: {e}")
             return None
 
-    def _get_via_llm(self, full_markdown: str, item: str) -> str | None:
+    def _get_via_llm(
+        self, accession_number: str, full_markdown: str, items: list[str]
+    ) -> dict[str, str | None]:
         """
-        Get section using LLM section finder (Tier 3).
+        Get sections using LLM section finder (Tier 3).
         
         Only used as last resort for truly non-standard formats.
         Lazy loads the LLM finder to avoid unnecessary imports.
+        The first Tier 3 request for a filing maps all standard items in one
+        ToC analysis; the mapping is cached, so later requests for that
+        filing only run the local title search.
         
         Args:
+            accession_number: Filing accession number
             full_markdown: Full filing markdown
-            item: Item number
+            items: Item numbers
         
         Returns:
-            Section text or None
+            Dictionary mapping item -> section text (or None)
         """
-        # Lazy load LLM finder
-        if self._llm_finder is None:
-            try:
-                from src.readers.ai_section_finder import LLMSectionFinder
-                self._llm_finder = LLMSectionFinder()
-                logger.info("LLM section finder loaded (Tier 3 activated)")
-            except ImportError:
-                logger.warning("LLM section finder not available (module not found)")
-                return None
-            except Exception as e:
-                logger.error(f"Failed to initialize LLM section finder: {e}")
-                return None
+        if not self._load_llm_finder():
+            return {}
+        
+        try:
+            toc_map = self._toc_map_cache.get(accession_number, {})
+            missing = [item for item in items if item not in toc_map]
+            if missing:
+                toc_map = {**toc_map, **self._llm_finder.analyze_toc(full_markdown, missing)}
+                self._toc_map_cache[accession_number] = toc_map
+            
+            return self._llm_finder.extract_mapped_sections(
+                full_markdown, {item: toc_map.get(item) for item in items}
+            )
+        except Exception as e:
+            logger.error(f"LLM section finding failed for {', '.join(items)}: {e}")
+            return {}
+
+    def _load_llm_finder(self) -> bool:
+        """
+        Lazy load the LLM finder.
+        
+        Returns:
+            True if the finder is available
+        """
+        if self._llm_finder is not _LLM_SENTINEL:
+            return self._llm_finder is not None
         
+        # Only attempt once; a failed load is remembered as None
+        self._llm_finder = None
         try:
-            return self._llm_finder.find_section(full_markdown, item)
+            from src.readers.ai_section_finder import LLMSectionFinder
+            self._llm_finder = LLMSectionFinder()
+            logger.info("LLM section finder loaded (Tier 3 activated)")
+            return True
+        except ImportError:
+            logger.warning("LLM section finder not available (module not found)")
         except Exception as e:
-            logger.error(f"LLM section finding failed for {item}: {e}")
-            return None
+            logger.error(f"Failed to initialize LLM section finder: {e}")
+        return False
 
     def get_stats(self) -> dict[str, int]:
         """
@@ -229,24 +712,7 @@ class SectionRetriever:
         Returns:
             Dictionary with hit/miss counts per tier
         """
-        total_requests = (
-            self.stats["db_hits"] +
-            self.stats["db_misses"]
-        )
-        
-        return {
-            **self.stats,
-            "total_requests": total_requests,
-            "db_hit_rate": (
-                self.stats["db_hits"] / total_requests * 100
-                if total_requests > 0 else 0
-            ),
-            "regex_hit_rate": (
-                self.stats["regex_hits"] / self.stats["db_misses"] * 100
-                if self.stats["db_misses"] > 0 else 0
-            ),
-            "llm_usage": self.stats["llm_hits"] + self.stats["llm_misses"],
-        }
+        return {**self.stats, **self.stats.derived}
 
     def print_stats(self) -> None:
         """Print formatted statistics."""
@@ -287,17 +753,14 @@ class SectionRetriever:
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
-        self.stats = {
-            "db_hits": 0,
-            "db_misses": 0,
-            "regex_hits": 0,
-            "regex_misses": 0,
-            "llm_hits": 0,
-            "llm_misses": 0,
-        }
+        self.stats = _RetrievalStats()
         self.regex_extractor.reset_stats()
-        self._markdown_cache.clear()
+        self.clear_cache()
 
     def clear_cache(self) -> None:
-        """Clear the markdown cache."""
+        """Clear the markdown, section, offset and ToC mapping caches."""
         self._markdown_cache.clear()
+        self._section_cache.clear()
+        self._offsets_cache.clear()
+        self._dirty_offsets.clear()
+        self._toc_map_cache.clear()
@@ -47,6 +47,7 @@ CREATE TABLE IF NOT EXISTS filings (
     -- Unstructured extraction (full markdown)
     full_markdown TEXT,
     markdown_word_count INTEGER,
+    section_offsets JSON,               -- item -> [start, end] in full_markdown (null = not found)
     
     -- Error tracking
     processing_errors JSON,
@@ -63,6 +64,9 @@ CREATE INDEX IF NOT EXISTS idx_filings_filing_date ON filings(filing_date);
 CREATE INDEX IF NOT EXISTS idx_filings_period ON filings(period_of_report);
 CREATE INDEX IF NOT EXISTS idx_filings_status ON filings(download_status);
 
+-- Added after the initial schema; keeps existing databases in step
+ALTER TABLE filings ADD COLUMN IF NOT EXISTS section_offsets JSON;
+
 -- Filing Sections: Structured section data extracted by sec2md
 CREATE TABLE IF NOT EXISTS filing_sections (
     id INTEGER PRIMARY KEY,
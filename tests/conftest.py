@@ -0,0 +1,111 @@
+"""Shared fixtures: an in-memory stand-in for the Neo4j driver."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeRecord(dict):
+    """Row with mapping access and data(), like neo4j.Record."""
+
+    def data(self):
+        return dict(self)
+
+
+class FakeResult:
+    """Records returned by a fake run; mirrors the parts of neo4j.Result in use."""
+
+    def __init__(self, query: str, records: list[dict] | None = None):
+        self.query = query
+        self._records = records or []
+
+    def __iter__(self):
+        return iter(FakeRecord(r) for r in self._records)
+
+    def peek(self):
+        return self._records[0] if self._records else None
+
+    def consume(self):
+        return SimpleNamespace(query=self.query, counters=SimpleNamespace(indexes_removed=0))
+
+
+class FakeDriver:
+    """
+    Driver double that logs every statement.
+
+    Exceptions queued in ``failures`` are raised, in order, by the next
+    statements run (a None entry lets its statement succeed); ``records``
+    maps a query substring to rows returned.
+    """
+
+    def __init__(self):
+        self.runs: list[tuple[str, dict]] = []
+        self.sessions = 0
+        self.write_transactions = 0
+        self.failures: list[Exception | None] = []
+        self.records: dict[str, list[dict]] = {}
+
+    def _run(self, query: str, parameters: dict | None = None) -> FakeResult:
+        self.runs.append((query, parameters or {}))
+        failure = self.failures.pop(0) if self.failures else None
+        if failure is not None:
+            raise failure
+        rows = next((rows for key, rows in self.records.items() if key in query), [])
+        return FakeResult(query, rows)
+
+    def session(self, database=None):
+        self.sessions += 1
+        return FakeSession(self)
+
+    def execute_query(self, query, parameters=None, database_=None, routing_=None,
+                      result_transformer_=None):
+        result = self._run(query, parameters)
+        if result_transformer_ is not None:
+            return result_transformer_(result)
+        return list(result), result.consume(), list(result._records[:1])
+
+
+class FakeSession:
+    def __init__(self, driver: FakeDriver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+    def run(self, query, parameters=None):
+        return self.driver._run(query, parameters)
+
+    def execute_write(self, work):
+        self.driver.write_transactions += 1
+        return work(SimpleNamespace(run=self.driver._run))
+
+    def execute_read(self, work):
+        return work(SimpleNamespace(run=self.driver._run))
+
+
+@pytest.fixture
+def fake_driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def neo4j_client(fake_driver, monkeypatch):
+    """A Neo4jClient wired to FakeDriver, skipping connection setup."""
+    graph_connector = pytest.importorskip("src.graph.graph_connector")
+    # No backoff sleeps between retried attempts
+    monkeypatch.setattr(graph_connector.time, "sleep", lambda seconds: None)
+
+    client = graph_connector.Neo4jClient.__new__(graph_connector.Neo4jClient)
+    client.uri = "bolt://fake"
+    client.user = "neo4j"
+    client.password = "secret"
+    client.database = "neo4j"
+    client.driver = fake_driver
+    client._fast_path = True
+    return client
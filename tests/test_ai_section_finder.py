@@ -0,0 +1,66 @@
+"""Tests for the LLM section finder's table of contents slicing."""
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.readers.ai_section_finder import (  # noqa: E402
+    TOC_MAX_GAP_CHARS,
+    TOC_WINDOW_CHARS,
+    _extract_toc_text,
+)
+
+_COVER = "Commission file number 001-00000. Washington, D.C. 20549.\n" * 200
+_BODY = "The Company designs, manufactures and markets products.\n" * 400
+
+# Part I entries carry a summary line each, so they sit further apart than
+# the bare Part II entries
+_PART_I = [
+    ("Item 1.", "Business"),
+    ("Item 1A.", "Risk Factors"),
+    ("Item 1B.", "Unresolved Staff Comments"),
+    ("Item 1C.", "Cybersecurity"),
+    ("Item 2.", "Properties"),
+    ("Item 3.", "Legal Proceedings"),
+    ("Item 4.", "Mine Safety Disclosures"),
+]
+_PART_II = [
+    "Item 5.", "Item 6.", "Item 7.", "Item 7A.", "Item 8.", "Item 9.", "Item 9A.", "Item 9B.",
+]
+_PART_III = ["Item 10.", "Item 11.", "Item 12.", "Item 13.", "Item 14."]
+
+
+def _toc() -> str:
+    summary = "Overview of this part of the report and where to find it. " * 20
+    lines = ["TABLE OF CONTENTS", "PART I"]
+    for number, title in _PART_I:
+        lines += [f"{number} {title} ... 3", summary]
+    lines.append("PART II")
+    lines += [f"{number} ... 30" for number in _PART_II]
+    lines.append("PART III")
+    lines += [f"{number} ... 60" for number in _PART_III]
+    return "\n".join(lines) + "\n"
+
+
+def test_toc_window_starts_at_first_item_when_part_ii_is_densest():
+    toc = _toc()
+    gap = len("Overview of this part of the report and where to find it. ") * 20
+    assert gap < TOC_MAX_GAP_CHARS
+    # The dense Part II block begins too far into the ToC for a window
+    # anchored on it to reach back to Item 1
+    assert toc.index("Item 5.") - toc.index("Item 1.") > TOC_WINDOW_CHARS // 2
+
+    text = _extract_toc_text(_COVER + toc + _BODY)
+
+    assert text.startswith("Item 1. Business")
+    for number, _ in _PART_I:
+        assert number in text
+    for number in _PART_II + _PART_III:
+        assert number in text
+    assert "Commission file number" not in text
+
+
+def test_toc_window_falls_back_without_item_cluster():
+    markdown = _COVER + _BODY
+
+    assert _extract_toc_text(markdown) == markdown[:20000]
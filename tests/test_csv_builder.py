@@ -0,0 +1,115 @@
+"""Tests for the neo4j-admin CSV graph builder."""
+
+import csv
+import json
+
+import pytest
+
+csv_builder = pytest.importorskip("src.graph.csv_builder")
+
+_FILING = {
+    "accession_number": "0000320193-24-000001",
+    "ticker": "AAPL",
+    "company_name": "Apple Inc.",
+    "filing_date": "2024-11-01",
+    "sections": [
+        {
+            "llm_extraction": {
+                "extraction_success": True,
+                "people": [{"name": "Tim Cook", "role": "CEO"}],
+                "risk_factors": [
+                    {"description": "Supply chain disruption", "category": "Operational", "severity": 4}
+                ],
+            },
+            "entities_by_type": {
+                "ORG": [{"text": "Foxconn"}, {"text": "Foxconn"}],
+                "GPE": [{"text": "China"}],
+            },
+        }
+    ],
+}
+
+
+@pytest.fixture
+def entity_file(tmp_path):
+    path = tmp_path / "AAPL_entities.json"
+    path.write_text(json.dumps(_FILING))
+    return path
+
+
+def _rows(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return list(csv.reader(handle))
+
+
+def test_build_writes_node_and_relationship_csvs(tmp_path, entity_file):
+    out_dir = tmp_path / "import"
+
+    stats = csv_builder.CSVGraphBuilder(out_dir).build_from_filings([entity_file])
+
+    assert stats["files_processed"] == 1
+    assert _rows(out_dir / "nodes_company.csv") == [
+        ["ticker:ID(Company)", "name", ":LABEL"],
+        ["AAPL", "Apple Inc.", "Company"],
+    ]
+    # The repeated ORG mention becomes one node and one relationship
+    assert [row[0] for row in _rows(out_dir / "nodes_org.csv")[1:]] == ["Foxconn"]
+    assert _rows(out_dir / "rels_filing_mentions_org_org.csv")[1:] == [
+        ["0000320193-24-000001", "Foxconn", "MENTIONS_ORG"],
+    ]
+    args = (out_dir / csv_builder.IMPORT_ARGS_FILE).read_text().splitlines()
+    assert "--nodes=nodes_company.csv" in args
+    assert "--relationships=rels_company_filed_filing.csv" in args
+
+
+def test_failed_build_still_closes_every_file(tmp_path, entity_file, monkeypatch):
+    out_dir = tmp_path / "import"
+    builder = csv_builder.CSVGraphBuilder(out_dir)
+
+    def _fail(force=False):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(builder, "_flush_relationships", _fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        builder.build_from_filings([entity_file])
+
+    # Buffered rows reach disk only when their handle is closed
+    assert _rows(out_dir / "nodes_person.csv") == [
+        ["name:ID(Person)", "role", ":LABEL"],
+        ["Tim Cook", "CEO", "Person"],
+    ]
+    assert builder._files == {}
+    assert (out_dir / csv_builder.IMPORT_ARGS_FILE).exists()
+
+
+def test_rows_are_deduplicated_across_filings_and_bad_files_skipped(tmp_path, entity_file):
+    second = {**_FILING, "accession_number": "0000320193-24-000002", "filing_date": "2025-01-31"}
+    second_file = tmp_path / "AAPL_entities_2.json"
+    second_file.write_text(json.dumps(second))
+    broken_file = tmp_path / "broken_entities.json"
+    broken_file.write_text("{not json")
+    out_dir = tmp_path / "import"
+
+    stats = csv_builder.CSVGraphBuilder(out_dir).build_from_filings(
+        [entity_file, broken_file, second_file]
+    )
+
+    assert stats["files_processed"] == 2
+    assert len(_rows(out_dir / "nodes_company.csv")) == 2
+    assert len(_rows(out_dir / "nodes_person.csv")) == 2
+    assert [row[0] for row in _rows(out_dir / "nodes_org.csv")[1:]] == ["Foxconn"]
+    assert len(_rows(out_dir / "nodes_riskfactor.csv")) == 2
+    assert _rows(out_dir / "nodes_filing.csv")[1:] == [
+        ["0000320193-24-000001", "AAPL", "2024-11-01", "Filing"],
+        ["0000320193-24-000002", "AAPL", "2025-01-31", "Filing"],
+    ]
+    # Relationship properties become columns; endpoint pairs are written once
+    assert _rows(out_dir / "rels_company_filed_filing.csv") == [
+        [":START_ID(Company)", ":END_ID(Filing)", ":TYPE", "filing_date"],
+        ["AAPL", "0000320193-24-000001", "FILED", "2024-11-01"],
+        ["AAPL", "0000320193-24-000002", "FILED", "2025-01-31"],
+    ]
+    assert _rows(out_dir / "rels_company_has_executive_person.csv")[1:] == [
+        ["AAPL", "Tim Cook", "HAS_EXECUTIVE", "CEO"],
+    ]
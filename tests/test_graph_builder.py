@@ -0,0 +1,132 @@
+"""Tests for the knowledge graph builder."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+graph_builder = pytest.importorskip("src.graph.graph_builder")
+
+from neo4j.exceptions import TransientError  # noqa: E402
+
+_FILING = {
+    "accession_number": "0000320193-24-000001",
+    "ticker": "AAPL",
+    "company_name": "Apple Inc.",
+    "filing_date": "2024-11-01",
+    "sections": [
+        {
+            "entities_by_type": {
+                "ORG": [{"text": "Foxconn"}],
+                "GPE": [{"text": "China"}],
+            },
+        }
+    ],
+}
+
+
+@pytest.fixture
+def entity_file(tmp_path):
+    path = tmp_path / "AAPL_entities.json"
+    path.write_text(json.dumps(_FILING))
+    return path
+
+
+@pytest.fixture
+def builder(neo4j_client, fake_driver):
+    fake_driver.records["UNWIND $texts"] = [{"merged": 1, "created": 1}]
+    builder = graph_builder.GraphBuilder(neo4j_client, flush_workers=1)
+    # Constraints are covered by bootstrap_indexes; keep them out of the runs
+    builder._constrained_labels.update(graph_builder._LABEL_MAP.values())
+    return builder
+
+
+def _merged_texts(fake_driver):
+    return [params["texts"] for query, params in fake_driver.runs if "UNWIND $texts" in query]
+
+
+def test_fuzzy_match_reuses_near_duplicate_in_same_block(builder):
+    first = builder._create_entity_node("ORG", "Foxconn Technology")
+
+    assert builder._create_entity_node("ORG", "Foxconn Technology.") == first
+    assert builder._create_entity_node("ORG", "FOXCONN TECHNOLOGY") == first
+    assert builder.stats["duplicates_merged"] == 2
+    assert builder._pending_nodes == {"Org": ["Foxconn Technology"]}
+
+
+def test_fuzzy_match_only_compares_names_in_same_block(builder):
+    builder._create_entity_node("ORG", "Foxconn Technology")
+
+    # A typo inside the blocking prefix lands in another block
+    assert builder._create_entity_node("ORG", "Fxoconn Technology") == ("Org", "Fxoconn Technology")
+    # Types without fuzzy matching never consult the blocks
+    assert builder._create_entity_node("GPE", "Foxconn Technologies") == (
+        "Gpe",
+        "Foxconn Technologies",
+    )
+    assert set(builder._fuzzy_blocks) == {("ORG", "fox"), ("ORG", "fxo")}
+    assert builder.stats["duplicates_merged"] == 0
+
+
+def test_failed_node_flush_requeues_unwritten_labels(builder, fake_driver):
+    builder._create_entity_node("ORG", "Foxconn")
+    builder._create_entity_node("GPE", "China")
+    builder._create_entity_node("GPE", "Taiwan")
+    # The Org MERGE commits, the Gpe one fails
+    fake_driver.failures = [None, TransientError("lock timeout")]
+
+    with pytest.raises(TransientError):
+        builder._flush_pending_nodes()
+
+    assert builder._pending_nodes == {"Gpe": ["China", "Taiwan"]}
+    # Cached names are not queued again, so the retry writes what was put back
+    builder._create_entity_node("GPE", "China")
+    builder._flush_pending_nodes()
+    assert _merged_texts(fake_driver) == [["Foxconn"], ["China", "Taiwan"], ["China", "Taiwan"]]
+    assert builder._pending_nodes == {}
+
+
+def test_concurrent_flush_writes_every_group_and_isolates_failures(builder, monkeypatch):
+    builder.flush_workers = 3
+    company, filing = ("Company", "AAPL"), ("Filing", "0001")
+    builder._create_relationship(company, filing, "FILED")
+    builder._create_relationship(filing, ("Org", "Foxconn"), "MENTIONS_ORG")
+    builder._create_relationship(filing, ("Gpe", "China"), "MENTIONS_GPE")
+    builder._create_relationship(filing, ("Gpe", "Taiwan"), "MENTIONS_GPE")
+
+    written, threads = {}, set()
+
+    def _write(from_label, to_label, rel_type, rels):
+        threads.add(threading.current_thread().name)
+        if rel_type == "MENTIONS_ORG":
+            raise TransientError("deadlock")
+        written[rel_type] = [rel["tk"] for rel in rels]
+
+    monkeypatch.setattr(builder, "_flush_relationship_batch", _write)
+
+    builder._flush_relationships(force=True)
+
+    assert written == {"FILED": ["0001"], "MENTIONS_GPE": ["China", "Taiwan"]}
+    assert all(name.startswith("graph-flush") for name in threads)
+    assert builder._pending_relationships == 0
+    assert not any(builder._by_type.values())
+    builder._flush_pool.shutdown()
+
+
+def test_failed_final_flush_still_shuts_down_pool(neo4j_client, entity_file, monkeypatch):
+    builder = graph_builder.GraphBuilder(neo4j_client, flush_workers=2)
+    pool = builder._flush_pool = ThreadPoolExecutor(max_workers=2)
+
+    def _fail(force=False):
+        raise RuntimeError("neo4j unavailable")
+
+    monkeypatch.setattr(builder, "_flush_relationships", _fail)
+
+    with pytest.raises(RuntimeError, match="neo4j unavailable"):
+        builder.build_from_filings([entity_file])
+
+    assert builder._flush_pool is None
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        pool.submit(print)
@@ -0,0 +1,81 @@
+"""Tests for the Neo4j client's retry paths."""
+
+import pytest
+
+graph_connector = pytest.importorskip("src.graph.graph_connector")
+
+from neo4j.exceptions import (  # noqa: E402
+    ClientError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
+
+
+def test_driver_execute_query_is_not_retried_again(neo4j_client, fake_driver):
+    # driver.execute_query retries transient errors itself
+    fake_driver.failures = [TransientError("deadlock")]
+
+    with pytest.raises(TransientError):
+        neo4j_client.execute_query("MATCH (n) RETURN n")
+
+    assert len(fake_driver.runs) == 1
+
+
+def test_session_fallback_retries_transient_errors(neo4j_client, fake_driver):
+    neo4j_client._fast_path = False
+    fake_driver.failures = [TransientError("deadlock"), ServiceUnavailable("leader switch")]
+    fake_driver.records["RETURN 1"] = [{"test": 1}]
+
+    assert neo4j_client.execute_query("RETURN 1 AS test") == [{"test": 1}]
+    assert len(fake_driver.runs) == 3
+
+
+def test_session_fallback_gives_up_after_max_attempts(neo4j_client, fake_driver):
+    neo4j_client._fast_path = False
+    fake_driver.failures = [TransientError("deadlock")] * graph_connector._MAX_ATTEMPTS
+
+    with pytest.raises(TransientError):
+        neo4j_client.execute_query("RETURN 1 AS test")
+
+    assert len(fake_driver.runs) == graph_connector._MAX_ATTEMPTS
+
+
+def test_client_errors_are_not_retried(neo4j_client, fake_driver):
+    neo4j_client._fast_path = False
+    fake_driver.failures = [ClientError("syntax error")]
+
+    with pytest.raises(ClientError):
+        neo4j_client.execute_query("RETRN 1")
+
+    assert len(fake_driver.runs) == 1
+
+
+def test_iter_query_retries_before_first_record(neo4j_client, fake_driver):
+    fake_driver.failures = [SessionExpired("connection dropped")]
+    fake_driver.records["MATCH (c:Company)"] = [{"ticker": "AAPL"}, {"ticker": "MSFT"}]
+
+    with neo4j_client.iter_query("MATCH (c:Company) RETURN c.ticker AS ticker") as rows:
+        assert [row["ticker"] for row in rows] == ["AAPL", "MSFT"]
+
+    assert len(fake_driver.runs) == 2
+
+
+def test_schema_statements_retry_per_statement(neo4j_client, fake_driver):
+    fake_driver.failures = [TransientError("lock timeout")]
+
+    created = neo4j_client._run_many(["CREATE INDEX a", "CREATE INDEX b"], "Index")
+
+    assert created == 2
+    assert [query for query, _ in fake_driver.runs] == [
+        "CREATE INDEX a", "CREATE INDEX a", "CREATE INDEX b",
+    ]
+    assert fake_driver.sessions == 1
+
+
+def test_write_batch_commits_statements_together(neo4j_client, fake_driver):
+    summaries = neo4j_client.execute_write_batch([("CREATE (a)", None), ("CREATE (b)", {"x": 1})])
+
+    assert [summary.query for summary in summaries] == ["CREATE (a)", "CREATE (b)"]
+    assert fake_driver.write_transactions == 1
+
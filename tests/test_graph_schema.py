@@ -0,0 +1,69 @@
+"""Tests for the graph node and relationship models."""
+
+import dataclasses
+from datetime import date
+
+import pytest
+
+from src.graph.schema import (
+    CompanyNode,
+    EventNode,
+    FilingNode,
+    FinancialMetricNode,
+    Relationship,
+    RiskFactorNode,
+)
+
+
+def test_model_dump_matches_to_dict_without_aliases():
+    company = CompanyNode(cik="0000320193", name="Apple Inc.", ticker="AAPL")
+
+    assert company.model_dump() == company.to_dict()
+    assert company.model_dump()["sector"] is None
+
+
+def test_event_aliases_round_trip():
+    event = EventNode.model_validate(
+        {"type": "acquisition", "date": date(2024, 3, 1), "description": "Bought a supplier"}
+    )
+
+    assert event.event_type == "acquisition"
+    assert event.to_dict()["type"] == "acquisition"
+    assert event.to_dict()["date"] == date(2024, 3, 1)
+    assert "event_type" not in event.to_dict()
+    assert event.model_dump()["event_type"] == "acquisition"
+    assert event.model_dump(by_alias=True) == event.to_dict()
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: FilingNode(accession_number="0001", form_type="10-K", filing_date="2024-02-01"),
+        lambda: CompanyNode(cik=320193, name="Apple Inc.", ticker="AAPL"),
+        lambda: FinancialMetricNode(concept_name="us-gaap:Assets", value="1.0", unit="USD"),
+        lambda: Relationship(from_node=1, to_node="b", relationship_type="FILED"),
+    ],
+)
+def test_required_fields_are_type_checked(build):
+    with pytest.raises(ValueError, match="must be"):
+        build()
+
+
+def test_numeric_fields_accept_ints():
+    metric = FinancialMetricNode(concept_name="us-gaap:Assets", value=10, unit="USD")
+
+    assert metric.value == 10
+
+
+@pytest.mark.parametrize("severity", [0, 6])
+def test_risk_severity_range_is_enforced(severity):
+    with pytest.raises(ValueError, match="severity must be between 1 and 5"):
+        RiskFactorNode(category="Operational", severity=severity, description="Supply risk")
+
+
+def test_models_are_frozen_and_slotted():
+    risk = RiskFactorNode(category="Operational", severity=3, description="Supply risk")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        risk.severity = 4
+    assert not hasattr(risk, "__dict__")
@@ -0,0 +1,58 @@
+"""Tests for lazily resolved package exports."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.lazy_imports import make_lazy_getattr
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+# Package -> third-party modules its exports pull in
+_HEAVY_MODULES = {
+    "src.readers": ["openai", "spacy", "arelle", "duckdb"],
+    "src.documents": ["duckdb", "sec2md"],
+    "src.downloads": ["requests", "urllib3"],
+}
+
+
+def _modules_after_import(package: str) -> set[str]:
+    """Import a package in a fresh interpreter and list the loaded modules."""
+    script = (
+        f"import json, sys, {package}; "
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("package", sorted(_HEAVY_MODULES))
+def test_package_import_skips_heavy_dependencies(package):
+    loaded = _modules_after_import(package)
+
+    assert not loaded & set(_HEAVY_MODULES[package])
+
+
+def test_lazy_getattr_resolves_and_caches():
+    namespace = {"__name__": "pkg"}
+    lazy_getattr = make_lazy_getattr({"JSONDecoder": "json.decoder"}, namespace)
+
+    decoder = lazy_getattr("JSONDecoder")
+
+    assert decoder is json.JSONDecoder
+    assert namespace["JSONDecoder"] is decoder
+    with pytest.raises(AttributeError, match="module 'pkg' has no attribute 'Missing'"):
+        lazy_getattr("Missing")
+
+
+def test_package_export_resolves_on_access():
+    import src.readers
+    from src.readers.section_extractor import SectionExtractor
+
+    assert src.readers.SectionExtractor is SectionExtractor
+    assert "SectionExtractor" in vars(src.readers)
@@ -0,0 +1,101 @@
+"""Tests for the logging setup."""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from src.infrastructure import logger as finloom_logger
+
+
+@pytest.fixture
+def record_factory():
+    """Install the ID-stamping record factory, restoring the original after."""
+    original = logging.getLogRecordFactory()
+    finloom_logger._install_record_factory()
+    yield logging.getLogRecordFactory()
+    logging.setLogRecordFactory(original)
+    finloom_logger.clear_context()
+
+
+@pytest.fixture
+def basic_logging(tmp_path, monkeypatch, record_factory):
+    """Fallback logging configuration writing under tmp_path."""
+    monkeypatch.setattr(finloom_logger, "get_project_root", lambda: tmp_path)
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield tmp_path / "logs" / "finloom.log"
+    finloom_logger._stop_queue_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _capture(name):
+    records = []
+    logger = logging.getLogger(name)
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    logger.propagate = False
+    return logger, records
+
+
+def test_record_factory_stamps_ids_from_calling_context(record_factory):
+    logger, records = _capture("finloom.test.factory")
+    finloom_logger.set_correlation_id("corr-1")
+    finloom_logger.set_request_id("req-1")
+
+    logger.warning("in context")
+    # A new thread starts with an empty context
+    thread = threading.Thread(target=logger.warning, args=("other thread",))
+    thread.start()
+    thread.join()
+
+    assert [(r.correlation_id, r.request_id) for r in records] == [
+        ("corr-1", "req-1"),
+        ("none", "none"),
+    ]
+
+
+def test_record_factory_installs_once(record_factory):
+    finloom_logger._install_record_factory()
+
+    assert logging.getLogRecordFactory() is record_factory
+
+
+def test_queue_listener_writes_json_with_exception(basic_logging):
+    finloom_logger._setup_basic_logging("DEBUG")
+    finloom_logger.set_correlation_id("corr-2")
+
+    try:
+        raise ValueError("bad filing")
+    except ValueError:
+        logging.getLogger("finloom.test.queue").exception("Failed %s", "AAPL")
+    finloom_logger._stop_queue_listener()
+
+    entry = json.loads(basic_logging.read_text().splitlines()[-1])
+    assert entry["message"] == "Failed AAPL"
+    assert entry["correlation_id"] == "corr-2"
+    assert entry["exception_type"] == "ValueError"
+    assert "bad filing" in entry["exception"]
+
+
+def test_reconfiguring_replaces_the_queue_handler(basic_logging):
+    finloom_logger._setup_basic_logging("INFO")
+    first = finloom_logger._queue_listener
+
+    finloom_logger._setup_basic_logging("INFO")
+
+    queue_handlers = [
+        handler
+        for handler in logging.getLogger().handlers
+        if isinstance(handler, finloom_logger._LocalQueueHandler)
+    ]
+    assert len(queue_handlers) == 1
+    assert finloom_logger._queue_listener is not first
+    assert first._thread is None
+
+    finloom_logger._stop_queue_listener()
+    finloom_logger._stop_queue_listener()
+    assert finloom_logger._queue_listener is None
@@ -0,0 +1,57 @@
+"""Tests for regex-based section extraction."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "src" / "readers" / "section_extractor.py"
+
+# EDGAR HTML-to-markdown often puts a no-break space between "ITEM" and the
+# item number, and between the number and the title
+_NBSP_MARKDOWN = (
+    "# Annual Report\n\n"
+    "ITEM\xa01.\xa0BUSINESS\n\n"
+    "We make widgets and sell them worldwide to many customers.\n\n"
+    "ITEM\xa01A.\xa0RISK FACTORS\n\n"
+    "Our business is subject to numerous risks and uncertainties.\n\n"
+    "ITEM\xa02.\xa0PROPERTIES\n\n"
+    "We lease our headquarters and several regional offices.\n"
+)
+
+
+def _load_extractor(monkeypatch, engine: str):
+    """Load a fresh copy of section_extractor compiled with the given engine."""
+    if engine == "re2":
+        pytest.importorskip("re2")
+    else:
+        # A None entry makes "import re2" raise ImportError
+        monkeypatch.setitem(sys.modules, "re2", None)
+
+    spec = importlib.util.spec_from_file_location(f"section_extractor_{engine}", _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module._regex.__name__ == engine
+    return module.SectionExtractor()
+
+
+@pytest.mark.parametrize("engine", ["re", "re2"])
+@pytest.mark.parametrize("item", ["ITEM 1", "ITEM 1A", "ITEM 2"])
+def test_nbsp_heading_found_with_each_engine(monkeypatch, engine, item):
+    extractor = _load_extractor(monkeypatch, engine)
+
+    section = extractor.extract_section(_NBSP_MARKDOWN, item)
+
+    assert section is not None
+    assert section.upper().startswith(item.replace(" ", "\xa0"))
+
+
+def test_nbsp_heading_ranges_match_across_engines(monkeypatch):
+    re2_extractor = _load_extractor(monkeypatch, "re2")
+    re_extractor = _load_extractor(monkeypatch, "re")
+
+    for item in ("ITEM 1", "ITEM 1A", "ITEM 2"):
+        expected = re_extractor.extract_section_range(_NBSP_MARKDOWN, item)
+        assert expected is not None
+        assert re2_extractor.extract_section_range(_NBSP_MARKDOWN, item) == expected
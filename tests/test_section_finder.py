@@ -0,0 +1,161 @@
+"""Tests for the 3-tier section retriever."""
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from src.readers.section_finder import SectionRetriever, _RetrievalStats  # noqa: E402
+from src.storage.connection import Database  # noqa: E402
+
+_ACCESSION = "0000000000-24-000001"
+
+_MARKDOWN = (
+    "# Annual Report\n\n"
+    "ITEM 1. BUSINESS\n\n"
+    "We make widgets and sell them worldwide to many customers.\n\n"
+    "ITEM 1A. RISK FACTORS\n\n"
+    "Our business is subject to numerous risks and uncertainties.\n\n"
+    "ITEM 2. PROPERTIES\n\n"
+    "We lease our headquarters and several regional offices.\n"
+)
+
+# Reprocessed filing: longer preamble shifts every offset, and Item 7 now exists
+_REPROCESSED_MARKDOWN = (
+    "# Annual Report\n\n"
+    "This amended conversion keeps the cover page text ahead of the items.\n\n"
+    "ITEM 1. BUSINESS\n\n"
+    "We now make gadgets and sell them through regional distributors.\n\n"
+    "ITEM 1A. RISK FACTORS\n\n"
+    "Our business is subject to numerous risks and uncertainties.\n\n"
+    "ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS\n\n"
+    "Revenue grew on higher gadget volumes across all regions.\n\n"
+    "ITEM 8. FINANCIAL STATEMENTS\n\n"
+    "See the consolidated statements that follow this page.\n"
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(db_path=str(tmp_path / "finloom.duckdb"))
+    database.initialize_schema()
+    database.connection.execute(
+        """
+        INSERT INTO filings (accession_number, cik, form_type, filing_date,
+                             full_markdown, sections_processed)
+        VALUES (?, '0000000001', '10-K', DATE '2024-02-01', ?, TRUE)
+        """,
+        [_ACCESSION, _MARKDOWN],
+    )
+    yield database
+    database.close()
+
+
+def test_reprocessed_filing_reads_sections_from_new_markdown(db, tmp_path, monkeypatch):
+    pytest.importorskip("sec2md")
+    from src.documents.document_processor import UnstructuredDataPipeline
+
+    retriever = SectionRetriever(db)
+    assert "widgets" in retriever.get_section(_ACCESSION, "ITEM 1")
+    assert retriever.get_section(_ACCESSION, "ITEM 7") is None
+    assert retriever.save_section_offsets() == 1
+
+    pipeline = UnstructuredDataPipeline(str(db.db_path))
+    monkeypatch.setattr(
+        pipeline, "_convert_html_to_markdown", lambda path: (_REPROCESSED_MARKDOWN, [])
+    )
+    html_file = tmp_path / "filing.htm"
+    html_file.write_text("<html></html>")
+    assert pipeline.reprocess_filing(_ACCESSION, html_file, force=True).success
+
+    stored = db.connection.execute(
+        "SELECT section_offsets FROM filings WHERE accession_number = ?", [_ACCESSION]
+    ).fetchone()[0]
+    assert stored is None
+
+    retriever = SectionRetriever(db)
+    business = retriever.get_section(_ACCESSION, "ITEM 1")
+    assert business.startswith("ITEM 1. BUSINESS")
+    assert "gadgets" in business
+    assert "Revenue grew" in retriever.get_section(_ACCESSION, "ITEM 7")
+
+
+def _insert_filing(db, accession, markdown):
+    db.connection.execute(
+        """
+        INSERT INTO filings (accession_number, cik, form_type, filing_date,
+                             full_markdown, sections_processed)
+        VALUES (?, '0000000001', '10-K', DATE '2024-02-01', ?, TRUE)
+        """,
+        [accession, markdown],
+    )
+
+
+def _no_full_markdown(accession_number):
+    raise AssertionError("stored offsets should avoid loading full_markdown")
+
+
+def test_stored_offsets_read_sections_by_substr(db, monkeypatch):
+    # Multi-byte characters ahead of the items: substr must count characters
+    accession = "0000000000-24-000002"
+    _insert_filing(db, accession, "# Rapport annuel — résumé €\n\n" + _MARKDOWN)
+    first = SectionRetriever(db)
+    expected = first.get_section(accession, "ITEM 1A")
+    assert expected.startswith("ITEM 1A. RISK FACTORS")
+    assert first._resolve_without_llm(accession, ["ITEM 7"])[0] == {"ITEM 7": None}
+    assert first.save_section_offsets() == 1
+    assert first.save_section_offsets() == 0
+
+    retriever = SectionRetriever(db)
+    monkeypatch.setattr(retriever, "_get_full_markdown", _no_full_markdown)
+    monkeypatch.setattr(
+        retriever.regex_extractor,
+        "extract_section_range",
+        lambda markdown, item: pytest.fail("stored offsets should skip the regex"),
+    )
+
+    assert retriever.get_section(accession, "ITEM 1A") == expected
+    # A recorded miss is answered from the offsets too
+    assert retriever._resolve_without_llm(accession, ["ITEM 7"])[0] == {"ITEM 7": None}
+    assert retriever.stats["regex_hits"] == 1
+    assert retriever.stats["regex_misses"] == 1
+
+
+def test_regex_offsets_are_cached_until_saved(db):
+    retriever = SectionRetriever(db)
+
+    retriever.get_multiple_sections(_ACCESSION, ["ITEM 1", "ITEM 1A", "ITEM 2"])
+
+    assert list(retriever._offsets_cache) == [_ACCESSION]
+    assert set(retriever._offsets_cache[_ACCESSION]) == {"ITEM 1", "ITEM 1A", "ITEM 2"}
+    assert retriever._dirty_offsets == {_ACCESSION}
+    # Offsets are not written until the caller asks
+    stored = db.connection.execute(
+        "SELECT section_offsets FROM filings WHERE accession_number = ?", [_ACCESSION]
+    ).fetchone()[0]
+    assert stored is None
+
+    retriever.clear_cache()
+    assert retriever._offsets_cache == {}
+    assert retriever._dirty_offsets == set()
+
+
+def test_retrieval_stats_recompute_derived_after_changes():
+    stats = _RetrievalStats()
+    assert stats.derived == {
+        "total_requests": 0,
+        "db_hit_rate": 0,
+        "regex_hit_rate": 0,
+        "llm_usage": 0,
+    }
+
+    stats["db_hits"] += 3
+    stats["db_misses"] += 1
+    derived = stats.derived
+    assert derived["total_requests"] == 4
+    assert derived["db_hit_rate"] == 75
+    assert stats.derived is derived
+
+    stats.update(regex_hits=1, llm_misses=2)
+    assert stats.derived is not derived
+    assert stats.derived["regex_hit_rate"] == 100
+    assert stats.derived["llm_usage"] == 2
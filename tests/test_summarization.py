@@ -0,0 +1,32 @@
+"""Tests for persisting community summaries."""
+
+import pytest
+
+summarization = pytest.importorskip("src.graph.summarization")
+
+
+def _summarizer():
+    # save_summaries needs no LLM client
+    return summarization.CommunitySummarizer.__new__(summarization.CommunitySummarizer)
+
+
+def test_save_summaries_writes_every_label_in_one_transaction(neo4j_client, fake_driver):
+    summaries = [
+        {"community_id": 3, "title": "Chip makers"},
+        {"community_id": 7, "title": "Retail"},
+    ]
+
+    _summarizer().save_summaries(neo4j_client, summaries)
+
+    assert fake_driver.sessions == 1
+    assert fake_driver.write_transactions == 1
+    assert [query for query, _ in fake_driver.runs] == list(summarization._SAVE_SUMMARY_QUERIES)
+    rows = fake_driver.runs[0][1]["rows"]
+    assert [row["cid"] for row in rows] == [3, 7]
+    assert '"Chip makers"' in rows[0]["js"]
+
+
+def test_save_summaries_skips_empty_input(neo4j_client, fake_driver):
+    _summarizer().save_summaries(neo4j_client, [])
+
+    assert fake_driver.sessions == 0
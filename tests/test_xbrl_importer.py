@@ -0,0 +1,229 @@
+"""Tests for the XBRL fact importer."""
+
+import csv
+import threading
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("duckdb")
+xbrl_importer = pytest.importorskip("src.graph.xbrl_importer")
+
+import pyarrow as pa  # noqa: E402
+from neo4j.exceptions import Neo4jError, TransientError  # noqa: E402
+
+from src.storage.connection import Database  # noqa: E402
+
+_FACTS = [
+    # (accession, concept, value, unit, period_start, period_end)
+    ("0001-24-000001", "us-gaap:Revenues", 100.5, "USD", "2023-01-01", "2023-12-31"),
+    ("0001-24-000001", "us-gaap:Assets", 900.0, None, None, "2023-12-31"),
+    ("0002-24-000002", "us-gaap:NetIncomeLoss", -12.25, "USD", "2023-01-01", "2023-12-31"),
+    ("0002-24-000002", "dei:EntityCommonStockSharesOutstanding", 42.0, "shares", None, "2024-01-31"),
+]
+
+
+class _RecordingClient:
+    """
+    Neo4jClient double recording writes; LOAD CSV reads the exported file.
+
+    Exceptions queued in ``failures`` are raised, in order, by the next
+    writes; ``fail_single`` names accession numbers whose single-fact
+    write always fails.
+    """
+
+    def __init__(self, import_dir=None):
+        self.import_dir = import_dir
+        self.writes = []
+        self.autocommits = []
+        self.loaded_rows = None
+        self.failures = []
+        self.fail_single = set()
+        self._lock = threading.Lock()
+
+    def execute_write(self, query, parameters=None):
+        with self._lock:
+            self.writes.append((query, parameters, threading.current_thread().name))
+            if self.failures:
+                raise self.failures.pop(0)
+        if query == xbrl_importer._SINGLE_QUERY and parameters["accession_number"] in self.fail_single:
+            raise Neo4jError("constraint violation")
+        return SimpleNamespace(counters=SimpleNamespace(constraints_added=0, indexes_added=0))
+
+    def batch_writes(self):
+        return [params for query, params, _ in self.writes if query == xbrl_importer._BATCH_QUERY]
+
+    def single_writes(self):
+        return [params for query, params, _ in self.writes if query == xbrl_importer._SINGLE_QUERY]
+
+    def execute_autocommit(self, query, parameters=None):
+        self.autocommits.append((query, parameters))
+        file_name = parameters["url"].removeprefix("file:///")
+        with (self.import_dir / file_name).open(newline="") as handle:
+            self.loaded_rows = list(csv.reader(handle))
+        created = len(self.loaded_rows) - 1
+        return SimpleNamespace(
+            counters=SimpleNamespace(nodes_created=created, relationships_created=created)
+        )
+
+
+@pytest.fixture
+def duckdb_database(tmp_path):
+    database = Database(db_path=str(tmp_path / "finloom.duckdb"))
+    database.initialize_schema()
+    database.connection.executemany(
+        """
+        INSERT INTO facts (id, accession_number, concept_name, value, unit, period_start, period_end)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [(i, *fact) for i, fact in enumerate(_FACTS, 1)],
+    )
+    yield database
+    database.close()
+
+
+def _importer(client, database=None, **kwargs):
+    return xbrl_importer.XBRLImporter(client, database, batch_size=2, workers=2, **kwargs)
+
+
+def _columns(facts):
+    return {
+        name: [fact[i] for fact in facts] for i, name in enumerate(xbrl_importer._FACT_COLUMNS)
+    }
+
+
+def test_shard_batch_keeps_each_filing_in_one_sorted_shard():
+    accessions = ["c", "a", "b", "a", "d", "c", "b", "e", "a"]
+    record_batch = pa.RecordBatch.from_pydict(
+        {"accession_number": accessions, "row": list(range(len(accessions)))}
+    )
+
+    shards = xbrl_importer._shard_batch(record_batch, 3)
+
+    assert len(shards) == 3
+    parts = [part.column("accession_number").to_pylist() for part in shards if part is not None]
+    assert sorted(sum(parts, [])) == sorted(accessions)
+    for part in parts:
+        assert part == sorted(part)
+    owners = defaultdict(set)
+    for shard, part in enumerate(parts):
+        for accession in part:
+            owners[accession].add(shard)
+    assert all(len(shard_ids) == 1 for shard_ids in owners.values())
+
+
+def test_run_starts_marks_each_accession_run():
+    accessions = pa.array(["a", "a", "b", "c", "c", "c"])
+
+    assert xbrl_importer._run_starts(accessions) == [0, 2, 3]
+    assert xbrl_importer._run_starts(pa.array(["a"])) == [0]
+
+
+def test_import_facts_writes_each_filing_from_one_thread(duckdb_database):
+    client = _RecordingClient()
+
+    stats = _importer(client, duckdb_database).import_facts(key_concepts_only=False)
+
+    assert stats == {"facts_imported": 4, "relationships_created": 4}
+    writers = defaultdict(set)
+    for query, params, thread in client.writes:
+        if query == xbrl_importer._BATCH_QUERY:
+            for accession in params["accession_number"]:
+                writers[accession].add(thread)
+    assert set(writers) == {"0001-24-000001", "0002-24-000002"}
+    assert all(len(threads) == 1 for threads in writers.values())
+
+
+def test_transient_batch_failure_retries_in_halves():
+    client = _RecordingClient()
+    client.failures = [TransientError("out of transaction memory")]
+    facts = list(_FACTS)
+
+    imported = _importer(client)._import_fact_batch(_columns(facts))
+
+    assert imported == 4
+    first, *halves = client.batch_writes()
+    assert len(first["accession_number"]) == 4
+    assert [params["concept_name"] for params in halves] == [
+        [fact[1] for fact in facts[:2]],
+        [fact[1] for fact in facts[2:]],
+    ]
+    # Each half's runs are found again from its own rows
+    assert [params["starts"] for params in halves] == [[0], [0]]
+    assert client.single_writes() == []
+
+
+def test_failed_half_falls_back_to_single_facts():
+    client = _RecordingClient()
+    client.failures = [TransientError("out of memory"), Neo4jError("deadlock")]
+
+    imported = _importer(client)._import_fact_batch(_columns(_FACTS))
+
+    assert imported == 4
+    assert len(client.batch_writes()) == 3
+    assert [params["concept_name"] for params in client.single_writes()] == [
+        fact[1] for fact in _FACTS[:2]
+    ]
+
+
+def test_non_transient_failure_imports_facts_singly_and_skips_bad_ones():
+    client = _RecordingClient()
+    client.failures = [Neo4jError("syntax error")]
+    client.fail_single = {"0001-24-000001"}
+
+    imported = _importer(client)._import_fact_batch(_columns(_FACTS))
+
+    assert imported == 4
+    assert len(client.batch_writes()) == 1
+    singles = client.single_writes()
+    assert [params["concept_name"] for params in singles] == [fact[1] for fact in _FACTS]
+    assert set(singles[0]) == set(xbrl_importer._FACT_COLUMNS)
+
+
+def test_bulk_import_exports_csv_and_loads_it_in_server_transactions(tmp_path, duckdb_database):
+    client = _RecordingClient(tmp_path)
+
+    stats = _importer(client, duckdb_database).import_facts_bulk(tmp_path, min_rows=1)
+
+    assert stats == {"facts_imported": 4, "relationships_created": 4}
+    header, *rows = client.loaded_rows
+    assert header == list(xbrl_importer._FACT_COLUMNS)
+    assert sorted(row[1] for row in rows) == sorted(fact[1] for fact in _FACTS)
+    assert ["0001-24-000001", "us-gaap:Assets", "900.0", "USD", "", "2023-12-31"] in rows
+
+    (query, parameters), = client.autocommits
+    assert parameters == {"url": "file:///xbrl_facts.csv"}
+    assert "LOAD CSV WITH HEADERS FROM $url AS row" in query
+    assert f"IN TRANSACTIONS OF {xbrl_importer._LOAD_CSV_TX_ROWS} ROWS" in query
+    assert "$rows" not in query
+    assert not (tmp_path / "xbrl_facts.csv").exists()
+
+
+def test_bulk_import_quotes_key_concepts_in_copy(tmp_path, duckdb_database, monkeypatch):
+    client = _RecordingClient(tmp_path)
+    importer = _importer(client, duckdb_database)
+    monkeypatch.setattr(importer, "KEY_CONCEPTS", ("us-gaap:Revenues", "o'brien:Assets"))
+
+    importer.import_facts_bulk(tmp_path, key_concepts_only=True, min_rows=1)
+
+    assert [row[1] for row in client.loaded_rows[1:]] == ["us-gaap:Revenues"]
+
+
+def test_bulk_import_below_threshold_uses_bolt_path(tmp_path, duckdb_database, monkeypatch):
+    client = _RecordingClient(tmp_path)
+    importer = _importer(client, duckdb_database)
+    calls = []
+    monkeypatch.setattr(
+        importer, "import_facts", lambda key_concepts_only: calls.append(key_concepts_only) or {}
+    )
+
+    importer.import_facts_bulk(tmp_path, min_rows=10)
+
+    assert calls == [False]
+    assert client.autocommits == []
+    assert not (tmp_path / "xbrl_facts.csv").exists()
+
+
+def test_sql_string_escapes_quotes():
+    assert xbrl_importer._sql_string("it's") == "'it''s'"